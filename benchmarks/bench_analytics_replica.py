@@ -0,0 +1,71 @@
+# benchmarks/bench_analytics_replica.py
+"""
+Analiz sorgularını disk veritabanında ve bellek içi analiz kopyasında karşılaştırır.
+
+Kullanım:
+    python -m benchmarks.bench_analytics_replica --rows 200000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import connection, replica
+from database.connection import configure_pool
+from database.repository import ActivityRepository
+from benchmarks.bench_sqlite_profiles import build_template, _timed
+
+
+def run_queries(repo, repeat):
+    """Stats / Compare / Trend / PDF sayfalarının sorguları (ms/çağrı)."""
+    return {
+        "stats tüm zamanlar": _timed(lambda i: repo.get_stats_by_type(ignore_dates=True), repeat),
+        "stats tür detayı (yıl)": _timed(lambda i: repo.get_details_for_type("Film", "2020", year_only=True), repeat),
+        "karşılaştırma (yıl)": _timed(lambda i: repo.get_comparison_data("2020"), repeat),
+        "dönem listesi": _timed(lambda i: repo.get_available_periods("month"), repeat),
+        "trend (yıl)": _timed(lambda i: repo.get_monthly_activity_counts(2020), repeat),
+        "trend ay detayı": _timed(lambda i: repo.get_activity_details_by_month("2020-06", "Film"), repeat),
+        "pdf (yıl)": _timed(lambda i: repo.get_detailed_data_for_pdf("2020"), max(1, repeat // 5)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="Sentetik faaliyet sayısı")
+    parser.add_argument("--repeat", type=int, default=20, help="Her sorgunun tekrar sayısı")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="faaliyet_bench_")
+    try:
+        db_path = os.path.join(work_dir, "bench.db")
+        print(f"Sentetik veritabanı oluşturuluyor: {args.rows} kayıt...")
+        build_template(db_path, args.rows)
+        configure_pool(db_path)
+        repo = ActivityRepository()  # migration'lar (özet tablo, FTS) burada kurulur
+
+        disk = run_queries(repo, args.repeat)
+
+        start = time.perf_counter()
+        replica.enable_replica()
+        refresh_ms = (time.perf_counter() - start) * 1000
+        memory = run_queries(repo, args.repeat)
+        stats = replica.get_replica_stats()
+
+        print(f"\nKopya doldurma (backup): {refresh_ms:.1f} ms, "
+              f"{stats['hits']} sorgu kopyadan, {stats['fallbacks']} diskten")
+        print(f"\n{'Sorgu (ms/çağrı)':<26}{'disk':>12}{'bellek':>12}{'hızlanma':>12}")
+        for name in disk:
+            speedup = disk[name] / memory[name] if memory[name] else float("inf")
+            print(f"{name:<26}{disk[name]:>12.3f}{memory[name]:>12.3f}{speedup:>11.1f}x")
+    finally:
+        replica.disable_replica()
+        connection.close_pool()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+# benchmarks/bench_recommendation_cache.py
+"""
+Öneri önbelleği yazma/okuma maliyetini eski ve yeni yöntemle karşılaştırır.
+
+Eski: öğe başına INSERT OR REPLACE (satır silinip yeniden eklenir), id sırasıyla
+okuma ve idx_cache_lookup(category, period, genre, is_turkish, page).
+Yeni: sayfadan düşenleri silme + executemany ile ON CONFLICT DO UPDATE (position
+güncellenir), position sırasıyla okuma ve
+idx_cache_page_rank(category, period, genre, is_turkish, page, position, fetched_at).
+
+Aynı sentetik veritabanının iki kopyası kullanılır; her kopya kendi yazma ve
+sayfa okuma yöntemiyle ölçülür (aynı Python yolu, yalnızca SQL / indeks / satır
+dönüşümü farklı). Yenileme, tablonun farklı yerlerindeki mevcut sayfalar
+üzerinde doğrudan bağlantıyla ölçülür: deyim süresi, commit dahil süre ve
+commit başına WAL'a yazılan sayfa sayısı. Repository üzerinden yazma süresine
+yazma kuyruğunun toplama penceresi de girer (iki yöntemde de baskın olan kısım).
+
+Kullanım:
+    python -m benchmarks.bench_recommendation_cache --rows 200000
+"""
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import connection
+from database.connection import configure_pool, get_connection
+from database.recommendation_repository import (
+    CachedRecommendation, RecommendationRepository, _UPSERT_SQL, _delete_dropped_sql,
+)
+from database.write_queue import run_write, shutdown_writer
+from logger_setup import logger
+from benchmarks.bench_sqlite_profiles import _timed
+from benchmarks.synthetic import build_database
+
+_LEGACY_SQL = '''
+    INSERT OR REPLACE INTO recommendation_cache
+    (category, period, genre, is_turkish, external_id, title,
+     description, rating, image_url, release_date, content_type,
+     page, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+# Değişiklik öncesi sayfa okuması (id sırası)
+_LEGACY_PAGE_SQL = '''
+    SELECT id, category, period, genre, is_turkish, external_id,
+           title, description, rating, image_url, release_date,
+           content_type, page, fetched_at
+    FROM recommendation_cache
+    WHERE category = ? AND period = ? AND genre = ?
+          AND is_turkish = ? AND page = ?
+          AND fetched_at > ?
+    ORDER BY id ASC
+'''
+
+
+def legacy_page(repo, key, page):
+    """Değişiklik öncesi get_cached_recommendations (id sırası); yeni metodla aynı Python yolu."""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        expiry_date = (datetime.now() - timedelta(days=repo.CACHE_EXPIRY_DAYS)).isoformat()
+        cursor.execute(_LEGACY_PAGE_SQL, key + (page, expiry_date))
+        rows = cursor.fetchall()
+        results = []
+        for row in rows:
+            rec = CachedRecommendation.from_row(row)
+            results.append(rec.to_display_dict())
+        logger.debug(f"Cache'den {len(results)} öneri çekildi. ({key[0]}/{key[1]}/{page})")
+        return results
+    finally:
+        conn.close()
+
+
+def new_page(repo, key, page):
+    category, period, genre, is_turkish = key
+    return repo.get_cached_recommendations(category, period, genre, bool(is_turkish), page=page)
+
+
+def legacy_add(repo, recommendations, category, period, page):
+    """Değişiklik öncesi add_recommendations: öğe başına INSERT OR REPLACE."""
+    fetched_at = datetime.now().isoformat()
+
+    def op(conn):
+        cursor = conn.cursor()
+        for item in recommendations:
+            cursor.execute(_LEGACY_SQL, (
+                category, period, 'all', 0, str(item['id']), item['title'], '',
+                item['rating'], '', '', category, page, fetched_at,
+            ))
+
+    run_write(op)
+
+
+def new_add(repo, recommendations, category, period, page):
+    repo.add_recommendations(recommendations, category, period, page=page)
+
+
+def existing_pages(db_path, count, seed=7, expired=None) -> list:
+    """Sentetik önbellekteki sayfalardan örnek: [(anahtar, sayfa, [external_id, ...]), ...].
+    Yenilenen sayfalar tablonun farklı yerlerindedir (gerçek kullanımdaki gibi).
+    expired verilirse yalnızca süresi dolmuş (True) / dolmamış (False) sayfalar."""
+    expiry_date = (datetime.now() - timedelta(days=RecommendationRepository.CACHE_EXPIRY_DAYS)).isoformat()
+    conn = sqlite3.connect(db_path)
+    try:
+        groups = conn.execute('''
+            SELECT category, period, genre, is_turkish, page, group_concat(external_id, char(31)),
+                   MAX(fetched_at) <= ?
+            FROM (SELECT * FROM recommendation_cache ORDER BY id)
+            GROUP BY category, period, genre, is_turkish, page
+        ''', (expiry_date,)).fetchall()
+    finally:
+        conn.close()
+    if expired is not None:
+        groups = [g for g in groups if bool(g[6]) == expired]
+    sample = random.Random(seed).sample(groups, min(count, len(groups)))
+    return [(tuple(g[:4]), g[4], g[5].split(chr(31))) for g in sample]
+
+
+def refreshed_rows(key, page, external_ids, fetched_at) -> list:
+    """Sayfanın yeni API sonucu: sıra ters döner, son öğe düşer, bir yeni öğe gelir."""
+    ids = [f"yeni-{page}-{key[0]}"] + external_ids[::-1][:-1]
+    return [key + (ext, f"Öneri {ext}", "", 8.0, "", "", key[0], page, pos, fetched_at)
+            for pos, ext in enumerate(ids)]
+
+
+def refresh_cost(db_path, legacy, pages=500) -> dict:
+    """Mevcut sayfaları yenileme maliyeti, doğrudan bağlantıda (kuyruk hariç):
+    deyim süresi (işlem geri alınarak), commit dahil süre ve commit başına WAL'a
+    yazılan sayfa sayısı (checkpoint kapalı)."""
+    targets = existing_pages(db_path, pages)
+    fetched_at = datetime.now().isoformat()
+    batches = [refreshed_rows(key, page, ids, fetched_at) for key, page, ids in targets]
+
+    def write(conn, rows):
+        if legacy:
+            for row in rows:
+                conn.execute(_LEGACY_SQL, row[:12] + row[13:])
+        else:
+            conn.execute(_delete_dropped_sql(len(rows)), rows[0][:4] + (rows[0][11],) + tuple(r[4] for r in rows))
+            conn.executemany(_UPSERT_SQL, rows)
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint = 0")
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        conn.execute("SELECT COUNT(*) FROM recommendation_cache").fetchone()   # sayfaları önbelleğe al
+
+        conn.execute("BEGIN")
+        start = time.perf_counter()
+        for rows in batches:
+            write(conn, rows)
+        statement_ms = (time.perf_counter() - start) * 1000 / len(batches)
+        conn.execute("ROLLBACK")
+
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        start = time.perf_counter()
+        for rows in batches:
+            conn.execute("BEGIN")
+            write(conn, rows)
+            conn.execute("COMMIT")
+        commit_ms = (time.perf_counter() - start) * 1000 / len(batches)
+        wal_pages = os.path.getsize(db_path + "-wal") / (page_size + 24) / len(batches)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+    return {
+        "yenileme: deyimler (ms/sayfa)": statement_ms,
+        "yenileme: commit dahil (ms/sayfa)": commit_ms,
+        "yenileme: WAL sayfası / commit": wal_pages,
+    }
+
+
+def make_legacy_copy(source, target):
+    shutil.copyfile(source, target)
+    conn = sqlite3.connect(target)
+    try:
+        conn.execute("DROP INDEX IF EXISTS idx_cache_page_rank")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_lookup "
+            "ON recommendation_cache(category, period, genre, is_turkish, page)"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run(db_path, add, read_page, repeat) -> dict:
+    configure_pool(db_path)
+    repo = RecommendationRepository()
+    # 50 sayfalık bir anahtar: ilk tur ekler, sonraki turlar aynı sayfaları yeniler
+    items = [[{'id': f"bench-{p}-{i}", 'title': f"Öneri {p}-{i}", 'rating': 7.5} for i in range(10)]
+             for p in range(50)]
+    # Okumalar sentetik önbellekteki sayfalar üzerinde; süresi dolmuş sayfalar ayrıca
+    reads = existing_pages(db_path, repeat, seed=11, expired=False)
+    expired = existing_pages(db_path, repeat, seed=11, expired=True)
+
+    def read(pages):
+        def step(i):
+            key, page, _ = pages[i % len(pages)]
+            return read_page(repo, key, page)
+        return step
+
+    def max_page(i):
+        (category, period, genre, is_turkish), _, _ = reads[i % len(reads)]
+        return repo.get_max_cached_page(category, period, genre, bool(is_turkish))
+
+    def valid(i):
+        (category, period, genre, is_turkish), page, _ = expired[i % len(expired)]
+        return repo.has_valid_cache(category, period, genre, bool(is_turkish), page=page)
+
+    results = {
+        "yazma: yeni sayfa (ms/10 öğe)": _timed(lambda i: add(repo, items[i % 50], "Film", "bench", i % 50 + 1), 50),
+        "yazma: sayfa yenileme (ms/10 öğe)": _timed(lambda i: add(repo, items[i % 50], "Film", "bench", i % 50 + 1), repeat),
+        "okuma: get_cached_recommendations": _timed(read(reads), repeat),
+        "okuma: süresi dolmuş sayfa": _timed(read(expired), repeat),
+        "okuma: get_max_cached_page": _timed(max_page, repeat),
+        "okuma: has_valid_cache (dolmuş)": _timed(valid, repeat),
+    }
+    connection.close_pool()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="Sentetik önbellek satırı sayısı")
+    parser.add_argument("--repeat", type=int, default=200, help="Her ölçümün tekrar sayısı")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="faaliyet_bench_")
+    try:
+        new_path = os.path.join(work_dir, "yeni.db")
+        legacy_path = os.path.join(work_dir, "eski.db")
+        print(f"Sentetik veritabanı oluşturuluyor: {args.rows} önbellek satırı...")
+        build_database(new_path, activities=1000, plans=0, cache_rows=args.rows, folders=1)
+        make_legacy_copy(new_path, legacy_path)
+
+        legacy = {**refresh_cost(legacy_path, legacy=True), **run(legacy_path, legacy_add, legacy_page, args.repeat)}
+        new = {**refresh_cost(new_path, legacy=False), **run(new_path, new_add, new_page, args.repeat)}
+
+        print(f"\n{'Ölçüm (ms/çağrı)':<40}{'eski':>10}{'yeni':>10}{'oran':>10}")
+        for name in legacy:
+            ratio = legacy[name] / new[name] if new[name] else float("inf")
+            print(f"{name:<40}{legacy[name]:>10.3f}{new[name]:>10.3f}{ratio:>9.1f}x")
+    finally:
+        shutdown_writer()
+        connection.close_pool()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# benchmarks/bench_repositories.py
+"""
+Repository benchmark paketi: ActivityRepository, PlanRepository, TypeRepository
+ve RecommendationRepository'nin tüm public metodlarını sentetik veritabanlarında ölçer.
+
+Her boyut için (varsayılan 10k / 100k / 1M faaliyet; plan ve önbellek satırı
+faaliyetlerin onda biri) geçici bir veritabanı kurulur. Sonuçlar JSON'a yazılır;
+--compare ile önceki bir çalıştırmayla (ör. başka bir commit) karşılaştırılır.
+
+Kullanım:
+    python -m benchmarks.bench_repositories
+    python -m benchmarks.bench_repositories --sizes 10000 100000 --repeat 5 --output sonuc.json
+    python -m benchmarks.bench_repositories --sizes 10000 --compare onceki.json
+"""
+import argparse
+import inspect
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import connection
+from database.connection import configure_pool, get_db
+from database.plan_repository import PlanRepository
+from database.recommendation_repository import RecommendationRepository
+from database.repository import ActivityRepository
+from database.type_repository import TypeRepository, invalidate_type_catalog
+from database.write_queue import shutdown_writer
+from models import Activity, ActivityFilter, Folder, Plan
+from benchmarks.synthetic import build_database
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+REPOSITORIES = (ActivityRepository, PlanRepository, TypeRepository, RecommendationRepository)
+
+
+def public_methods(cls) -> list:
+    """Sınıfta tanımlı, alt çizgiyle başlamayan metod isimleri."""
+    return sorted(
+        name for name, member in vars(cls).items()
+        if not name.startswith("_") and inspect.isfunction(member)
+    )
+
+
+def _consume(iterator):
+    return sum(1 for _ in iterator)
+
+
+def _max_id(table):
+    with get_db() as conn:
+        return conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0] or 0
+
+
+def build_cases(repos, repeat):
+    """(metod, varyant, func(i), tekrar) listesi. Yıkıcı işler her sınıfın sonunda;
+    silme ve yeniden adlandırma yalnızca benchmark'ın kendi eklediği kayıtlara yapılır."""
+    activity, plan, types, recs = repos
+    added = []   # add/add_many ile eklenen kayıtların ID'leri (update/delete için)
+    heavy = max(1, repeat // 5)
+
+    def add_activity(i):
+        activity.add(Activity(None, "Film", f"Bench {i}", "2024-05-01", "", 7))
+        added.append(_max_id("activities"))
+
+    last_seq = activity.get_last_change_seq()
+    sample = Plan(None, "Bench", "", "monthly", 2024, 5, "planned", 0, "low", "2024-05-01 00:00:00")
+    rec_items = [{"id": f"b{i}", "title": f"Öneri {i}", "rating": 7.5} for i in range(10)]
+    plan_ids, folder_ids = [], []
+
+    def add_plan(i):
+        plan.add_plan(sample)
+        plan_ids.append(_max_id("plans"))
+
+    def add_folder(i):
+        plan.add_folder(f"Bench {i}")
+        folder_ids.append(_max_id("folders"))
+
+    activity_cases = [
+        ("add", "", add_activity, repeat),
+        ("add_many", "100 kayıt", lambda i: activity.add_many(
+            [Activity(None, "Kitap", f"Toplu {i}-{k}", "2024-06-01", "", 5) for k in range(100)]), heavy),
+        ("update", "", lambda i: activity.update(
+            Activity(added[i % len(added)], "Film", f"Bench {i}*", "2024-05-02", "", 8)), repeat),
+        ("get_by_id", "", lambda i: activity.get_by_id(1 + i), repeat),
+        ("get_all_filtered", "sayfa 1", lambda i: activity.get_all_filtered(ActivityFilter()), repeat),
+        ("get_all_filtered", "tür", lambda i: activity.get_all_filtered(ActivityFilter(type_filter="Dizi")), repeat),
+        ("get_all_filtered", "ay", lambda i: activity.get_all_filtered(ActivityFilter(date_filter="2024-06")), repeat),
+        ("get_all_filtered", "yıl", lambda i: activity.get_all_filtered(ActivityFilter(date_filter="2020")), repeat),
+        ("get_all_filtered", "arama", lambda i: activity.get_all_filtered(ActivityFilter(search_term="Gece")), repeat),
+        ("get_all_filtered", "sayfa 50, OFFSET", lambda i: activity.get_all_filtered(ActivityFilter(page=50)), repeat),
+        ("count_filtered", "yıl", lambda i: activity.count_filtered(ActivityFilter(date_filter="2021")), repeat),
+        ("iter_filtered", "yıl", lambda i: _consume(activity.iter_filtered(ActivityFilter(date_filter="2019"))), heavy),
+        ("get_last_change_seq", "", lambda i: activity.get_last_change_seq(), repeat),
+        ("get_changes_since", "", lambda i: activity.get_changes_since(last_seq), repeat),
+        ("suggest_names", "önek", lambda i: activity.suggest_names(("Ka", "Ge", "Yo", "Se")[i % 4]), repeat),
+        ("suggest_names", "içinde", lambda i: activity.suggest_names(("ece", "eni", "ölg", "ıldı")[i % 4]), repeat),
+        ("get_stats_by_type", "yıl", lambda i: activity.get_stats_by_type("2020", year_only=True), repeat),
+        ("get_stats_by_type", "tüm zamanlar", lambda i: activity.get_stats_by_type(ignore_dates=True), repeat),
+        ("get_details_for_type", "ay", lambda i: activity.get_details_for_type("Film", "2024-06"), repeat),
+        ("get_comparison_data", "yıl", lambda i: activity.get_comparison_data("2020"), repeat),
+        ("get_available_periods", "ay", lambda i: activity.get_available_periods("month"), repeat),
+        ("get_detailed_data_for_pdf", "ay", lambda i: activity.get_detailed_data_for_pdf("2024-06"), repeat),
+        ("get_monthly_activity_counts", "", lambda i: activity.get_monthly_activity_counts(2020, "Film"), repeat),
+        ("get_activity_details_by_month", "", lambda i: activity.get_activity_details_by_month("2024-06", "Film"), repeat),
+        ("trim_change_log", "", lambda i: activity.trim_change_log(), repeat),
+        ("delete", "", lambda i: activity.delete(added.pop()) if added else None, repeat),
+        ("rebuild_monthly_agg", "", lambda i: activity.rebuild_monthly_agg(), 1),
+        ("rebuild_fts_index", "", lambda i: activity.rebuild_fts_index(), 1),
+        ("rebuild_interval_index", "", lambda i: activity.rebuild_interval_index(), 1),
+        ("rebuild_name_index", "", lambda i: activity.rebuild_name_index(), 1),
+    ]
+    plan_cases = [
+        ("get_folders", "", lambda i: plan.get_folders(), repeat),
+        ("add_folder", "", add_folder, repeat),
+        ("update_folder", "", lambda i: plan.update_folder(folder_ids[i % len(folder_ids)], f"Bench {i}*"), repeat),
+        ("add_folders", "10 klasör", lambda i: plan.add_folders([Folder(None, f"Toplu {i}-{k}", None) for k in range(10)]), heavy),
+        ("iter_folders", "", lambda i: _consume(plan.iter_folders()), heavy),
+        ("add_plan", "", add_plan, repeat),
+        ("add_plans", "100 plan", lambda i: plan.add_plans([sample] * 100), heavy),
+        ("update_plan", "", lambda i: plan.update_plan(
+            Plan(plan_ids[i % len(plan_ids)], "Bench*", "", "", 0, 0, "in_progress", 20, "high", "")), repeat),
+        ("update_plan_progress", "", lambda i: plan.update_plan_progress(plan_ids[i % len(plan_ids)], 50, "in_progress"), repeat),
+        ("get_plans", "aylık", lambda i: plan.get_plans("monthly", 2020, 6), repeat),
+        ("get_plans", "yıllık", lambda i: plan.get_plans("yearly", 2020), repeat),
+        ("iter_plans", "", lambda i: _consume(plan.iter_plans()), heavy),
+        ("delete_plan", "", lambda i: plan.delete_plan(plan_ids.pop()) if plan_ids else None, repeat),
+        ("delete_folder", "", lambda i: plan.delete_folder(folder_ids.pop()) if folder_ids else None, repeat),
+    ]
+    type_cases = [
+        ("get_all_types", "katalogdan", lambda i: types.get_all_types(), repeat),
+        ("get_all_types", "yeniden yükleme", lambda i: (invalidate_type_catalog(), types.get_all_types()), repeat),
+        ("get_type_usage", "", lambda i: types.get_type_usage(), repeat),
+        ("add_type", "", lambda i: types.add_type(f"Bench Tür {i}"), repeat),
+        ("update_type", "", lambda i: types.update_type(f"Bench Tür {i}", f"Bench Tür {i}*"), repeat),
+        ("update_type", "kullanılan tür, parçalı", lambda i: types.update_type(*(("Kurs", "Kurs*") if i % 2 == 0 else ("Kurs*", "Kurs"))), heavy),
+        ("resume_type_rename", "bekleyen iş yok", lambda i: types.resume_type_rename(), repeat),
+        ("delete_type", "", lambda i: types.delete_type(f"Bench Tür {i}*"), repeat),
+        ("get_setting", "", lambda i: types.get_setting("bench"), repeat),
+        ("set_setting", "", lambda i: types.set_setting("bench", str(i)), repeat),
+        ("normalize_activity_types", "", lambda i: types.normalize_activity_types(), heavy),
+        ("synchronize_types", "", lambda i: types.synchronize_types(), heavy),
+    ]
+    recommendation_cases = [
+        ("add_recommendations", "10 öneri", lambda i: recs.add_recommendations(rec_items, "Film", "bench", page=i + 1), repeat),
+        ("get_cached_recommendations", "", lambda i: recs.get_cached_recommendations("Film", "this_month", page=1 + i % 3), repeat),
+        ("get_max_cached_page", "", lambda i: recs.get_max_cached_page("Dizi", "must_see"), repeat),
+        ("iter_cached_pages", "tüm sayfalar", lambda i: _consume(recs.iter_cached_pages("Film", "this_month")), repeat),
+        ("has_valid_cache", "", lambda i: recs.has_valid_cache("Oyun", "all_time_best", page=1 + i % 3), repeat),
+        ("clear_expired_cache", "", lambda i: recs.clear_expired_cache(), 1),
+        ("clear_all_cache", "", lambda i: recs.clear_all_cache(), 1),
+    ]
+    return [
+        (cls.__name__, *case)
+        for cls, cases in zip(REPOSITORIES, (activity_cases, plan_cases, type_cases, recommendation_cases))
+        for case in cases
+    ]
+
+
+def run_size(size, work_dir, repeat, log=print):
+    """Bir veritabanı boyutunu kurup tüm metodları ölçer."""
+    db_path = os.path.join(work_dir, f"bench_{size}.db")
+    start = time.perf_counter()
+    build_database(db_path, size)
+    build_s = time.perf_counter() - start
+    log(f"[{size}] veritabanı {build_s:.1f} sn'de kuruldu")
+
+    configure_pool(db_path)
+    try:
+        repos = tuple(cls() for cls in REPOSITORIES)
+        results = {}
+        for class_name, method, variant, func, times in build_cases(repos, repeat):
+            samples = []
+            for i in range(times):
+                t0 = time.perf_counter()
+                func(i)
+                samples.append((time.perf_counter() - t0) * 1000)
+            label = f"{class_name}.{method}" + (f" ({variant})" if variant else "")
+            results[label] = {
+                "median_ms": round(statistics.median(samples), 4),
+                "min_ms": round(min(samples), 4),
+                "calls": times,
+            }
+    finally:
+        shutdown_writer()
+        connection.close_pool()
+        configure_pool()
+    return {"build_s": round(build_s, 2), "results": results}
+
+
+def uncovered_methods() -> list:
+    """build_cases'in ölçmediği public metodlar (yeni metod eklenince buraya eklenmeli)."""
+    covered = {(c, m) for c, m, *_ in build_cases((_NullRepo(),) * 4, 1)}
+    return [
+        f"{cls.__name__}.{name}" for cls in REPOSITORIES for name in public_methods(cls)
+        if (cls.__name__, name) not in covered
+    ]
+
+
+class _NullRepo:
+    """uncovered_methods için: build_cases'in kurulum çağrılarına sahte yanıt verir."""
+    def get_last_change_seq(self):
+        return 0
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(sizes, repeat, log=print):
+    work_dir = tempfile.mkdtemp(prefix="faaliyet_bench_")
+    try:
+        report = {
+            "meta": {
+                "commit": _git_commit(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+                "repeat": repeat,
+                "uncovered": uncovered_methods(),
+            },
+            "sizes": {},
+        }
+        for size in sizes:
+            report["sizes"][str(size)] = run_size(size, work_dir, repeat, log)
+        return report
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def compare(report, previous):
+    """İki raporun ortak ölçümleri için (boyut, ölçüm, önceki ms, şimdiki ms, oran) satırları."""
+    rows = []
+    for size, data in report["sizes"].items():
+        old = previous.get("sizes", {}).get(size, {}).get("results", {})
+        for label, result in data["results"].items():
+            if label in old:
+                before, after = old[label]["median_ms"], result["median_ms"]
+                rows.append((size, label, before, after, after / before if before else float("inf")))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Faaliyet sayıları")
+    parser.add_argument("--repeat", type=int, default=10, help="Metod başına çağrı sayısı")
+    parser.add_argument("--output", help="JSON çıktı dosyası (varsayılan: bench_repositories_<commit>.json)")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON çıktısı")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.repeat)
+    output = args.output or f"bench_repositories_{report['meta']['commit'] or 'local'}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for size, data in report["sizes"].items():
+        print(f"\n{size} faaliyet")
+        for label, result in data["results"].items():
+            print(f"  {label:<58}{result['median_ms']:>12.3f} ms")
+    if report["meta"]["uncovered"]:
+        print(f"\nUyarı: ölçülmeyen metodlar: {', '.join(report['meta']['uncovered'])}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        print(f"\nKarşılaştırma: {previous['meta'].get('commit')} -> {report['meta']['commit']}")
+        for size, label, before, after, ratio in compare(report, previous):
+            print(f"  [{size}] {label:<52}{before:>10.3f}{after:>10.3f} ms {ratio:>6.2f}x")
+    print(f"\nSonuçlar: {output}")
+
+
+if __name__ == "__main__":
+    main()
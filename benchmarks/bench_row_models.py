@@ -0,0 +1,145 @@
+# benchmarks/bench_row_models.py
+"""
+Satır -> model dönüşümünü karşılaştırır: eski yol (sqlite3.Row + from_row,
+__dict__'li nesne) ve yeni yol (model_cursor ile tuple'dan __slots__'lu nesne).
+
+get_all_filtered ve get_plans sorguları için 100 bin satır başına süre ve
+tepe bellek (tracemalloc) raporlanır.
+
+Kullanım:
+    python -m benchmarks.bench_row_models --rows 100000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import connection
+from database.connection import configure_pool, get_db, init_db, model_cursor
+from models import Activity, Plan
+from benchmarks.synthetic import populate_activities, populate_plans
+
+PER_ROWS = 100_000
+
+ACTIVITY_SQL = (
+    "SELECT id, type, name, date, comment, rating, end_date FROM activities "
+    "ORDER BY date DESC, id DESC LIMIT ?"
+)
+PLAN_SQL = (
+    "SELECT id, title, description, scope, year, month, status, progress, priority, created_at, folder_id "
+    "FROM plans WHERE scope=? AND year=?"
+)
+
+
+class _LegacyActivity:
+    """Önceki Activity: nesne başına __dict__, from_row her satırda row.keys() çağırır."""
+
+    def __init__(self, id, type, name, date, comment, rating, end_date=None):
+        self.id = id
+        self.type = type
+        self.name = name
+        self.date = date
+        self.end_date = end_date
+        self.comment = comment
+        self.rating = rating
+
+    @classmethod
+    def from_row(cls, row):
+        keys = row.keys() if hasattr(row, 'keys') else []
+        return cls(
+            id=row['id'], type=row['type'], name=row['name'], date=row['date'],
+            comment=row['comment'], rating=row['rating'],
+            end_date=row['end_date'] if 'end_date' in keys else None,
+        )
+
+
+# Önceki Plan: __slots__'suz dataclass
+_LegacyPlan = make_dataclass("_LegacyPlan", [f.name for f in fields(Plan)])
+
+
+def _legacy_plan(row):
+    return _LegacyPlan(
+        id=row['id'], title=row['title'], description=row['description'], scope=row['scope'],
+        year=row['year'], month=row['month'], status=row['status'], progress=row['progress'],
+        priority=row['priority'], created_at=row['created_at'],
+        folder_id=row['folder_id'] if 'folder_id' in row.keys() else None,
+    )
+
+
+def _plan_queries():
+    """Her (scope, yıl) için bir sorgu: toplamda tüm plan tablosu okunur."""
+    with get_db() as conn:
+        pairs = conn.execute("SELECT DISTINCT scope, year FROM plans").fetchall()
+    return [(PLAN_SQL, (scope, year)) for scope, year in pairs]
+
+
+def _measure(load, queries):
+    """load(conn, sql, params) -> liste. (satır sayısı, ms / 100k satır, tepe MB / 100k satır)"""
+    with get_db() as conn:
+        start = time.perf_counter()
+        rows = sum(len(load(conn, sql, params)) for sql, params in queries)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        # Bellek ölçümü ayrı turda: tracemalloc süreyi şişirir
+        tracemalloc.start()
+        peak = 0
+        for sql, params in queries:
+            tracemalloc.reset_peak()
+            result = load(conn, sql, params)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] / max(len(result), 1))
+            del result
+        tracemalloc.stop()
+    scale = PER_ROWS / max(rows, 1)
+    return rows, elapsed * scale, peak * PER_ROWS / 1024 / 1024
+
+
+def run(rows):
+    activity_queries = [(ACTIVITY_SQL, (rows,))]
+    plan_queries = _plan_queries()
+    return {
+        "get_all_filtered": {
+            "önce": _measure(lambda c, s, p: [_LegacyActivity.from_row(r) for r in c.execute(s, p).fetchall()],
+                             activity_queries),
+            "sonra": _measure(lambda c, s, p: model_cursor(c, Activity).execute(s, p).fetchall(), activity_queries),
+        },
+        "get_plans": {
+            "önce": _measure(lambda c, s, p: [_legacy_plan(r) for r in c.execute(s, p).fetchall()], plan_queries),
+            "sonra": _measure(lambda c, s, p: model_cursor(c, Plan).execute(s, p).fetchall(), plan_queries),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=PER_ROWS, help="Sentetik faaliyet ve plan sayısı")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="faaliyet_bench_")
+    try:
+        configure_pool(os.path.join(work_dir, "bench.db"))
+        init_db()  # şema migration'ları
+        print(f"Sentetik veritabanı oluşturuluyor: {args.rows} faaliyet, {args.rows} plan...")
+        with get_db() as conn:
+            populate_activities(conn, args.rows)
+            populate_plans(conn, args.rows)
+
+        results = run(args.rows)
+        print(f"\n{'Sorgu':<20}{'yol':<8}{'satır':>10}{'ms/100k':>12}{'MB/100k':>12}")
+        for name, paths in results.items():
+            for path, (count, ms, mb) in paths.items():
+                print(f"{name:<20}{path:<8}{count:>10}{ms:>12.1f}{mb:>12.1f}")
+            before, after = paths["önce"], paths["sonra"]
+            print(f"{'':<20}{'kazanç':<8}{'':>10}{before[1] / after[1]:>11.2f}x{before[2] / after[2]:>11.2f}x")
+    finally:
+        connection.close_pool()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_sqlite_profiles.py
+"""
+SQLite performans profillerini büyük sentetik bir veritabanında karşılaştırır.
+
+Kullanım:
+    python -m benchmarks.bench_sqlite_profiles --rows 200000
+"""
+import argparse
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import connection
+from database.connection import SQLITE_PROFILES, configure_pool
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+from benchmarks.synthetic import populate_activities
+
+
+def _timed(func, repeat):
+    start = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def build_template(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE activities (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT NOT NULL, name TEXT NOT NULL, date TEXT NOT NULL,
+            comment TEXT, rating INTEGER, end_date TEXT
+        )
+    ''')
+    populate_activities(conn, rows)
+    conn.close()
+
+
+def bench_profile(profile, template, work_dir, writes):
+    db_path = os.path.join(work_dir, f"{profile}.db")
+    shutil.copyfile(template, db_path)
+    configure_pool(db_path, profile=profile)
+    repo = ActivityRepository()
+
+    results = {}
+    results["add (ms/kayıt)"] = _timed(
+        lambda i: repo.add(Activity(None, "Film", f"Bench {i}", "2024-05-01", "", 7)), writes
+    )
+    results["stats tüm zamanlar (ms)"] = _timed(
+        lambda i: repo.get_stats_by_type(ignore_dates=True), 5
+    )
+    results["stats yıl (ms)"] = _timed(
+        lambda i: repo.get_stats_by_type("2020", year_only=True), 10
+    )
+    results["liste sayfa 1 (ms)"] = _timed(
+        lambda i: repo.get_all_filtered(ActivityFilter()), 20
+    )
+    results["liste arama (ms)"] = _timed(
+        lambda i: repo.get_all_filtered(ActivityFilter(search_term="Gece")), 10
+    )
+    connection.close_pool()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="Sentetik faaliyet sayısı")
+    parser.add_argument("--writes", type=int, default=300, help="Tek tek eklenecek kayıt sayısı")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="faaliyet_bench_")
+    try:
+        template = os.path.join(work_dir, "template.db")
+        print(f"Sentetik veritabanı oluşturuluyor: {args.rows} kayıt...")
+        build_template(template, args.rows)
+
+        all_results = {p: bench_profile(p, template, work_dir, args.writes) for p in SQLITE_PROFILES}
+
+        metrics = list(next(iter(all_results.values())))
+        print(f"\n{'Ölçüm':<28}" + "".join(f"{p:>14}" for p in all_results))
+        for metric in metrics:
+            print(f"{metric:<28}" + "".join(f"{all_results[p][metric]:>14.3f}" for p in all_results))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/bench_startup.py
+"""
+Uygulama açılışında veritabanı tarafında yapılan işleri ölçer.
+
+MainController.__init__'in Qt dışındaki adımları (havuz + şema kontrolü,
+repository'ler, değişiklik günlüğü, ilk tür listesi) sırayla ölçülür; günlüğün
+son seq'i uygulamada arka planda okunur, budama bakım zamanlayıcısındadır. Eskiden
+açılışta çalışan synchronize_types da karşılaştırma için ayrıca ölçülür; tür
+normalizasyonu artık yazma sırasında yapıldığından açılışta çalışmaz.
+
+Kullanım:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --sizes 10000 100000 --repeat 5
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import connection
+from database.connection import configure_pool
+from database.plan_repository import PlanRepository
+from database.repository import ActivityRepository
+from database.type_repository import TypeRepository, invalidate_type_catalog
+from database.write_queue import shutdown_writer
+from benchmarks.synthetic import build_database
+
+
+def measure_startup(db_path) -> dict:
+    """Tek bir açılışın adımları: {adım: ms}. Havuz her seferinde yeniden kurulur."""
+    timings = {}
+
+    def step(name, func):
+        start = time.perf_counter()
+        result = func()
+        timings[name] = (time.perf_counter() - start) * 1000
+        return result
+
+    invalidate_type_catalog()
+    step("havuz + şema kontrolü", lambda: configure_pool(db_path))
+    repository = step("ActivityRepository", ActivityRepository)
+    step("PlanRepository", PlanRepository)
+    types = step("TypeRepository", TypeRepository)
+    step("get_last_change_seq (arka planda)", repository.get_last_change_seq)
+    step("ilk tür listesi", types.get_all_types)
+    timings["toplam (açılış)"] = sum(timings.values())
+    return timings
+
+
+def measure_legacy_sync(db_path) -> float:
+    """Eski açılış işi: synchronize_types (tam tarama + normalizasyon), ms."""
+    configure_pool(db_path)
+    types = TypeRepository()
+    start = time.perf_counter()
+    types.synchronize_types()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(size, repeat, work_dir) -> dict:
+    db_path = os.path.join(work_dir, f"startup_{size}.db")
+    print(f"Sentetik veritabanı oluşturuluyor: {size} faaliyet...")
+    build_database(db_path, size)
+    configure_pool(db_path)
+    ActivityRepository()    # migration'lar burada; ölçüm güncel şemada yapılır
+
+    runs = [measure_startup(db_path) for _ in range(repeat)]
+    results = {name: statistics.median(r[name] for r in runs) for name in runs[0]}
+    results["synchronize_types (eski, artık çalışmıyor)"] = statistics.median(
+        measure_legacy_sync(db_path) for _ in range(repeat)
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="Faaliyet sayıları")
+    parser.add_argument("--repeat", type=int, default=5, help="Her boyut için açılış sayısı (medyan)")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="faaliyet_bench_")
+    try:
+        for size in args.sizes:
+            results = run(size, args.repeat, work_dir)
+            print(f"\n{'Adım (ms, medyan)':<44}{size:>12}")
+            for name, ms in results.items():
+                print(f"{name:<44}{ms:>12.2f}")
+    finally:
+        shutdown_writer()
+        connection.close_pool()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# benchmarks/synthetic.py
+"""
+Benchmark'lar için sentetik veri üretimi.
+Gerçekçi tür ve tarih dağılımıyla geçici veritabanlarını doldurur.
+"""
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+
+from constants import FAALIYET_TURLERI
+from database.migrations import migrate
+from services.recommendation_config import PERIOD_ORDER
+
+# Gerçek kullanımdaki ağırlıklar: film/dizi baskın, şehir/kurs seyrek
+TYPE_WEIGHTS = {"Film": 35, "Dizi": 25, "Kitap": 15, "Oyun": 15, "Kurs": 6, "Şehir": 4}
+
+_WORDS = [
+    "Gece", "Yol", "Deniz", "Kayıp", "Son", "Kırmızı", "Sessiz", "Büyük", "Eski", "Yeni",
+    "Şehir", "Işık", "Gölge", "Rüya", "Zaman", "Ateş", "Kar", "Rüzgar", "Ay", "Yıldız",
+]
+
+
+def _random_name(rng):
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3))) + f" {rng.randint(1, 500)}"
+
+
+def generate_activities(count, seed=42, start_year=2005, end_year=2025):
+    """(type, name, date, comment, rating, end_date) tuple'ları üretir (generator)."""
+    rng = random.Random(seed)
+    types = list(TYPE_WEIGHTS) + [t for t in FAALIYET_TURLERI if t not in TYPE_WEIGHTS]
+    weights = [TYPE_WEIGHTS.get(t, 1) for t in types]
+    first = date(start_year, 1, 1)
+    span = (date(end_year, 12, 31) - first).days
+
+    # Son yıllara daha fazla kayıt düşsün (geçmiş seyrek, yakın dönem yoğun)
+    for _ in range(count):
+        day = first + timedelta(days=int(span * rng.random() ** 0.6))
+        a_type = rng.choices(types, weights)[0]
+        end = None
+        if a_type == "Dizi" and rng.random() < 0.5:
+            end = (day + timedelta(days=rng.randint(7, 180))).isoformat()
+        rating = rng.randint(1, 10) if rng.random() < 0.8 else 0
+        comment = "" if rng.random() < 0.6 else _random_name(rng)
+        yield (a_type, _random_name(rng), day.isoformat(), comment, rating, end)
+
+
+def populate_activities(conn, count, seed=42, chunk_size=10000):
+    """activities tablosunu `count` satırla doldurur."""
+    sql = "INSERT INTO activities (type, name, date, comment, rating, end_date) VALUES (?, ?, ?, ?, ?, ?)"
+    rows = generate_activities(count, seed)
+    while True:
+        chunk = [row for _, row in zip(range(chunk_size), rows)]
+        if not chunk:
+            break
+        conn.executemany(sql, chunk)
+        conn.commit()
+
+
+def generate_plans(count, seed=42, start_year=2015, end_year=2025):
+    """plans tablosu kolon sırasıyla (title, description, scope, year, month,
+    status, progress, priority, created_at) tuple'ları üretir (generator)."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        year = rng.randint(start_year, end_year)
+        monthly = rng.random() < 0.7
+        status = rng.choice(("planned", "in_progress", "completed", "archived"))
+        progress = 100 if status == "completed" else rng.randint(0, 90)
+        yield (
+            _random_name(rng), "" if rng.random() < 0.5 else _random_name(rng),
+            "monthly" if monthly else "yearly", year, rng.randint(1, 12) if monthly else None,
+            status, progress, rng.choice(("low", "medium", "high")), f"{year}-01-01 00:00:00",
+        )
+
+
+def populate_plans(conn, count, seed=42, chunk_size=10000):
+    """plans tablosunu `count` satırla doldurur (tablo migration ile kurulmuş olmalı)."""
+    sql = (
+        "INSERT INTO plans (title, description, scope, year, month, status, progress, priority, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    rows = generate_plans(count, seed)
+    while True:
+        chunk = [row for _, row in zip(range(chunk_size), rows)]
+        if not chunk:
+            break
+        conn.executemany(sql, chunk)
+        conn.commit()
+
+
+# Öneri önbelleği: kategori başına ağırlık ve süresi dolmuş satır oranı
+CACHE_CATEGORIES = {"Film": 40, "Dizi": 30, "Oyun": 20, "Kitap": 10}
+CACHE_ITEMS_PER_PAGE = 10
+CACHE_EXPIRED_RATIO = 0.2
+
+
+def generate_recommendations(count, seed=42, now=None):
+    """recommendation_cache kolon sırasıyla (category, period, genre, is_turkish,
+    external_id, title, description, rating, image_url, release_date,
+    content_type, page, position, fetched_at) tuple'ları üretir.
+
+    Satırlar sayfa sayfa (10'ar) üretilir; sayfaların bir kısmı 7 günden eski
+    (süresi dolmuş) olur."""
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    categories, weights = list(CACHE_CATEGORIES), list(CACHE_CATEGORIES.values())
+    pages = {}
+    produced = 0
+    while produced < count:
+        key = (rng.choices(categories, weights)[0], rng.choice(PERIOD_ORDER),
+               rng.choice(("all", "all", "18", "28", "35")), int(rng.random() < 0.2))
+        pages[key] = page = pages.get(key, 0) + 1
+        age = timedelta(days=rng.randint(8, 30) if rng.random() < CACHE_EXPIRED_RATIO else rng.randint(0, 6))
+        fetched_at = (now - age).isoformat()
+        for i in range(min(CACHE_ITEMS_PER_PAGE, count - produced)):
+            produced += 1
+            yield key + (
+                f"{key[0]}-{produced}", _random_name(rng), "" if rng.random() < 0.3 else _random_name(rng),
+                round(rng.uniform(5, 9.5), 1), "", f"{rng.randint(1980, 2025)}-01-01", key[0], page, i, fetched_at,
+            )
+
+
+def populate_recommendations(conn, count, seed=42, chunk_size=10000):
+    """recommendation_cache tablosunu `count` satırla doldurur."""
+    sql = (
+        "INSERT OR IGNORE INTO recommendation_cache (category, period, genre, is_turkish, external_id, title, "
+        "description, rating, image_url, release_date, content_type, page, position, fetched_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    rows = generate_recommendations(count, seed)
+    while True:
+        chunk = [row for _, row in zip(range(chunk_size), rows)]
+        if not chunk:
+            break
+        conn.executemany(sql, chunk)
+        conn.commit()
+
+
+def build_database(path, activities, plans=None, cache_rows=None, folders=None, seed=42):
+    """Güncel şemada, sentetik veriyle dolu bir veritabanı dosyası oluşturur.
+
+    Faaliyetler migration'lardan önce yalın tabloya yazılır; FTS, özet tablosu
+    ve aralık indeksi migration sırasında toplu olarak kurulur (satır başına
+    trigger maliyeti olmadan). plans / cache_rows verilmezse faaliyet
+    sayısının onda biri, folders verilmezse plan sayısının yüzde biri kullanılır.
+    """
+    plans = activities // 10 if plans is None else plans
+    cache_rows = activities // 10 if cache_rows is None else cache_rows
+    folders = max(1, plans // 100) if folders is None else folders
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute('''
+            CREATE TABLE activities (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                type TEXT NOT NULL, name TEXT NOT NULL, date TEXT NOT NULL,
+                comment TEXT, rating INTEGER, end_date TEXT
+            )
+        ''')
+        populate_activities(conn, activities, seed)
+        migrate(conn)
+
+        rng = random.Random(seed)
+        conn.executemany(
+            "INSERT INTO folders (name, created_at) VALUES (?, '2024-01-01 00:00:00')",
+            [(_random_name(rng),) for _ in range(folders)],
+        )
+        populate_plans(conn, plans, seed)
+        # Planların üçte biri bir klasörde
+        conn.execute("UPDATE plans SET folder_id = 1 + (id % ?) WHERE id % 3 = 0", (folders,))
+        populate_recommendations(conn, cache_rows, seed)
+        conn.commit()
+    finally:
+        conn.close()
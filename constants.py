@@ -12,16 +12,30 @@ LIST_PAGE_FILTRE_SECENEKLERI = ["Hepsi"] + FAALIYET_TURLERI
 # ComparePage için sabit sıralama
 COMPARE_PAGE_DATA_ORDER = ["DIZI", "FILM", "KITAP", "KURS", "OYUN", "ŞEHIR"]
 
+# Plan alanlarının geçerli değerleri
+PLAN_SCOPES = ("monthly", "yearly")
+PLAN_STATUSES = ("planned", "in_progress", "completed", "archived")
+PLAN_PRIORITIES = ("low", "medium", "high")
+
 # --- Konfigürasyon ve Sabitler ---
 APP_NAME = "FaaliyetTakip"
 DB_FILENAME = "faaliyetler.db"
 LOG_FILENAME = "app.log"
+SLOW_QUERY_LOG_FILENAME = "slow_queries.log"
 THEME_NAME = "Fusion"
 
 # Dizin Adları
 DATA_DIR_NAME = "FaaliyetTakip"
+BACKUP_DIR_NAME = "backups"
 
 # Keyring sabitleri — tek kaynak, tüm kontrolcüler buradan import eder
 KEYRING_APP_NAME = APP_NAME
 KEYRING_KEY_TMDB = "tmdb_api_key"
 KEYRING_KEY_RAWG = "rawg_api_key"
+
+# settings tablosu anahtarları
+SETTING_DB_PROFILE = "db_profile"
+SETTING_ANALYTICS_REPLICA = "analytics_replica"   # "1" / "0"
+SETTING_QUERY_TRACING = "query_tracing"           # "1" / "0"
+SETTING_MAINTENANCE_PREFIX = "maintenance_last_run."   # + iş adı, epoch sn
+SETTING_TYPE_RENAME_JOB = "type_rename_job"          # yarıda kalan tür yeniden adlandırma (JSON)
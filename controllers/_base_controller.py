@@ -1,5 +1,5 @@
 # controllers/_base_controller.py
-from controllers.workers import DbWorker
+from controllers.workers import DbWorker, ProgressWorker, StreamWorker
 
 
 class _BaseController:
@@ -15,6 +15,30 @@ class _BaseController:
         self.workers.add(worker)
         worker.start()
 
+    def _run_async_with_progress(self, func, callback, progress_callback, *args, **kwargs):
+        """Uzun işler için: func'a progress/is_cancelled geçirilir, timeout uygulanmaz."""
+        worker = ProgressWorker(func, *args, **kwargs)
+        if progress_callback:
+            worker.progress.connect(progress_callback)
+        if callback:
+            worker.finished.connect(callback)
+        worker.finished.connect(lambda: self._cleanup_worker(worker))
+        self.workers.add(worker)
+        worker.start()
+        return worker
+
+    def _run_async_stream(self, func, chunk_callback, callback, *args, **kwargs):
+        """Parça parça sonuç üreten işler için: func'ın ürettiği her parça
+        chunk_callback'e, toplam öğe sayısı callback'e iletilir."""
+        worker = StreamWorker(func, *args, **kwargs)
+        worker.chunk.connect(chunk_callback)
+        if callback:
+            worker.finished.connect(callback)
+        worker.finished.connect(lambda: self._cleanup_worker(worker))
+        self.workers.add(worker)
+        worker.start()
+        return worker
+
     def _cleanup_worker(self, worker):
         self.workers.discard(worker)
 
@@ -1,7 +1,8 @@
 # controllers/activity_controller.py
-from datetime import datetime
 from models import Activity, ActivityFilter
 from controllers._base_controller import _BaseController
+from exceptions import ValidationError
+from utils import build_activity
 from logger_setup import logger
 
 
@@ -10,55 +11,32 @@ class ActivityController(_BaseController):
         super().__init__()
         self.repository = repository
 
-    def get_all_activities(self, callback, type_filter="Hepsi", search_term="", date_filter="", page=1, items_per_page=15):
+    def get_all_activities(self, callback, type_filter="Hepsi", search_term="", date_filter="", page=1, items_per_page=15, cursor=None):
         filter_obj = ActivityFilter(
             type_filter=type_filter,
             search_term=search_term,
             date_filter=date_filter,
             page=page,
             items_per_page=items_per_page,
+            cursor=cursor,
         )
         self._run_async(self.repository.get_all_filtered, callback, filter_obj)
 
-    def get_all_activity_names(self, callback):
-        self._run_async(self.repository.get_unique_names, callback)
+    def suggest_activity_names(self, query, callback, limit=None):
+        """AddPage otomatik tamamlaması: query ile başlayan / içinde geçen ilk N isim."""
+        limit = limit or self.repository.NAME_SUGGESTION_LIMIT
+        self._run_async(self.repository.suggest_names, callback, query, limit)
 
     def get_activity(self, activity_id, callback):
         self._run_async(self.repository.get_by_id, callback, activity_id)
 
     def add_activity(self, type_val, name, date_val, comment, rating_val, callback, end_date=None):
-        if not name or not name.strip():
-            callback((False, "Faaliyet adı boş bırakılamaz."))
-            return
-        if not date_val:
-            callback((False, "Tarih seçimi zorunludur."))
-            return
-        try:
-            if len(date_val.split('-')) == 2:
-                year, month = map(int, date_val.split('-'))
-                selected_date = datetime(year, month, 1)
-            else:
-                selected_date = datetime.strptime(date_val, "%Y-%m-%d")
-        except ValueError:
-            callback((False, "Tarih formatı geçersiz."))
-            return
-        if end_date:
-            try:
-                dt_end = datetime.strptime(end_date, "%Y-%m-%d")
-                if dt_end < selected_date:
-                    callback((False, "Bitiş tarihi, başlangıç tarihinden önce olamaz."))
-                    return
-            except ValueError:
-                callback((False, "Bitiş tarihi formatı geçersiz."))
-                return
         try:
-            rating = int(rating_val) if rating_val and rating_val != "Seçiniz" else 0
-        except ValueError:
-            callback((False, "Geçersiz puan değeri."))
+            new_activity = build_activity(type_val, name, date_val, comment, rating_val, end_date)
+        except ValidationError as e:
+            callback((False, str(e)))
             return
 
-        new_activity = Activity(None, type_val, name.strip(), date_val, comment.strip(), rating, end_date)
-
         def save_operation():
             success = self.repository.add(new_activity)
             if success:
@@ -110,6 +88,15 @@ class ActivityController(_BaseController):
             return False, "Silme işlemi başarısız oldu."
         self._run_async(delete_operation, callback)
 
+    def get_last_change_seq(self, callback):
+        """Değişiklik günlüğünün son sıra numarasını getirir (açılışta başlangıç noktası)."""
+        self._run_async(self.repository.get_last_change_seq, callback, timeout_ms=0)
+
+    def get_changes_since(self, seq, callback):
+        """Değişiklik günlüğünden seq sonrası deltaları getirir (ChangeSet)."""
+        # Sonuç kaybolursa MainController yeni deltaları bekler: timeout yok
+        self._run_async(self.repository.get_changes_since, callback, seq, timeout_ms=0)
+
     def get_dashboard_stats(self, callback, date_prefix="", year_only=False, ignore_dates=False):
         self._run_async(self.repository.get_stats_by_type, callback, date_prefix, year_only, ignore_dates)
 
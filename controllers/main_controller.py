@@ -2,18 +2,22 @@
 """
 Facade controller — view kodu değişmeden domain controller'lara delege eder.
 """
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from database.repository import ActivityRepository
 from database.plan_repository import PlanRepository
 from database.type_repository import TypeRepository
+from database.backup import BACKUP_INTERVAL_MIN
+from database.maintenance import MAINTENANCE_TICK_MIN
 from controllers.activity_controller import ActivityController
 from controllers.type_controller import TypeController
 from controllers.plan_controller import PlanController
 from controllers.settings_controller import SettingsController
+from controllers.transfer_controller import TransferController
 
 
 class MainController(QObject):
     activity_changed = pyqtSignal()
+    activities_delta = pyqtSignal(object)  # ChangeSet — activity_changed sonrası değişen kayıtlar
     plan_changed = pyqtSignal()
 
     def __init__(self, parent=None):
@@ -26,8 +30,36 @@ class MainController(QObject):
         self._type = TypeController(type_repo)
         self._plan = PlanController(plan_repo)
         self._settings = SettingsController(type_repo)
-
-        self._type.synchronize_types()
+        self._transfer = TransferController(repository, plan_repo)
+
+        # Değişiklik günlüğü: açılıştan sonraki yazmalar delta olarak yayınlanır. Başlangıç
+        # seq'i arka planda okunur; okuma bitene kadar gelen yazmalar sonraki okumaya kalır.
+        # Günlük budama bakım zamanlayıcısındadır (change_log_trim), açılışta yapılmaz.
+        self._change_seq = 0
+        self._change_fetch_running = True
+        self._change_fetch_again = False
+        self.activity_changed.connect(self._publish_changes)
+        self._activity.get_last_change_seq(self._on_change_seq_loaded)
+
+        self._settings.apply_saved_db_profile()
+        self._settings.apply_saved_analytics_replica()
+        self._settings.apply_saved_query_tracing()
+        self.activity_changed.connect(self._settings.refresh_analytics_replica)
+
+        # Arka plan yedeği: son yedekten beri değişiklik yoksa iş yapılmaz
+        self._backup_timer = QTimer(self)
+        self._backup_timer.setInterval(BACKUP_INTERVAL_MIN * 60 * 1000)
+        self._backup_timer.timeout.connect(lambda: self._settings.run_backup())
+        self._backup_timer.start()
+
+        # Boşta bakım: PRAGMA optimize, ANALYZE, incremental vacuum, önbellek temizliği
+        self._maintenance_timer = QTimer(self)
+        self._maintenance_timer.setInterval(MAINTENANCE_TICK_MIN * 60 * 1000)
+        self._maintenance_timer.timeout.connect(self._settings.run_idle_maintenance)
+        self._maintenance_timer.start()
+        # Tür normalizasyonu yazma sırasında yapılır (resolve_type): açılışta tür taraması yok.
+        # Yalnızca yarıda kalmış bir yeniden adlandırma varsa arka planda sürdürülür.
+        self._type.resume_type_rename(self._after_type_rename(None))
 
     def _emit_activity_changed(self, callback):
         """Callback'i sinyalle sarmalar: başarı durumunda activity_changed yayar."""
@@ -38,6 +70,16 @@ class MainController(QObject):
                 self.activity_changed.emit()
         return wrapped
 
+    def _after_type_rename(self, callback):
+        """Yeniden adlandırma durdurulsa da bazı parçalar yazılmış olabilir: sonuç ne olursa olsun
+        activity_changed yayılır (değişiklikler günlükten delta olarak okunur)."""
+        def wrapped(result):
+            if callback:
+                callback(result)
+            if isinstance(result, tuple):
+                self.activity_changed.emit()
+        return wrapped
+
     def _emit_plan_changed(self, callback):
         """Callback'i sinyalle sarmalar: başarı durumunda plan_changed yayar."""
         def wrapped(result):
@@ -47,13 +89,39 @@ class MainController(QObject):
                 self.plan_changed.emit()
         return wrapped
 
+    def _publish_changes(self):
+        """Son görülen seq'ten sonraki değişiklikleri okuyup activities_delta yayar.
+        Aynı anda tek okuma yapılır; bu sırada gelen yazmalar sonraki okumaya kalır."""
+        if self._change_fetch_running:
+            self._change_fetch_again = True
+            return
+        self._change_fetch_running = True
+        self._activity.get_changes_since(self._change_seq, self._on_changes_loaded)
+
+    def _on_change_seq_loaded(self, seq):
+        self._change_fetch_running = False
+        self._change_seq = seq or 0
+        if self._change_fetch_again:
+            self._change_fetch_again = False
+            self._publish_changes()
+
+    def _on_changes_loaded(self, changeset):
+        self._change_fetch_running = False
+        if changeset is not None:
+            self._change_seq = changeset.last_seq
+            if changeset.changes or changeset.truncated:
+                self.activities_delta.emit(changeset)
+        if self._change_fetch_again:
+            self._change_fetch_again = False
+            self._publish_changes()
+
     # --- Faaliyet ---
 
-    def get_all_activities(self, callback, type_filter="Hepsi", search_term="", date_filter="", page=1, items_per_page=15):
-        return self._activity.get_all_activities(callback, type_filter, search_term, date_filter, page, items_per_page)
+    def get_all_activities(self, callback, type_filter="Hepsi", search_term="", date_filter="", page=1, items_per_page=15, cursor=None):
+        return self._activity.get_all_activities(callback, type_filter, search_term, date_filter, page, items_per_page, cursor)
 
-    def get_all_activity_names(self, callback):
-        return self._activity.get_all_activity_names(callback)
+    def suggest_activity_names(self, query, callback, limit=None):
+        return self._activity.suggest_activity_names(query, callback, limit)
 
     def get_activity(self, activity_id, callback):
         return self._activity.get_activity(activity_id, callback)
@@ -93,11 +161,15 @@ class MainController(QObject):
     def get_all_activity_types(self, callback):
         return self._type.get_all_activity_types(callback)
 
+    def get_activity_type_usage(self, callback):
+        return self._type.get_activity_type_usage(callback)
+
     def add_activity_type(self, name, callback):
         return self._type.add_activity_type(name, callback)
 
-    def update_activity_type(self, old_name, new_name, callback):
-        return self._type.update_activity_type(old_name, new_name, callback)
+    def update_activity_type(self, old_name, new_name, callback, progress_callback=None):
+        # Yeniden adlandırma kayıtların türünü değiştirir: deltalar yayınlanır
+        return self._type.update_activity_type(old_name, new_name, self._after_type_rename(callback), progress_callback)
 
     def delete_activity_type(self, name, callback):
         return self._type.delete_activity_type(name, callback)
@@ -136,6 +208,32 @@ class MainController(QObject):
     def delete_folder(self, folder_id, callback):
         return self._plan.delete_folder(folder_id, self._emit_plan_changed(callback))
 
+    # --- Veri Aktarımı (CSV / JSONL) ---
+
+    def _after_import(self, callback, plans_changed=False):
+        """İçe aktarma sonucu: başarıda değişiklik sinyallerini yayar.
+        Yeni türler add_many sırasında kaydedilir."""
+        def wrapped(result):
+            if callback:
+                callback(result)
+            if isinstance(result, tuple) and result[0]:
+                self.activity_changed.emit()
+                if plans_changed:
+                    self.plan_changed.emit()
+        return wrapped
+
+    def import_activities(self, file_path, callback, progress_callback=None):
+        return self._transfer.import_activities(file_path, self._after_import(callback), progress_callback)
+
+    def import_database(self, directory, callback, progress_callback=None):
+        return self._transfer.import_database(directory, self._after_import(callback, plans_changed=True), progress_callback)
+
+    def export_activities(self, file_path, callback, progress_callback=None, type_filter="Hepsi", search_term="", date_filter=""):
+        return self._transfer.export_activities(file_path, callback, progress_callback, type_filter, search_term, date_filter)
+
+    def export_database(self, directory, callback, progress_callback=None, fmt="jsonl"):
+        return self._transfer.export_database(directory, callback, progress_callback, fmt)
+
     # --- API Anahtarları ---
 
     def get_api_keys(self, callback):
@@ -143,3 +241,37 @@ class MainController(QObject):
 
     def save_api_keys(self, tmdb_key, rawg_key, callback):
         return self._settings.save_api_keys(tmdb_key, rawg_key, callback)
+
+    # --- Veritabanı Profili ---
+
+    def get_db_profiles(self):
+        return self._settings.get_db_profiles()
+
+    def save_db_profile(self, profile_name, callback):
+        return self._settings.save_db_profile(profile_name, callback)
+
+    def is_analytics_replica_enabled(self):
+        return self._settings.is_analytics_replica_enabled()
+
+    def save_analytics_replica(self, enabled, callback):
+        return self._settings.save_analytics_replica(enabled, callback)
+
+    def is_query_tracing_enabled(self):
+        return self._settings.is_query_tracing_enabled()
+
+    def save_query_tracing(self, enabled, callback):
+        return self._settings.save_query_tracing(enabled, callback)
+
+    def get_query_trace_summary(self, limit=None):
+        return self._settings.get_query_trace_summary(limit)
+
+    def reset_query_trace(self):
+        return self._settings.reset_query_trace()
+
+    # --- Yedekleme ---
+
+    def backup_now(self, callback):
+        return self._settings.backup_now(callback)
+
+    def get_backups(self, callback):
+        return self._settings.get_backups(callback)
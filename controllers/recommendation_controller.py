@@ -23,10 +23,7 @@ class RecommendationController(_BaseController):
         super().__init__()
         self.api_service = ApiService()
         self.cache_repo = RecommendationRepository()
-        self._cleanup_old_cache()
-
-    def _cleanup_old_cache(self):
-        self._run_async(self.cache_repo.clear_expired_cache, None)
+        # Süresi dolmuş önbellek bakım zamanlayıcısında temizlenir (database/maintenance.py)
 
     # =========================================================================
     # PERİYOT YÖNETİMİ
@@ -115,20 +112,20 @@ class RecommendationController(_BaseController):
         self.get_recommendations(callback, category, period, genre, current_page + 1, is_turkish)
 
     def get_previous_data(self, callback, category, period, genre=None,
-                          is_turkish=False, max_page=None):
+                          is_turkish=False, max_page=None, chunk_callback=None):
+        """Önbellekteki tüm geçerli sayfaları tek sıralı sorguyla okur.
+
+        chunk_callback verilirse sonuçlar parça parça ona iletilir ve callback
+        toplam öğe sayısıyla çağrılır; verilmezse callback tüm listeyi alır.
+        """
         genre_key = str(genre) if genre else 'all'
+        args = (category, period, genre_key, is_turkish, max_page)
+
+        if chunk_callback:
+            return self._run_async_stream(self.cache_repo.iter_cached_pages, chunk_callback, callback, *args)
 
         def task():
-            cached_max = max_page if max_page is not None else \
-                self.cache_repo.get_max_cached_page(category, period, genre_key, is_turkish)
-            all_results = []
-            for page in range(1, cached_max + 1):
-                all_results.extend(
-                    self.cache_repo.get_cached_recommendations(
-                        category, period, genre_key, is_turkish, page
-                    )
-                )
-            return all_results
+            return [item for part in self.cache_repo.iter_cached_pages(*args) for item in part]
 
         self._run_async(task, callback)
 
@@ -1,13 +1,22 @@
 # controllers/settings_controller.py
+import os
 from controllers._base_controller import _BaseController
 from logger_setup import logger
-from constants import KEYRING_APP_NAME, KEYRING_KEY_TMDB, KEYRING_KEY_RAWG
+from constants import KEYRING_APP_NAME, KEYRING_KEY_TMDB, KEYRING_KEY_RAWG, SETTING_DB_PROFILE, SETTING_ANALYTICS_REPLICA, SETTING_QUERY_TRACING
+from database.connection import (SQLITE_PROFILES, DEFAULT_PROFILE, set_db_profile, get_db_profile, get_write_generation,
+                                 enable_query_tracing, disable_query_tracing, is_query_tracing_enabled,
+                                 get_query_trace_summary, reset_query_trace)
+from database.replica import enable_replica, disable_replica, refresh_replica, is_replica_enabled
+from database.backup import run_backup, list_backups
+from database.maintenance import run_maintenance
 
 
 class SettingsController(_BaseController):
     def __init__(self, type_repo):
         super().__init__()
         self.type_repo = type_repo
+        self._maintenance_running = False
+        self._idle_generation = get_write_generation()
 
     def get_api_keys(self, callback):
         def op():
@@ -40,3 +49,124 @@ class SettingsController(_BaseController):
                 logger.error(f"API key kayıt hatası: {e}")
                 return False, "Kayıt sırasında hata oluştu."
         self._run_async(op, callback)
+
+    # --- Veritabanı Profili ---
+
+    def apply_saved_db_profile(self):
+        """Kayıtlı SQLite profilini uygular (başlangıçta senkron çağrılır)."""
+        name = self.type_repo.get_setting(SETTING_DB_PROFILE) or DEFAULT_PROFILE
+        if name not in SQLITE_PROFILES:
+            logger.warning(f"Kayıtlı SQLite profili tanınmadı, varsayılan kullanılıyor: {name}")
+            name = DEFAULT_PROFILE
+        set_db_profile(name)
+
+    def get_db_profiles(self):
+        """[(key, görünen ad, açıklama), ...] ve aktif profil adını döndürür."""
+        profiles = [(key, p["name"], p["description"]) for key, p in SQLITE_PROFILES.items()]
+        return profiles, get_db_profile()
+
+    def save_db_profile(self, profile_name, callback):
+        if profile_name not in SQLITE_PROFILES:
+            callback((False, "Bilinmeyen veritabanı profili."))
+            return
+
+        def op():
+            if not self.type_repo.set_setting(SETTING_DB_PROFILE, profile_name):
+                return False, "Profil kaydedilemedi."
+            set_db_profile(profile_name)
+            return True, f"Veritabanı profili: {SQLITE_PROFILES[profile_name]['name']}"
+        self._run_async(op, callback)
+
+    # --- Bellek İçi Analiz Kopyası ---
+
+    def apply_saved_analytics_replica(self):
+        """Kayıtlı ayar açıksa analiz kopyasını açar ve arka planda doldurur
+        (başlangıçta senkron çağrılır; dolana kadar sorgular diske gider)."""
+        if self.type_repo.get_setting(SETTING_ANALYTICS_REPLICA) == "1":
+            enable_replica(refresh=False)
+            self._run_async(refresh_replica, None, timeout_ms=0)
+
+    def refresh_analytics_replica(self):
+        """activity_changed sonrası kopyayı arka planda yeniler (kapalıysa bir şey yapmaz)."""
+        if is_replica_enabled():
+            self._run_async(refresh_replica, None, timeout_ms=0)
+
+    def is_analytics_replica_enabled(self) -> bool:
+        return is_replica_enabled()
+
+    def save_analytics_replica(self, enabled, callback):
+        def op():
+            if not self.type_repo.set_setting(SETTING_ANALYTICS_REPLICA, "1" if enabled else "0"):
+                return False, "Ayar kaydedilemedi."
+            if not enabled:
+                disable_replica()
+                return True, "Analiz kopyası kapatıldı."
+            if not enable_replica():
+                disable_replica()
+                return False, "Analiz kopyası oluşturulamadı."
+            return True, "Analiz kopyası açıldı."
+        # Büyük veritabanında kopyalama uzun sürebilir: timeout yok
+        self._run_async(op, callback, timeout_ms=0)
+
+    # --- Sorgu İzleme ---
+
+    def apply_saved_query_tracing(self):
+        """Kayıtlı ayar açıksa sorgu izlemeyi başlatır (başlangıçta senkron çağrılır)."""
+        if self.type_repo.get_setting(SETTING_QUERY_TRACING) == "1":
+            enable_query_tracing()
+
+    def is_query_tracing_enabled(self) -> bool:
+        return is_query_tracing_enabled()
+
+    def save_query_tracing(self, enabled, callback):
+        def op():
+            if not self.type_repo.set_setting(SETTING_QUERY_TRACING, "1" if enabled else "0"):
+                return False, "Ayar kaydedilemedi."
+            if enabled:
+                enable_query_tracing()
+                return True, "Sorgu izleme açıldı."
+            disable_query_tracing()
+            return True, "Sorgu izleme kapatıldı."
+        self._run_async(op, callback)
+
+    def get_query_trace_summary(self, limit=None):
+        """Bellekteki sorgu özetini döndürür (veritabanına gitmez, senkron)."""
+        return get_query_trace_summary(limit)
+
+    def reset_query_trace(self):
+        reset_query_trace()
+
+    # --- Yedekleme ---
+
+    def run_backup(self, callback=None):
+        """Değişiklik varsa arka planda anlık görüntü alır (zamanlayıcı çağırır)."""
+        self._run_async(run_backup, callback, timeout_ms=0)
+
+    def backup_now(self, callback):
+        def op():
+            path = run_backup(force=True)
+            if path is None:
+                return False, "Yedek alınamadı."
+            return True, f"Yedek alındı: {os.path.basename(path)}"
+        self._run_async(op, callback, timeout_ms=0)
+
+    def get_backups(self, callback):
+        """[{'path', 'name', 'size', 'created'}, ...] — en yeniden eskiye."""
+        self._run_async(list_backups, callback)
+
+    # --- Bakım ---
+
+    def run_idle_maintenance(self):
+        """Son çağrıdan beri yazma olmadıysa vadesi gelen bakım işlerini arka planda
+        çalıştırır (zamanlayıcı çağırır). Kullanıcı yazıyorsa bir sonraki tura kalır."""
+        generation = get_write_generation()
+        if self._maintenance_running or generation != self._idle_generation:
+            self._idle_generation = generation
+            return
+
+        def done(result):
+            self._maintenance_running = False
+            # Bakımın kendi yazmaları bir sonraki turu ertelemesin
+            self._idle_generation = get_write_generation()
+        self._maintenance_running = True
+        self._run_async(run_maintenance, done, timeout_ms=0)
@@ -0,0 +1,75 @@
+# controllers/transfer_controller.py
+import os
+from models import ActivityFilter
+from controllers._base_controller import _BaseController
+from services.import_service import ImportService
+from services.export_service import ExportService
+from logger_setup import logger
+
+
+class TransferController(_BaseController):
+    """CSV / JSONL içe ve dışa aktarma. Tüm işler ProgressWorker ile arka planda
+    çalışır; başlatan metodlar iptal için worker'ı döndürür (worker.stop())."""
+
+    def __init__(self, repository, plan_repo):
+        super().__init__()
+        self.import_service = ImportService(repository, plan_repository=plan_repo)
+        self.export_service = ExportService(repository, plan_repo)
+
+    def import_activities(self, file_path, callback, progress_callback=None):
+        """Faaliyet dosyasını içe aktarır. Sonuç: (başarılı mı, özet mesajı, ImportReport)."""
+        if not file_path or not os.path.isfile(file_path):
+            callback((False, "Dosya bulunamadı.", None))
+            return None
+
+        def op(progress, is_cancelled):
+            report = self.import_service.import_file(file_path, progress, is_cancelled)
+            return report.imported > 0, report.summary(), report
+
+        return self._run_async_with_progress(op, callback, progress_callback)
+
+    def import_database(self, directory, callback, progress_callback=None):
+        """export_database çıktısını içe aktarır. Sonuç: (başarılı mı, mesaj, {küme: ImportReport})."""
+        if not directory or not os.path.isdir(directory):
+            callback((False, "Klasör bulunamadı.", None))
+            return None
+
+        def op(progress, is_cancelled):
+            reports = self.import_service.import_database(directory, progress, is_cancelled)
+            if not reports:
+                return False, "Klasörde içe aktarılacak dosya bulunamadı.", reports
+            lines = [f"{name}: {report.summary()}" for name, report in reports.items()]
+            return any(r.imported for r in reports.values()), "\n".join(lines), reports
+
+        return self._run_async_with_progress(op, callback, progress_callback)
+
+    def export_activities(self, file_path, callback, progress_callback=None,
+                          type_filter="Hepsi", search_term="", date_filter=""):
+        """Filtreye uyan faaliyetleri dosyaya yazar. Sonuç: (başarılı mı, mesaj)."""
+        filter_obj = ActivityFilter(type_filter=type_filter, search_term=search_term, date_filter=date_filter)
+
+        def op(progress, is_cancelled):
+            try:
+                count = self.export_service.export_activities(file_path, filter_obj, progress, is_cancelled)
+            except Exception as e:
+                logger.error(f"Hata (TransferController.export_activities): {e}")
+                return False, f"Dışa aktarma başarısız: {e}"
+            if count is None:
+                return False, "Dışa aktarma iptal edildi."
+            return True, f"{count} kayıt dışa aktarıldı."
+
+        return self._run_async_with_progress(op, callback, progress_callback)
+
+    def export_database(self, directory, callback, progress_callback=None, fmt="jsonl"):
+        """Klasör, plan ve faaliyetleri dizine yazar. Sonuç: (başarılı mı, mesaj)."""
+        def op(progress, is_cancelled):
+            try:
+                counts = self.export_service.export_database(directory, fmt, progress, is_cancelled)
+            except Exception as e:
+                logger.error(f"Hata (TransferController.export_database): {e}")
+                return False, f"Dışa aktarma başarısız: {e}"
+            if counts is None:
+                return False, "Dışa aktarma iptal edildi."
+            return True, ", ".join(f"{name}: {count}" for name, count in counts.items())
+
+        return self._run_async_with_progress(op, callback, progress_callback)
@@ -10,20 +10,30 @@ class TypeController(_BaseController):
     def get_all_activity_types(self, callback):
         self._run_async(self.type_repo.get_all_types, callback)
 
+    def get_activity_type_usage(self, callback):
+        self._run_async(self.type_repo.get_type_usage, callback)
+
     def add_activity_type(self, name, callback):
         if not name or not name.strip():
             callback((False, "Tür adı boş olamaz."))
             return
         self._run_async(self.type_repo.add_type, callback, name.strip())
 
-    def update_activity_type(self, old_name, new_name, callback):
+    def update_activity_type(self, old_name, new_name, callback, progress_callback=None):
+        """Kayıtlar parça parça güncellenir; iptal için ProgressWorker döndürülür (worker.stop())."""
         if not new_name or not new_name.strip():
             callback((False, "Yeni tür adı boş olamaz."))
-            return
+            return None
         if old_name == new_name:
             callback((False, "Herhangi bir değişiklik yapılmadı."))
-            return
-        self._run_async(self.type_repo.update_type, callback, old_name, new_name.strip())
+            return None
+        return self._run_async_with_progress(
+            self.type_repo.update_type, callback, progress_callback, old_name, new_name.strip()
+        )
+
+    def resume_type_rename(self, callback, progress_callback=None):
+        """Yarıda kalmış yeniden adlandırmayı sürdürür; bekleyen iş yoksa sonuç None."""
+        return self._run_async_with_progress(self.type_repo.resume_type_rename, callback, progress_callback)
 
     def delete_activity_type(self, name, callback):
         self._run_async(self.type_repo.delete_type, callback, name)
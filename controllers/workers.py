@@ -76,3 +76,48 @@ class DbWorker(QThread):
             if not self._cancelled:
                 logger.error(f"Worker beklenmeyen hata [{type(e).__name__}]: {e}")
                 self.finished.emit(None)
+
+
+class ProgressWorker(DbWorker):
+    """İlerleme bildiren uzun işler (toplu içe aktarma vb.) için worker.
+
+    func'a `progress(işlenen, toplam)` ve `is_cancelled()` anahtar argümanları
+    geçirilir. Varsayılan olarak timeout yoktur. stop() işi bir sonraki kontrol
+    noktasında durdurur ve o ana kadarki sonuç yine finished ile yayınlanır;
+    cancel() ise (DbWorker'daki gibi) sonucu tamamen yok sayar.
+    """
+
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, func, *args, timeout_ms=0, **kwargs):
+        super().__init__(func, *args, timeout_ms=timeout_ms, **kwargs)
+        self._stop_requested = False
+        self.kwargs['progress'] = self.progress.emit
+        self.kwargs['is_cancelled'] = lambda: self._stop_requested or self._cancelled
+
+    def stop(self):
+        self._stop_requested = True
+
+
+class StreamWorker(DbWorker):
+    """Sonucu parça parça üreten işler için worker (ör. önbellekteki tüm sayfalar).
+
+    func bir iterable döndürür; her parça geldikçe chunk sinyaliyle yayınlanır,
+    sonunda finished toplam öğe sayısını taşır (hata durumunda None). Varsayılan
+    olarak timeout yoktur; cancel() sonraki parçaların yayınlanmasını durdurur.
+    """
+
+    chunk = pyqtSignal(object)
+
+    def __init__(self, func, *args, timeout_ms=0, **kwargs):
+        super().__init__(self._stream, *args, timeout_ms=timeout_ms, **kwargs)
+        self._source = func
+
+    def _stream(self, *args, **kwargs):
+        count = 0
+        for part in self._source(*args, **kwargs):
+            if self._cancelled:
+                break
+            count += len(part)
+            self.chunk.emit(part)
+        return count
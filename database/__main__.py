@@ -0,0 +1,133 @@
+# database/__main__.py
+"""
+Veritabanı bakım komutları.
+
+Kullanım:
+    python -m database rebuild-agg      # activity_monthly_agg özet tablosunu yeniden hesaplar
+    python -m database rebuild-fts      # activities_fts arama indeksini yeniden kurar
+    python -m database rebuild-interval # activities_interval tarih aralığı indeksini yeniden kurar
+    python -m database rebuild-names    # activity_names otomatik tamamlama indeksini yeniden kurar
+    python -m database schema-version   # şema sürümünü (PRAGMA user_version) gösterir
+    python -m database backup           # anlık görüntü alır (backups/ klasörü)
+    python -m database list-backups     # anlık görüntüleri listeler
+    python -m database restore [DOSYA]  # anlık görüntüyü geri yükler (varsayılan: en yenisi; uygulama kapalıyken)
+    python -m database maintenance      # vadesi gelen bakım işlerini çalıştırır (--force: hepsini + auto_vacuum dönüştürmesi)
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+from database.backup import list_backups, restore_backup, run_backup, shutdown_backups
+from database.connection import close_pool, get_db
+from database.maintenance import MaintenanceScheduler
+from database.migrations import SCHEMA_VERSION, enable_incremental_vacuum, get_schema_version
+from database.repository import ActivityRepository
+
+
+def _rebuild_agg(args):
+    return 0 if ActivityRepository().rebuild_monthly_agg() else 1
+
+
+def _rebuild_fts(args):
+    return 0 if ActivityRepository().rebuild_fts_index() else 1
+
+
+def _rebuild_interval(args):
+    return 0 if ActivityRepository().rebuild_interval_index() else 1
+
+
+def _rebuild_names(args):
+    return 0 if ActivityRepository().rebuild_name_index() else 1
+
+
+def _schema_version(args):
+    ActivityRepository()
+    with get_db() as conn:
+        version = get_schema_version(conn)
+    print(f"Şema sürümü: {version} (uygulama: {SCHEMA_VERSION})")
+    return 0 if version == SCHEMA_VERSION else 1
+
+
+def _backup(args):
+    path = run_backup(force=True)
+    if path:
+        print(f"Yedek alındı: {path}")
+    return 0 if path else 1
+
+
+def _list_backups(args):
+    snapshots = list_backups()
+    if not snapshots:
+        print("Anlık görüntü yok.")
+    for snapshot in snapshots:
+        created = datetime.fromtimestamp(snapshot['created']).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"{snapshot['name']}  {created}  {snapshot['size'] / 1024:.0f} KB")
+    return 0
+
+
+def _restore(args):
+    if args.snapshot:
+        snapshot = args.snapshot
+    else:
+        snapshots = list_backups()
+        if not snapshots:
+            print("Geri yüklenecek anlık görüntü yok.")
+            return 1
+        snapshot = snapshots[0]['path']
+    if not os.path.exists(snapshot):
+        print(f"Dosya bulunamadı: {snapshot}")
+        return 1
+    # Havuz bağlantıları açıkken dosyanın üzerine yazılmaz
+    shutdown_backups()
+    close_pool()
+    safety = restore_backup(snapshot)
+    if safety is None:
+        return 1
+    print(f"Geri yüklendi: {os.path.basename(snapshot)} (önceki hali: {safety})")
+    return 0
+
+
+def _maintenance(args):
+    ActivityRepository()
+    if args.force:
+        # Boşta bakımın yapmadığı tek seferlik auto_vacuum dönüştürmesi (tam VACUUM, boyut sınırı yok)
+        with get_db() as conn:
+            enable_incremental_vacuum(conn)
+    results = MaintenanceScheduler(budget_s=float("inf")).run_due(force=args.force)
+    if not results:
+        print("Vadesi gelen bakım işi yok.")
+    for name, summary in results.items():
+        print(f"{name}: {summary}")
+    return 1 if any(str(summary).startswith("hata") for summary in results.values()) else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m database", description="Veritabanı bakım komutları")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("rebuild-agg", help="Aylık özet tablosunu activities üzerinden yeniden hesaplar").set_defaults(func=_rebuild_agg)
+    commands.add_parser("rebuild-fts", help="FTS5 arama indeksini ve trigger'larını yeniden kurar").set_defaults(func=_rebuild_fts)
+    commands.add_parser("rebuild-interval", help="Tarih aralığı (R*Tree) indeksini ve trigger'larını yeniden kurar").set_defaults(func=_rebuild_interval)
+    commands.add_parser("rebuild-names", help="Otomatik tamamlama isim tablosunu ve trigram indeksini yeniden kurar").set_defaults(func=_rebuild_names)
+    commands.add_parser("schema-version", help="Veritabanı şema sürümünü gösterir").set_defaults(func=_schema_version)
+    commands.add_parser("backup", help="Çevrimiçi yedekleme ile anlık görüntü alır").set_defaults(func=_backup)
+    commands.add_parser("list-backups", help="Anlık görüntüleri en yeniden eskiye listeler").set_defaults(func=_list_backups)
+    restore = commands.add_parser("restore", help="Anlık görüntüyü geri yükler (uygulama kapalıyken)")
+    restore.add_argument("snapshot", nargs="?", help="Anlık görüntü dosyası (varsayılan: en yenisi)")
+    restore.set_defaults(func=_restore)
+    maintenance = commands.add_parser("maintenance", help="Bakım işlerini çalıştırır (optimize, ANALYZE, vacuum, önbellek)")
+    maintenance.add_argument("--force", action="store_true",
+                             help="Vadesi gelmemiş işleri de çalıştır; gerekirse auto_vacuum'u INCREMENTAL'a dönüştür")
+    maintenance.set_defaults(func=_maintenance)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    finally:
+        shutdown_backups()
+        close_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+# database/backup.py
+"""
+Çevrimiçi yedekleme (SQLite online backup API) ve geri yükleme.
+
+Yedek, uygulama açıkken arka planda alınır: sqlite3.Connection.backup sayfaları
+BACKUP_PAGES'lik adımlarla, adımlar arasında beklemeden kopyalar. Kopyalama
+boyunca kaynak bağlantıda bir okuma işlemi açık tutulur; WAL modunda yazıcılar
+beklemez ve diğer bağlantıların commit'leri yedeği baştan başlatmaz (anlık
+görüntü işlemin başındaki haldir). Yine de yeniden başlama olursa
+BACKUP_MAX_RESTARTS'tan sonra yedek bırakılır, sonraki tura kalır. Anlık
+görüntüler veri dizinindeki backups/ klasöründe zaman damgalı dosyalar olarak
+tutulur; en yeni BACKUP_KEEP tanesi saklanır.
+
+Değişiklik yoksa iş yapılmaz: yedekleme bağlantısı açık tutulur ve
+PRAGMA data_version (başka bir bağlantı commit ettiğinde artar) son yedekteki
+değerle karşılaştırılır. Oturumun ilk çağrısında, son anlık görüntü veritabanı
+ve WAL dosyasından yeniyse yedek alınmaz.
+
+Geri yükleme yalnızca uygulama kapalıyken yapılmalıdır:
+    python -m database restore [anlık-görüntü]
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from constants import BACKUP_DIR_NAME
+from . import connection
+from logger_setup import logger
+
+BACKUP_KEEP = 7                 # saklanan anlık görüntü sayısı
+BACKUP_PAGES = 1024             # backup adımı başına kopyalanan sayfa
+BACKUP_MAX_RESTARTS = 3         # kopyalama bu kadar kez baştan başlarsa yedek bırakılır
+BACKUP_INTERVAL_MIN = 60        # arka plan yedekleme aralığı (MainController)
+_SNAPSHOT_EXT = ".db"
+_PART_EXT = ".part"
+
+
+def get_backup_dir(db_path=None) -> str:
+    """Anlık görüntülerin tutulduğu klasör (veritabanının yanındaki backups/)."""
+    db_path = db_path or connection._pool.db_path
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), BACKUP_DIR_NAME)
+
+
+class BackupManager:
+    """Tek bir veritabanı dosyası için anlık görüntü alır ve döndürür."""
+
+    def __init__(self, db_path, backup_dir=None, keep=BACKUP_KEEP, pages=BACKUP_PAGES):
+        self.db_path = db_path
+        self.backup_dir = backup_dir or get_backup_dir(db_path)
+        self.keep = keep
+        self.pages = pages
+        self._stem = os.path.splitext(os.path.basename(db_path))[0]
+        self._source = None             # data_version için açık tutulan bağlantı
+        self._last_version = None       # son yedekteki data_version
+        self._lock = threading.Lock()   # aynı anda tek yedek
+        self.last_backup_ms = 0.0
+
+    def _connect_source(self):
+        if self._source is None:
+            self._source = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._source.execute("PRAGMA busy_timeout = 5000")
+        return self._source
+
+    def _data_version(self) -> int:
+        return self._connect_source().execute("PRAGMA data_version").fetchone()[0]
+
+    def _newest_snapshot_is_current(self) -> bool:
+        """Son anlık görüntü veritabanı ve WAL dosyasındaki son yazmadan sonra mı alındı?"""
+        snapshots = self.list_backups()
+        if not snapshots:
+            return False
+        db_mtime = max(
+            (os.path.getmtime(path) for path in (self.db_path, self.db_path + "-wal") if os.path.exists(path)),
+            default=0,
+        )
+        return snapshots[0]['created'] >= db_mtime
+
+    def has_changes(self) -> bool:
+        """Son yedekten beri başka bir bağlantı commit etti mi?"""
+        if self._last_version is None:
+            return not self._newest_snapshot_is_current()
+        return self._data_version() != self._last_version
+
+    def backup(self, force=False, progress=None):
+        """Anlık görüntü alır ve eskileri döndürür. Yeni dosyanın yolunu, değişiklik
+        yoksa (force=False) veya hata olursa None döndürür.
+
+        progress(kalan_sayfa, toplam_sayfa) her adımdan sonra çağrılır.
+        """
+        with self._lock:
+            part = None
+            try:
+                if not force and not self.has_changes():
+                    self._last_version = self._data_version()
+                    return None
+
+                os.makedirs(self.backup_dir, exist_ok=True)
+                name = f"{self._stem}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{_SNAPSHOT_EXT}"
+                path = os.path.join(self.backup_dir, name)
+                part = path + _PART_EXT
+
+                start = time.perf_counter()
+                source = self._connect_source()
+                # Okuma işlemi kopyalama boyunca açık: tüm adımlar aynı anlık görüntüyü okur
+                source.execute("BEGIN")
+                source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+                target = None
+                try:
+                    # Anlık görüntüyle aynı an: sonradan gelen commit bir sonraki yedeği tetikler
+                    version = self._data_version()
+                    target = sqlite3.connect(part)
+                    source.backup(target, pages=self.pages, sleep=0, progress=self._step_callback(progress))
+                    # Anlık görüntü tek dosya olarak açılabilsin (WAL/SHM oluşturmasın)
+                    target.execute("PRAGMA journal_mode = DELETE")
+                finally:
+                    if target is not None:
+                        target.close()
+                    source.rollback()
+                os.replace(part, path)
+
+                self._last_version = version
+                self.last_backup_ms = (time.perf_counter() - start) * 1000
+                logger.info(f"Veritabanı yedeklendi: {name} ({self.last_backup_ms:.1f} ms)")
+                self._rotate()
+                return path
+            except Exception as e:
+                logger.error(f"Hata (BackupManager.backup): {e}")
+                if part is not None and os.path.exists(part):
+                    os.remove(part)
+                return None
+
+    @staticmethod
+    def _step_callback(progress):
+        """backup() adım callback'i: kalan sayfa arttıysa kopyalama baştan başlamıştır;
+        BACKUP_MAX_RESTARTS aşılınca istisna yedeği durdurur."""
+        state = {'remaining': None, 'restarts': 0}
+
+        def step(status, remaining, total):
+            if state['remaining'] is not None and remaining > state['remaining']:
+                state['restarts'] += 1
+                if state['restarts'] > BACKUP_MAX_RESTARTS:
+                    raise sqlite3.OperationalError(f"yedek {BACKUP_MAX_RESTARTS} kez baştan başladı, bırakıldı")
+            state['remaining'] = remaining
+            if progress:
+                progress(remaining, total)
+        return step
+
+    def list_backups(self) -> list:
+        """Anlık görüntüler, en yeniden eskiye: [{'path', 'name', 'size', 'created'}, ...]."""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        prefix = self._stem + "-"
+        snapshots = []
+        for name in os.listdir(self.backup_dir):
+            if name.startswith(prefix) and name.endswith(_SNAPSHOT_EXT):
+                path = os.path.join(self.backup_dir, name)
+                snapshots.append({
+                    'path': path, 'name': name,
+                    'size': os.path.getsize(path), 'created': os.path.getmtime(path),
+                })
+        # Zaman damgası dosya adında: ada göre sıralama kronolojiktir
+        snapshots.sort(key=lambda s: s['name'], reverse=True)
+        return snapshots
+
+    def _rotate(self):
+        for snapshot in self.list_backups()[self.keep:]:
+            try:
+                os.remove(snapshot['path'])
+            except OSError as e:
+                logger.warning(f"Eski yedek silinemedi ({snapshot['name']}): {e}")
+
+    def close(self):
+        with self._lock:
+            if self._source is not None:
+                self._source.close()
+                self._source = None
+            self._last_version = None
+
+
+def verify_snapshot(path) -> bool:
+    """Anlık görüntüyü salt okunur açıp PRAGMA quick_check ile doğrular."""
+    try:
+        conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+        try:
+            return conn.execute("PRAGMA quick_check").fetchone()[0] == "ok"
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.error(f"Hata (verify_snapshot): {e}")
+        return False
+
+
+def restore_backup(snapshot_path, db_path=None):
+    """Anlık görüntüyü veritabanının üzerine geri yükler.
+
+    Önce mevcut veritabanının yedeği alınır (geri yükleme de geri alınabilsin).
+    Uygulama kapalıyken çalıştırılmalıdır. Başarıda güvenlik yedeğinin yolunu,
+    hata durumunda None döndürür.
+    """
+    db_path = db_path or connection._pool.db_path
+    if not verify_snapshot(snapshot_path):
+        logger.error(f"Geri yükleme iptal edildi, anlık görüntü bozuk: {snapshot_path}")
+        return None
+
+    manager = BackupManager(db_path)
+    try:
+        safety = manager.backup(force=True)
+    finally:
+        manager.close()
+    if safety is None:
+        logger.error("Geri yükleme iptal edildi: mevcut veritabanı yedeklenemedi.")
+        return None
+
+    try:
+        source = sqlite3.connect(f"file:{os.path.abspath(snapshot_path)}?mode=ro", uri=True)
+        target = sqlite3.connect(db_path)
+        try:
+            target.execute("PRAGMA busy_timeout = 5000")
+            source.backup(target)
+            target.execute("PRAGMA journal_mode = WAL")
+        finally:
+            source.close()
+            target.close()
+    except sqlite3.Error as e:
+        logger.error(f"Hata (restore_backup): {e}")
+        return None
+    logger.info(f"Veritabanı geri yüklendi: {os.path.basename(snapshot_path)} (önceki hali: {os.path.basename(safety)})")
+    return safety
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_backup_manager() -> BackupManager:
+    """Aktif havuzun veritabanı için yedekleyiciyi döndürür (havuz değiştiyse yeniler)."""
+    global _manager
+    with _manager_lock:
+        db_path = connection._pool.db_path
+        if _manager is None or _manager.db_path != db_path:
+            if _manager is not None:
+                _manager.close()
+            _manager = BackupManager(db_path)
+        return _manager
+
+
+def run_backup(force=False):
+    """Arka plan işi: değişiklik varsa anlık görüntü alır. Yeni dosyanın yolu ya da None."""
+    return get_backup_manager().backup(force=force)
+
+
+def list_backups() -> list:
+    return get_backup_manager().list_backups()
+
+
+def shutdown_backups():
+    """Uygulama kapanırken yedekleme bağlantısını kapatır."""
+    global _manager
+    with _manager_lock:
+        if _manager is not None:
+            _manager.close()
+            _manager = None
@@ -1,10 +1,14 @@
 # database/connection.py
 import sqlite3
 import os
+import re
 import sys
+import threading
+import time
 from contextlib import contextmanager
 from constants import DB_FILENAME, DATA_DIR_NAME
 from logger_setup import logger
+from .migrations import migrate
 
 def get_db_path():
     """İşletim sistemine uyumlu veritabanı yolunu döndürür."""
@@ -25,40 +29,565 @@ def get_db_path():
     # Klasörün var olduğundan emin ol
     if not os.path.exists(db_dir):
         os.makedirs(db_dir, exist_ok=True)
-        
+
     return os.path.join(db_dir, DB_FILENAME)
 
 DB_PATH = get_db_path()
 
+_POOL_MAX_IDLE = 4  # Boşta bekletilecek en fazla bağlantı (eşzamanlı DbWorker sayısı kadar)
+
+# Her yeni bağlantıya uygulanan PRAGMA setleri. journal_mode WAL tüm profillerde
+# aynıdır: okuyucular (DbWorker) yazıcıyı (AddPage) bloklamaz.
+SQLITE_PROFILES = {
+    "default": {
+        "name": "Varsayılan",
+        "description": "Günlük kullanım için dengeli ayarlar",
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": 64 * 1024 * 1024,
+            "cache_size": -16000,       # ~16 MB (negatif değer KiB cinsinden)
+            "temp_store": "MEMORY",
+            "busy_timeout": 5000,
+        },
+    },
+    "bulk-import": {
+        "name": "Toplu İçe Aktarma",
+        "description": "Büyük veri aktarımlarında en hızlı yazma (çökmede son işlemler kaybolabilir)",
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "OFF",
+            "mmap_size": 64 * 1024 * 1024,
+            "cache_size": -64000,       # ~64 MB
+            "temp_store": "MEMORY",
+            "busy_timeout": 10000,
+        },
+    },
+    "read-mostly": {
+        "name": "Okuma Ağırlıklı",
+        "description": "Geniş geçmişte istatistik ve rapor sorguları için büyük önbellek",
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": 256 * 1024 * 1024,
+            "cache_size": -32000,       # ~32 MB
+            "temp_store": "MEMORY",
+            "busy_timeout": 5000,
+        },
+    },
+}
+DEFAULT_PROFILE = "default"
+
+
+def apply_profile(conn, profile_name=DEFAULT_PROFILE):
+    """Verilen profilin PRAGMA'larını bağlantıya uygular."""
+    profile = SQLITE_PROFILES.get(profile_name) or SQLITE_PROFILES[DEFAULT_PROFILE]
+    for pragma, value in profile["pragmas"].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+class PooledConnection(sqlite3.Connection):
+    """Havuza ait bağlantı. close() bağlantıyı kapatmaz, havuza iade eder."""
+
+    _pool = None
+    _profile = None
+    _changes_at_acquire = 0
+    _tracer = None          # kiralama süresince sorgu izleme açıksa QueryTracer
+    _trace_entries = None
+    _trace_statements = 0
+
+    # Connection.execute C tarafında Python'daki Cursor.execute'u atlar; izleme
+    # açıkken sorgular TracedCursor üzerinden çalıştırılır.
+    def cursor(self, factory=None):
+        if factory is None:
+            factory = TracedCursor if self._tracer is not None else sqlite3.Cursor
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        if self._tracer is None:
+            return super().execute(sql, parameters)
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        if self._tracer is None:
+            return super().executemany(sql, seq_of_parameters)
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.release(self)
+        else:
+            super().close()
+
+    def _close(self):
+        """Bağlantıyı gerçekten kapatır (yalnızca havuz tarafından çağrılır)."""
+        self._pool = None
+        super().close()
+
+
+class ConnectionPool:
+    """Thread'ler arasında paylaşılan SQLite bağlantı havuzu.
+
+    Bir bağlantı aynı anda yalnızca tek bir thread'e kiralanır; iş bitince
+    havuza döner ve sonraki DbWorker tarafından yeniden kullanılır. Bağlantılar
+    yalnızca oluşturulurken yapılandırılır (row factory + SQLite profili).
+    """
+
+    def __init__(self, db_path, max_idle=_POOL_MAX_IDLE, profile=DEFAULT_PROFILE):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.profile = profile
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._in_use = 0
+        self._opened = 0
+        self._reused = 0
+        self._write_generation = 0
+        self.schema_ready = False   # init_db bu havuzun veritabanını güncelledi mi?
+
+    def _create(self):
+        conn = sqlite3.connect(self.db_path, factory=PooledConnection, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            apply_profile(conn, self.profile)
+        except sqlite3.Error:
+            conn._close()
+            raise
+        conn._profile = self.profile
+        conn._pool = self
+        return conn
+
+    def acquire(self):
+        """Boştaki bir bağlantıyı döndürür; yoksa yenisini açar."""
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Bağlantı havuzu kapatılmış.")
+            self._in_use += 1
+            if self._idle:
+                self._reused += 1
+                conn = self._idle.pop()
+                conn._changes_at_acquire = conn.total_changes
+                _start_trace(conn)
+                return conn
+            self._opened += 1
+        try:
+            conn = self._create()
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._opened -= 1
+            raise
+        conn._changes_at_acquire = conn.total_changes
+        _start_trace(conn)
+        return conn
+
+    def release(self, conn):
+        """Bağlantıyı havuza iade eder. Yarım kalan işlem geri alınır."""
+        _finish_trace(conn)
+        wrote = conn.total_changes != conn._changes_at_acquire
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Havuza iade sırasında rollback başarısız: {e}")
+            with self._lock:
+                self._in_use -= 1
+                self._write_generation += 1
+            conn._close()
+            return
+
+        with self._lock:
+            self._in_use -= 1
+            if wrote:
+                self._write_generation += 1
+            reusable = not self._closed and conn._profile == self.profile
+            if reusable and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn._close()
+
+    def set_profile(self, profile_name):
+        """Profili değiştirir. Eski profildeki boş bağlantılar kapatılır,
+        kiradakiler iade edildiklerinde kapanır."""
+        if profile_name not in SQLITE_PROFILES:
+            raise ValueError(f"Bilinmeyen SQLite profili: {profile_name}")
+        with self._lock:
+            if profile_name == self.profile:
+                return
+            self.profile = profile_name
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn._close()
+        logger.info(f"SQLite profili değiştirildi: {profile_name}")
+
+    def close_all(self):
+        """Boştaki bağlantıları kapatır; kiradakiler iade edildiğinde kapanır."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn._close()
+        stats = self.stats()
+        logger.info(
+            f"Bağlantı havuzu kapatıldı: {stats['opened']} açıldı, "
+            f"{stats['reused']} yeniden kullanıldı."
+        )
+
+    @property
+    def write_generation(self) -> int:
+        """Havuzdaki bağlantılarla yapılan her yazma işleminden sonra artan sayaç.
+        Önbellekler bu değeri saklayarak verinin değişip değişmediğini anlar."""
+        return self._write_generation
+
+    def stats(self) -> dict:
+        """Açılan ve yeniden kullanılan bağlantı sayılarını döndürür."""
+        with self._lock:
+            return {
+                'opened': self._opened,
+                'reused': self._reused,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+            }
+
+
+# --- Sorgu İzleme (isteğe bağlı) ---
+
+SLOW_QUERY_MS = 100         # bu süreyi aşan sorgular yavaş sorgu günlüğüne yazılır
+_TRACE_MAX_CALLERS = 5      # özet satırı başına saklanan farklı çağıran / parametre şekli
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+_PLACEHOLDER_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+_SKIP_FRAME_FILES = (os.path.abspath(__file__), os.path.join(os.path.dirname(os.path.abspath(__file__)), "write_queue.py"))
+_trace_local = threading.local()
+
+
+def normalize_sql(sql) -> str:
+    """Boşlukları sadeleştirir ve IN (?, ?, ...) listelerini tek kalıba indirir;
+    aynı sorgunun farklı uzunluktaki çağrıları tek özet satırında toplanır."""
+    return _PLACEHOLDER_LIST_RE.sub("?, …", " ".join(sql.split()))
+
+
+def params_shape(params, many=False) -> str:
+    """Parametre değerlerini değil yalnızca tiplerini döndürür: "(str, int)"."""
+    if many:
+        params = list(params)
+        first = params_shape(params[0]) if params else "()"
+        return f"{len(params)} x {first}"
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in params.items()) + "}"
+    return "(" + ", ".join(type(v).__name__ for v in params) + ")"
+
+
+def _find_caller() -> str:
+    """Sorguyu çalıştıran repository metodunu bulur ("ActivityRepository.get_by_id")."""
+    caller = getattr(_trace_local, "caller", None)
+    if caller:
+        return caller   # yazıcı thread'e devredilmiş iş: kuyruğa ekleyen metod
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename not in _SKIP_FRAME_FILES:
+            owner = frame.f_locals.get("self")
+            if owner is not None and type(owner).__name__.endswith("Repository"):
+                return f"{type(owner).__name__}.{code.co_name}"
+            if fallback is None and "contextlib" not in code.co_filename:
+                fallback = f"{os.path.splitext(os.path.basename(code.co_filename))[0]}.{code.co_name}"
+        frame = frame.f_back
+    return fallback or "?"
+
+
+def bind_trace_caller(op):
+    """Yazıcı thread'e devredilen op için çağıran metodu şimdi yakalar; izleme
+    kapalıysa op'u olduğu gibi döndürür."""
+    if _tracer is None:
+        return op
+    caller = _find_caller()
+
+    def traced(conn):
+        _trace_local.caller = caller
+        try:
+            return op(conn)
+        finally:
+            _trace_local.caller = None
+    return traced
+
+
+class _TraceEntry:
+    __slots__ = ("sql", "params", "many", "caller", "ms", "rows", "fetched", "statements")
+
+    def __init__(self, sql, params, many, caller):
+        self.sql = sql
+        self.params = params
+        self.many = many
+        self.caller = caller
+        self.ms = 0.0
+        self.rows = -1          # DML için rowcount; SELECT'te okunan satırlar kullanılır
+        self.fetched = 0
+        self.statements = 0     # trace callback ile sayılan ifadeler (tetikleyiciler dahil)
+
+
+class TracedCursor(sqlite3.Cursor):
+    """Süreyi (execute + fetch) ve dönen satır sayısını kiralama kaydına yazan cursor."""
+
+    _trace_entry = None
+
+    def _run(self, method, sql, params, many):
+        conn = self.connection
+        entry = _TraceEntry(sql, params, many, _find_caller())
+        if conn._trace_entries is not None:
+            conn._trace_entries.append(entry)
+        self._trace_entry = entry
+        statements = conn._trace_statements
+        start = time.perf_counter()
+        try:
+            return method(self, sql, params)
+        finally:
+            entry.ms += (time.perf_counter() - start) * 1000
+            entry.statements += conn._trace_statements - statements
+            entry.rows = self.rowcount
+
+    def execute(self, sql, parameters=()):
+        return self._run(sqlite3.Cursor.execute, sql, parameters, False)
+
+    def executemany(self, sql, seq_of_parameters):
+        params = seq_of_parameters if isinstance(seq_of_parameters, (list, tuple)) else list(seq_of_parameters)
+        return self._run(sqlite3.Cursor.executemany, sql, params, True)
+
+    def _timed(self, method, *args):
+        start = time.perf_counter()
+        result = method(self, *args)
+        entry = self._trace_entry
+        if entry is not None:
+            entry.ms += (time.perf_counter() - start) * 1000
+            if isinstance(result, list):
+                entry.fetched += len(result)
+            elif result is not None:
+                entry.fetched += 1
+        return result
+
+    def fetchone(self):
+        return self._timed(sqlite3.Cursor.fetchone)
+
+    def fetchmany(self, size=None):
+        return self._timed(sqlite3.Cursor.fetchmany, self.arraysize if size is None else size)
+
+    def fetchall(self):
+        return self._timed(sqlite3.Cursor.fetchall)
+
+    def __next__(self):
+        entry = self._trace_entry
+        start = time.perf_counter()
+        try:
+            row = sqlite3.Cursor.__next__(self)
+        finally:
+            if entry is not None:
+                entry.ms += (time.perf_counter() - start) * 1000
+        if entry is not None:
+            entry.fetched += 1
+        return row
+
+
+class QueryTracer:
+    """Sorgu kayıtlarını normalleştirilmiş SQL başına toplar; eşiği aşanları
+    EXPLAIN QUERY PLAN çıktısıyla yavaş sorgu günlüğüne yazar."""
+
+    def __init__(self, slow_ms=SLOW_QUERY_MS, slow_logger=None):
+        self.slow_ms = slow_ms
+        self.slow_logger = slow_logger
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.started_at = time.time()
+
+    def record(self, conn, entries):
+        slow = []
+        with self._lock:
+            for entry in entries:
+                key = normalize_sql(entry.sql)
+                stat = self._stats.get(key)
+                if stat is None:
+                    stat = self._stats[key] = {
+                        'sql': key, 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0,
+                        'statements': 0, 'slow': 0, 'callers': [], 'shapes': [],
+                    }
+                rows = entry.rows if entry.rows >= 0 else entry.fetched
+                stat['count'] += 1
+                stat['total_ms'] += entry.ms
+                stat['max_ms'] = max(stat['max_ms'], entry.ms)
+                stat['rows'] += rows
+                stat['statements'] += entry.statements
+                shape = params_shape(entry.params, entry.many)
+                for field, value in (('callers', entry.caller), ('shapes', shape)):
+                    if value not in stat[field] and len(stat[field]) < _TRACE_MAX_CALLERS:
+                        stat[field].append(value)
+                if entry.ms >= self.slow_ms:
+                    stat['slow'] += 1
+                    slow.append((entry, rows, shape))
+        for entry, rows, shape in slow:
+            self._log_slow(conn, entry, rows, shape)
+
+    def _log_slow(self, conn, entry, rows, shape):
+        if self.slow_logger is None:
+            return
+        plan = explain_query_plan(conn, entry.sql, entry.params[0] if entry.many and entry.params else entry.params)
+        self.slow_logger.warning(
+            f"{entry.ms:.1f} ms | {entry.caller} | satır={rows} | ifade={entry.statements} | "
+            f"parametre={shape}\nSQL: {normalize_sql(entry.sql)}\nPLAN:\n{plan}"
+        )
+
+    def summary(self, limit=None) -> list:
+        """Toplam süreye göre azalan sırada özet satırları (dict) döndürür."""
+        with self._lock:
+            rows = [dict(stat, callers=list(stat['callers']), shapes=list(stat['shapes']),
+                         avg_ms=stat['total_ms'] / stat['count'])
+                    for stat in self._stats.values()]
+        rows.sort(key=lambda r: r['total_ms'], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+
+def explain_query_plan(conn, sql, params=()) -> str:
+    """EXPLAIN QUERY PLAN çıktısını girintili metin olarak döndürür."""
+    if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+        return "  (plan yok)"
+    try:
+        plan = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", params or ()).fetchall()
+    except sqlite3.Error as e:
+        return f"  (plan alınamadı: {e})"
+    depth = {0: 0}
+    lines = []
+    for node_id, parent, _, detail in plan:
+        depth[node_id] = depth.get(parent, 0) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return "\n".join(lines) or "  (plan yok)"
+
+
+_tracer = None
+
+
+def _start_trace(conn):
+    tracer = _tracer
+    if tracer is None:
+        return
+    conn._tracer = tracer
+    conn._trace_entries = []
+    conn._trace_statements = 0
+
+    def count_statement(_statement):
+        conn._trace_statements += 1
+    conn.set_trace_callback(count_statement)
+
+
+def _finish_trace(conn):
+    tracer = conn._tracer
+    if tracer is None:
+        return
+    entries = conn._trace_entries
+    conn._tracer = None
+    conn._trace_entries = None
+    try:
+        conn.set_trace_callback(None)
+        if entries:
+            tracer.record(conn, entries)
+    except Exception as e:
+        logger.error(f"Hata (QueryTracer.record): {e}")
+
+
+def enable_query_tracing(slow_ms=SLOW_QUERY_MS):
+    """Sorgu izlemeyi açar (yeni kiralanan bağlantılardan itibaren). Açıksa
+    yalnızca yavaş sorgu eşiği güncellenir, toplanan özet korunur."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.slow_ms = slow_ms
+        return
+    from logger_setup import setup_slow_query_logger
+    _tracer = QueryTracer(slow_ms, setup_slow_query_logger())
+    logger.info(f"Sorgu izleme açıldı (yavaş sorgu eşiği: {slow_ms} ms)")
+
+
+def disable_query_tracing():
+    """Sorgu izlemeyi kapatır; kiradaki bağlantılar iade edilirken kayıtlarını yazar."""
+    global _tracer
+    if _tracer is not None:
+        _tracer = None
+        logger.info("Sorgu izleme kapatıldı")
+
+
+def is_query_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def get_query_trace_summary(limit=None) -> list:
+    """İzleme açıldığından beri sorgu başına sayı, süre ve satır özetini döndürür."""
+    tracer = _tracer
+    return tracer.summary(limit) if tracer is not None else []
+
+
+def reset_query_trace():
+    """Toplanan sorgu özetini sıfırlar."""
+    if _tracer is not None:
+        _tracer.reset()
+
+
+_pool = ConnectionPool(DB_PATH)
+
+
+def configure_pool(db_path=None, max_idle=_POOL_MAX_IDLE, profile=DEFAULT_PROFILE):
+    """Mevcut havuzu kapatıp verilen yol için yenisini kurar (testler ve benchmark için)."""
+    global _pool
+    _pool.close_all()
+    _pool = ConnectionPool(db_path or DB_PATH, max_idle=max_idle, profile=profile)
+    return _pool
+
+
+def close_pool():
+    """Uygulama kapanırken havuzdaki tüm bağlantıları kapatır."""
+    _pool.close_all()
+
+
+def set_db_profile(profile_name):
+    """Aktif SQLite profilini değiştirir; yeni bağlantılar bu profille açılır."""
+    _pool.set_profile(profile_name)
+
+
+def get_db_profile() -> str:
+    """Aktif SQLite profilinin adını döndürür."""
+    return _pool.profile
+
+
+def get_write_generation() -> int:
+    """Son yazma işlemiyle artan sayaç; sorgu önbelleklerinin geçerlilik anahtarı."""
+    return _pool.write_generation
+
+
+def get_pool_stats() -> dict:
+    """Havuzun açılan / yeniden kullanılan bağlantı istatistiklerini döndürür."""
+    return _pool.stats()
+
+
 def init_db():
-    """Veritabanını ve 'activities' tablosunu oluşturur (eğer yoksa)."""
+    """Veritabanı şemasını güncel sürüme taşır (bkz. database/migrations.py).
+
+    Havuz başına bir kez çalışır; güncel bir veritabanında maliyeti tek bir
+    PRAGMA user_version okumasıdır.
+    """
+    if _pool.schema_ready:
+        return
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS activities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            type TEXT NOT NULL,         -- dizi, film, kitap, vs.
-            name TEXT NOT NULL,
-            date TEXT NOT NULL,         -- YYYY-MM formatında
-            comment TEXT,
-            rating INTEGER             -- 1-10 arasında
-        )
-        ''')
-        conn.commit()
+        with get_db() as conn:
+            migrate(conn)
+        _pool.schema_ready = True
     except Exception as e:
         logger.critical(f"Veritabanı başlatılırken kritik hata: {e}")
-    finally:
-        if 'conn' in locals() and conn:
-            conn.close()
 
 def get_connection():
-    """Veritabanına yeni bir bağlantı döndürür."""
+    """Havuzdan bir bağlantı döndürür. close() bağlantıyı havuza iade eder."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return _pool.acquire()
     except Exception as e:
         logger.error(f"Veritabanı bağlantısı alınırken hata oluştu: {e}")
         return None
@@ -72,10 +601,9 @@ def get_db():
         with get_db() as conn:
             conn.execute(sql, params)
 
-    Başarıda commit, hata durumunda rollback yapar ve bağlantıyı kapatır.
+    Başarıda commit, hata durumunda rollback yapar ve bağlantıyı havuza iade eder.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = _pool.acquire()
     try:
         yield conn
         conn.commit()
@@ -83,4 +611,19 @@ def get_db():
         conn.rollback()
         raise
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+
+def model_cursor(conn, model):
+    """Satırları sqlite3.Row ara nesnesi oluşturmadan doğrudan modele çeviren cursor.
+
+    model.row_factory(cursor, row) tuple'ı kurucu sırasıyla alır; sorgu
+    kolonları da bu sırayla seçilmelidir. Bağlantının kendi row_factory'si
+    (sqlite3.Row) değişmez.
+
+    Kullanım:
+        rows = model_cursor(conn, Activity).execute(sql, params).fetchall()
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = model.row_factory
+    return cursor
@@ -0,0 +1,173 @@
+# database/maintenance.py
+"""
+Boşta çalışan bakım işleri.
+
+Her iş kendi aralığıyla tanımlanır; son çalışma zamanı settings tablosunda
+(maintenance_last_run.<iş>) tutulur, böylece uygulama yeniden açıldığında
+saatler sıfırlanmaz. run_due() vadesi gelen işleri sırayla ve bir süre
+bütçesi içinde çalıştırır; bütçe dolarsa kalanlar bir sonraki boşta tura kalır.
+
+Uygulamada SettingsController.run_idle_maintenance bunu MainController'daki
+zamanlayıcıdan, son turdan beri yazma olmadıysa çağırır. Elle:
+    python -m database maintenance [--force]
+"""
+import threading
+import time
+
+from constants import SETTING_MAINTENANCE_PREFIX
+from .connection import get_db
+from .migrations import enable_incremental_vacuum
+from .write_queue import execute_write
+from logger_setup import logger
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+MAINTENANCE_BUDGET_S = 2.0              # tek turda bakım işlerine ayrılan süre
+MAINTENANCE_TICK_MIN = 5                # boşta kontrol aralığı (MainController)
+VACUUM_STEP_PAGES = 256                 # incremental_vacuum adımı
+VACUUM_CONVERT_IDLE_MAX_BYTES = 4 * 1024 * 1024   # boşta turda tam VACUUM ile dönüştürülebilecek en büyük dosya
+ANALYSIS_LIMIT = 1000                   # ANALYZE'da indeks başına örneklenen satır
+
+
+def _expire_recommendation_cache(deadline):
+    from .recommendation_repository import RecommendationRepository
+    return f"{RecommendationRepository().clear_expired_cache()} kayıt silindi"
+
+
+def _trim_change_log(deadline):
+    from .repository import ActivityRepository
+    return f"{ActivityRepository().trim_change_log()} kayıt silindi"
+
+
+def _optimize(deadline):
+    with get_db() as conn:
+        conn.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+        conn.execute("PRAGMA optimize")
+    return "tamam"
+
+
+def _analyze(deadline):
+    # analysis_limit ile büyük tablolarda da sınırlı süre; istatistikler
+    # sqlite_stat1'e yazılır ve yeni bağlantıların sorgu planlarında kullanılır
+    with get_db() as conn:
+        conn.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+        conn.execute("ANALYZE")
+    return "tamam"
+
+
+def _incremental_vacuum(deadline):
+    """Boş sayfaları adım adım dosyadan geri verir.
+
+    auto_vacuum henüz INCREMENTAL değilse dönüştürme tam VACUUM'dur (dosya
+    yeniden yazılır, süre bütçesine bölünemez, yazmaları kilitler); boşta turda
+    yalnızca küçük dosyalarda yapılır. Büyük dosya açıkça dönüştürülür:
+        python -m database maintenance --force
+    """
+    with get_db() as conn:
+        if not enable_incremental_vacuum(conn, max_bytes=VACUUM_CONVERT_IDLE_MAX_BYTES):
+            return "auto_vacuum INCREMENTAL değil, dönüştürme için: python -m database maintenance --force"
+        freed = 0
+        while time.monotonic() < deadline:
+            free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if free == 0:
+                break
+            step = min(free, VACUUM_STEP_PAGES)
+            # execute() pragmayı tek adım çalıştırır (tek sayfa); executescript sonuna kadar
+            conn.executescript(f"PRAGMA incremental_vacuum({step})")
+            freed += step
+    return f"{freed} sayfa geri verildi"
+
+
+# (ad, aralık sn, açıklama, iş(deadline) -> özet)
+MAINTENANCE_TASKS = [
+    ("cache_expiry", 6 * HOUR, "Süresi dolmuş öneri önbelleği", _expire_recommendation_cache),
+    ("change_log_trim", DAY, "Değişiklik günlüğü budama", _trim_change_log),
+    ("optimize", 6 * HOUR, "PRAGMA optimize", _optimize),
+    ("incremental_vacuum", DAY, "Boş sayfaların geri verilmesi", _incremental_vacuum),
+    ("analyze", 7 * DAY, "ANALYZE istatistikleri", _analyze),
+]
+
+
+class MaintenanceScheduler:
+    """Vadesi gelen bakım işlerini süre bütçesi içinde çalıştırır."""
+
+    def __init__(self, tasks=None, budget_s=MAINTENANCE_BUDGET_S, clock=time.time):
+        self.tasks = MAINTENANCE_TASKS if tasks is None else tasks
+        self.budget_s = budget_s
+        self.clock = clock
+        self._lock = threading.Lock()   # aynı anda tek tur
+
+    def last_runs(self) -> dict:
+        """{iş adı: son çalışma (epoch sn)} — hiç çalışmamış işler yer almaz."""
+        with get_db() as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM settings WHERE key LIKE ?", (SETTING_MAINTENANCE_PREFIX + "%",)
+            ).fetchall()
+        last = {}
+        for key, value in rows:
+            try:
+                last[key[len(SETTING_MAINTENANCE_PREFIX):]] = float(value)
+            except (TypeError, ValueError):
+                continue
+        return last
+
+    def due_tasks(self) -> list:
+        """Vadesi gelmiş işlerin adları, en çok gecikenden başlayarak."""
+        now = self.clock()
+        last = self.last_runs()
+        overdue = [
+            (now - last.get(name, 0) - interval, name)
+            for name, interval, _, _ in self.tasks
+            if now - last.get(name, 0) >= interval
+        ]
+        return [name for _, name in sorted(overdue, reverse=True)]
+
+    def run_due(self, force=False, budget_s=None) -> dict:
+        """Vadesi gelen (force=True ise tüm) işleri çalıştırır: {ad: özet}.
+
+        Her turda en az bir iş çalışır; bütçe dolunca kalanlar ertelenir.
+        """
+        if not self._lock.acquire(blocking=False):
+            return {}
+        try:
+            budget = self.budget_s if budget_s is None else budget_s
+            deadline = time.monotonic() + budget
+            names = [name for name, *_ in self.tasks] if force else self.due_tasks()
+            tasks = {name: (description, func) for name, _, description, func in self.tasks}
+            results = {}
+            for name in names:
+                if results and time.monotonic() >= deadline:
+                    logger.info(f"Bakım bütçesi doldu, ertelenen işler: {', '.join(names[len(results):])}")
+                    break
+                description, func = tasks[name]
+                start = time.perf_counter()
+                try:
+                    results[name] = func(deadline)
+                except Exception as e:
+                    # Hatalı iş bir sonraki aralığa kadar tekrar denenmez
+                    logger.error(f"Hata (MaintenanceScheduler.{name}): {e}")
+                    results[name] = f"hata: {e}"
+                elapsed = (time.perf_counter() - start) * 1000
+                logger.info(f"Bakım: {description} — {results[name]} ({elapsed:.0f} ms)")
+                self._mark_run(name)
+            return results
+        finally:
+            self._lock.release()
+
+    def _mark_run(self, name):
+        try:
+            execute_write(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                (SETTING_MAINTENANCE_PREFIX + name, str(int(self.clock()))),
+            )
+        except Exception as e:
+            logger.error(f"Hata (MaintenanceScheduler._mark_run): {e}")
+
+
+_scheduler = MaintenanceScheduler()
+
+
+def run_maintenance(force=False) -> dict:
+    """Arka plan işi: vadesi gelen bakım işlerini çalıştırır."""
+    return _scheduler.run_due(force=force)
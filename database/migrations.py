@@ -0,0 +1,635 @@
+# database/migrations.py
+"""
+Sürümlü şema migration'ları.
+
+Veritabanının şema sürümü `PRAGMA user_version` içinde tutulur. MIGRATIONS
+listesi sıralı adımları içerir; eksik adımlar tek bir işlemde (BEGIN IMMEDIATE)
+uygulanır ve sürüm aynı işlemde yazılır. Güncel bir veritabanında başlangıç
+maliyeti tek bir PRAGMA okumasıdır.
+
+Yeni şema değişikliği: listenin sonuna bir sonraki sürüm numarasıyla yeni bir
+fonksiyon eklenir. Yayınlanmış adımlar değiştirilmez.
+"""
+import sqlite3
+from functools import lru_cache
+
+from constants import FAALIYET_TURLERI
+from logger_setup import logger
+from .type_key import type_key, type_key_sql, normalize_type_name
+
+_FTS_TRIGGERS = {
+    "activities_fts_ai": '''
+        CREATE TRIGGER IF NOT EXISTS activities_fts_ai AFTER INSERT ON activities BEGIN
+            INSERT INTO activities_fts(rowid, name, comment) VALUES (new.id, new.name, new.comment);
+        END
+    ''',
+    "activities_fts_ad": '''
+        CREATE TRIGGER IF NOT EXISTS activities_fts_ad AFTER DELETE ON activities BEGIN
+            INSERT INTO activities_fts(activities_fts, rowid, name, comment)
+            VALUES ('delete', old.id, old.name, old.comment);
+        END
+    ''',
+    "activities_fts_au": '''
+        CREATE TRIGGER IF NOT EXISTS activities_fts_au AFTER UPDATE OF name, comment ON activities BEGIN
+            INSERT INTO activities_fts(activities_fts, rowid, name, comment)
+            VALUES ('delete', old.id, old.name, old.comment);
+            INSERT INTO activities_fts(rowid, name, comment) VALUES (new.id, new.name, new.comment);
+        END
+    ''',
+}
+
+
+# Aylık özet tablosu: (yıl, ay, tür) başına kayıt sayısı ve puan toplamları.
+# Yıl/ay başlangıç tarihinden (date) alınır; istatistik sorgularıyla aynı kural.
+_AGG_KEY_NEW = "CAST(substr(new.date, 1, 4) AS INTEGER), CAST(substr(new.date, 6, 2) AS INTEGER), new.type"
+_AGG_ADD_NEW = f'''
+            INSERT INTO activity_monthly_agg (year, month, type, count, rating_sum, rated_count)
+            VALUES ({_AGG_KEY_NEW}, 1,
+                    CASE WHEN new.rating > 0 THEN new.rating ELSE 0 END,
+                    CASE WHEN new.rating > 0 THEN 1 ELSE 0 END)
+            ON CONFLICT (year, month, type) DO UPDATE SET
+                count = count + 1,
+                rating_sum = rating_sum + excluded.rating_sum,
+                rated_count = rated_count + excluded.rated_count;
+'''
+_AGG_REMOVE_OLD = '''
+            UPDATE activity_monthly_agg SET
+                count = count - 1,
+                rating_sum = rating_sum - CASE WHEN old.rating > 0 THEN old.rating ELSE 0 END,
+                rated_count = rated_count - CASE WHEN old.rating > 0 THEN 1 ELSE 0 END
+            WHERE year = CAST(substr(old.date, 1, 4) AS INTEGER)
+              AND month = CAST(substr(old.date, 6, 2) AS INTEGER)
+              AND type = old.type;
+            DELETE FROM activity_monthly_agg
+            WHERE year = CAST(substr(old.date, 1, 4) AS INTEGER)
+              AND month = CAST(substr(old.date, 6, 2) AS INTEGER)
+              AND type = old.type AND count <= 0;
+'''
+_AGG_TRIGGERS = {
+    "activity_monthly_agg_ai": f"CREATE TRIGGER IF NOT EXISTS activity_monthly_agg_ai AFTER INSERT ON activities BEGIN {_AGG_ADD_NEW} END",
+    "activity_monthly_agg_ad": f"CREATE TRIGGER IF NOT EXISTS activity_monthly_agg_ad AFTER DELETE ON activities BEGIN {_AGG_REMOVE_OLD} END",
+    "activity_monthly_agg_au": (
+        f"CREATE TRIGGER IF NOT EXISTS activity_monthly_agg_au AFTER UPDATE OF date, type, rating ON activities "
+        f"BEGIN {_AGG_REMOVE_OLD} {_AGG_ADD_NEW} END"
+    ),
+}
+
+
+# Değişiklik günlüğü (change data capture): her yazma, arayüzün tam yeniden
+# yükleme yapmadan uygulayabileceği bir delta satırı bırakır.
+_CHANGE_COLUMNS = "op, activity_id, old_type, old_date, old_end_date, old_rating, new_type, new_date, new_end_date, new_rating"
+_CHANGE_TRIGGERS = {
+    "activity_changes_ai": f'''
+        CREATE TRIGGER IF NOT EXISTS activity_changes_ai AFTER INSERT ON activities BEGIN
+            INSERT INTO activity_changes ({_CHANGE_COLUMNS})
+            VALUES ('I', new.id, NULL, NULL, NULL, NULL, new.type, new.date, new.end_date, new.rating);
+        END
+    ''',
+    "activity_changes_ad": f'''
+        CREATE TRIGGER IF NOT EXISTS activity_changes_ad AFTER DELETE ON activities BEGIN
+            INSERT INTO activity_changes ({_CHANGE_COLUMNS})
+            VALUES ('D', old.id, old.type, old.date, old.end_date, old.rating, NULL, NULL, NULL, NULL);
+        END
+    ''',
+    "activity_changes_au": f'''
+        CREATE TRIGGER IF NOT EXISTS activity_changes_au AFTER UPDATE ON activities BEGIN
+            INSERT INTO activity_changes ({_CHANGE_COLUMNS})
+            VALUES ('U', new.id, old.type, old.date, old.end_date, old.rating,
+                    new.type, new.date, new.end_date, new.rating);
+        END
+    ''',
+}
+
+
+# Tarih aralığı indeksi: her faaliyet [başlangıç, bitiş] gün aralığı olarak
+# R*Tree'de tutulur. Gün anahtarı YYYYMMDD tamsayısıdır ('YYYY-MM' -> YYYYMM00);
+# sıralaması tarih metninin sıralamasıyla aynıdır.
+def day_key_sql(column: str) -> str:
+    """Tarih metnini (YYYY, YYYY-MM, YYYY-MM-DD) YYYYMMDD tamsayısına çeviren SQL ifadesi."""
+    return f"CAST(replace(substr({column} || '-00-00', 1, 10), '-', '') AS INTEGER)"
+
+
+def day_key(value: str) -> int:
+    """day_key_sql'in Python karşılığı (sorgu sınırları için)."""
+    return int((value + "-00-00")[:10].replace("-", ""))
+
+
+def _interval_values(prefix: str) -> str:
+    start = day_key_sql(f"{prefix}date")
+    end = day_key_sql(f"COALESCE({prefix}end_date, {prefix}date)")
+    # Bitişi başlangıçtan önce olan hatalı kayıtlarda kutu çevrilir (R*Tree min <= max ister)
+    return f"{prefix}id, min({start}, {end}), max({start}, {end})"
+
+
+_INTERVAL_TRIGGERS = {
+    "activities_interval_ai": f'''
+        CREATE TRIGGER IF NOT EXISTS activities_interval_ai AFTER INSERT ON activities BEGIN
+            INSERT INTO activities_interval (id, start_day, end_day) VALUES ({_interval_values("new.")});
+        END
+    ''',
+    "activities_interval_ad": '''
+        CREATE TRIGGER IF NOT EXISTS activities_interval_ad AFTER DELETE ON activities BEGIN
+            DELETE FROM activities_interval WHERE id = old.id;
+        END
+    ''',
+    "activities_interval_au": f'''
+        CREATE TRIGGER IF NOT EXISTS activities_interval_au AFTER UPDATE OF date, end_date ON activities BEGIN
+            INSERT OR REPLACE INTO activities_interval (id, start_day, end_day) VALUES ({_interval_values("new.")});
+        END
+    ''',
+}
+
+# activity_names: otomatik tamamlama için isim başına kullanım sayısı ve son tarih.
+# Görünen ad, en yeni tarihli kaydın yazımıdır.
+_NAME_ADD_NEW = f'''
+            INSERT INTO activity_names (name_key, name, uses, last_date)
+            VALUES ({type_key_sql("new.name")}, new.name, 1, new.date)
+            ON CONFLICT(name_key) DO UPDATE SET
+                uses = uses + 1,
+                name = CASE WHEN excluded.last_date >= last_date THEN excluded.name ELSE name END,
+                last_date = max(last_date, excluded.last_date);
+'''
+# Silmede son tarih geri hesaplanmaz (sıralamada yaklaşık yenilik yeterli)
+_NAME_REMOVE_OLD = f'''
+            UPDATE activity_names SET uses = uses - 1 WHERE name_key = {type_key_sql("old.name")};
+            DELETE FROM activity_names WHERE name_key = {type_key_sql("old.name")} AND uses <= 0;
+'''
+_NAME_TRIGGERS = {
+    "activity_names_ai": f"CREATE TRIGGER IF NOT EXISTS activity_names_ai AFTER INSERT ON activities BEGIN {_NAME_ADD_NEW} END",
+    "activity_names_ad": f"CREATE TRIGGER IF NOT EXISTS activity_names_ad AFTER DELETE ON activities BEGIN {_NAME_REMOVE_OLD} END",
+    "activity_names_au": f'''
+        CREATE TRIGGER IF NOT EXISTS activity_names_au AFTER UPDATE OF name, date ON activities BEGIN
+            {_NAME_REMOVE_OLD}
+            {_NAME_ADD_NEW}
+        END
+    ''',
+}
+
+# İsim anahtarları üzerinde trigram FTS5 indeksi (isim içinde geçen metin araması)
+_NAME_FTS_TRIGGERS = {
+    "activity_names_fts_ai": '''
+        CREATE TRIGGER IF NOT EXISTS activity_names_fts_ai AFTER INSERT ON activity_names BEGIN
+            INSERT INTO activity_names_fts(rowid, name_key) VALUES (new.id, new.name_key);
+        END
+    ''',
+    "activity_names_fts_ad": '''
+        CREATE TRIGGER IF NOT EXISTS activity_names_fts_ad AFTER DELETE ON activity_names BEGIN
+            INSERT INTO activity_names_fts(activity_names_fts, rowid, name_key) VALUES ('delete', old.id, old.name_key);
+        END
+    ''',
+    "activity_names_fts_au": '''
+        CREATE TRIGGER IF NOT EXISTS activity_names_fts_au AFTER UPDATE OF name_key ON activity_names BEGIN
+            INSERT INTO activity_names_fts(activity_names_fts, rowid, name_key) VALUES ('delete', old.id, old.name_key);
+            INSERT INTO activity_names_fts(rowid, name_key) VALUES (new.id, new.name_key);
+        END
+    ''',
+}
+
+
+@lru_cache(maxsize=1)
+def fts5_supported() -> bool:
+    """SQLite kütüphanesinin FTS5 ile derlenip derlenmediğini bellek içi bağlantıda dener."""
+    probe = sqlite3.connect(":memory:")
+    try:
+        probe.execute("CREATE VIRTUAL TABLE fts5_probe USING fts5(x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        probe.close()
+
+
+def create_fts_index(conn) -> bool:
+    """activities_fts tablosunu ve trigger'larını kurar, indeksi baştan doldurur.
+    FTS5 yoksa trigger'ları kaldırır (aksi halde her yazma hata verir) ve False döner."""
+    if not fts5_supported():
+        for trigger in _FTS_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        logger.warning("FTS5 desteklenmiyor; arama LIKE ile yapılacak.")
+        return False
+
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS activities_fts USING fts5(
+            name, comment,
+            content='activities', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    ''')
+    for sql in _FTS_TRIGGERS.values():
+        conn.execute(sql)
+    conn.execute("INSERT INTO activities_fts(activities_fts) VALUES ('rebuild')")
+    logger.info("FTS indeksi oluşturuldu: activities_fts")
+    return True
+
+
+@lru_cache(maxsize=1)
+def rtree_supported() -> bool:
+    """SQLite kütüphanesinin R*Tree modülüyle derlenip derlenmediğini bellek içi bağlantıda dener."""
+    probe = sqlite3.connect(":memory:")
+    try:
+        probe.execute("CREATE VIRTUAL TABLE rtree_probe USING rtree_i32(id, lo, hi)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        probe.close()
+
+
+def create_interval_index(conn) -> bool:
+    """activities_interval (R*Tree) tablosunu ve trigger'larını kurar, indeksi baştan doldurur.
+    R*Tree yoksa trigger'ları kaldırır ve False döner; dönem filtresi yalnız B-tree ile yapılır."""
+    if not rtree_supported():
+        for trigger in _INTERVAL_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        logger.warning("R*Tree desteklenmiyor; dönem filtresi aralık indeksi olmadan yapılacak.")
+        return False
+
+    conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS activities_interval USING rtree_i32(id, start_day, end_day)")
+    for sql in _INTERVAL_TRIGGERS.values():
+        conn.execute(sql)
+    conn.execute("DELETE FROM activities_interval")
+    conn.execute(
+        f"INSERT INTO activities_interval (id, start_day, end_day) SELECT {_interval_values('')} FROM activities"
+    )
+    logger.info("Tarih aralığı indeksi oluşturuldu: activities_interval")
+    return True
+
+
+@lru_cache(maxsize=1)
+def trigram_supported() -> bool:
+    """FTS5 trigram tokenizer'ı (SQLite 3.34+) bellek içi bağlantıda dener."""
+    probe = sqlite3.connect(":memory:")
+    try:
+        probe.execute("CREATE VIRTUAL TABLE trigram_probe USING fts5(x, tokenize='trigram')")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        probe.close()
+
+
+def create_name_index(conn) -> bool:
+    """activity_names tablosunu, trigger'larını ve (destekleniyorsa) trigram
+    indeksini kurar; activities üzerinden baştan doldurur. Trigram yoksa
+    FTS trigger'larını kaldırır ve False döner (içinde geçen arama LIKE ile yapılır)."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS activity_names (
+            id INTEGER PRIMARY KEY,
+            name_key TEXT NOT NULL UNIQUE,      -- type_key ile katlanmış ad
+            name TEXT NOT NULL,
+            uses INTEGER NOT NULL DEFAULT 0,
+            last_date TEXT
+        )
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_activity_names_rank ON activity_names(uses DESC, last_date DESC)")
+    for sql in _NAME_TRIGGERS.values():
+        conn.execute(sql)
+
+    trigram = trigram_supported()
+    if trigram:
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS activity_names_fts USING fts5("
+            "name_key, content='activity_names', content_rowid='id', tokenize='trigram')"
+        )
+        for sql in _NAME_FTS_TRIGGERS.values():
+            conn.execute(sql)
+    else:
+        for trigger in _NAME_FTS_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        logger.warning("FTS5 trigram desteklenmiyor; isim içinde geçen arama LIKE ile yapılacak.")
+
+    conn.execute("DELETE FROM activity_names")
+    # MAX(date) ile seçilen satırın adı: en yeni kaydın yazımı
+    conn.execute(f'''
+        INSERT INTO activity_names (name_key, name, uses, last_date)
+        SELECT {type_key_sql("name")} AS k, name, COUNT(*), MAX(date)
+        FROM activities GROUP BY k
+    ''')
+    if trigram:
+        conn.execute("INSERT INTO activity_names_fts(activity_names_fts) VALUES ('rebuild')")
+    logger.info("İsim indeksi oluşturuldu: activity_names")
+    return trigram
+
+
+def rebuild_monthly_agg(conn):
+    """activity_monthly_agg tablosunu activities üzerinden baştan hesaplar."""
+    conn.execute("DELETE FROM activity_monthly_agg")
+    conn.execute('''
+        INSERT INTO activity_monthly_agg (year, month, type, count, rating_sum, rated_count)
+        SELECT CAST(substr(date, 1, 4) AS INTEGER), CAST(substr(date, 6, 2) AS INTEGER), type,
+               COUNT(*),
+               COALESCE(SUM(CASE WHEN rating > 0 THEN rating END), 0),
+               COUNT(CASE WHEN rating > 0 THEN 1 END)
+        FROM activities
+        GROUP BY 1, 2, 3
+    ''')
+    logger.info("Aylık özet tablosu yeniden hesaplandı: activity_monthly_agg")
+
+
+def _columns(conn, table):
+    # table_xinfo üretilmiş (generated) kolonları da listeler
+    return {row[1] for row in conn.execute(f"PRAGMA table_xinfo({table})").fetchall()}
+
+
+# --- Migration adımları ---
+
+def _base_tables(conn):
+    """Temel tablolar. Sürüm takibinden önceki veritabanlarında eksik kolonlar eklenir."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS activities (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT NOT NULL,         -- dizi, film, kitap, vs.
+            name TEXT NOT NULL,
+            date TEXT NOT NULL,         -- YYYY-MM-DD formatında
+            comment TEXT,
+            rating INTEGER,             -- 1-10 arasında
+            end_date TEXT
+        )
+    ''')
+    if "end_date" not in _columns(conn, "activities"):
+        conn.execute("ALTER TABLE activities ADD COLUMN end_date TEXT")
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS folders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS plans (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            scope TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            month INTEGER,
+            status TEXT DEFAULT 'planned',
+            progress INTEGER DEFAULT 0,
+            priority TEXT DEFAULT 'medium',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            folder_id INTEGER REFERENCES folders(id) ON DELETE SET NULL
+        )
+    ''')
+    if "folder_id" not in _columns(conn, "plans"):
+        conn.execute("ALTER TABLE plans ADD COLUMN folder_id INTEGER REFERENCES folders(id) ON DELETE SET NULL")
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS activity_types (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        )
+    ''')
+    if conn.execute("SELECT COUNT(*) FROM activity_types").fetchone()[0] == 0:
+        conn.executemany("INSERT OR IGNORE INTO activity_types (name) VALUES (?)", [(t,) for t in FAALIYET_TURLERI])
+        logger.info("Varsayılan faaliyet türleri eklendi.")
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recommendation_cache (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT NOT NULL,
+            period TEXT NOT NULL,
+            genre TEXT DEFAULT 'all',
+            is_turkish INTEGER DEFAULT 0,
+            external_id TEXT,
+            title TEXT NOT NULL,
+            description TEXT,
+            rating REAL DEFAULT 0,
+            image_url TEXT,
+            release_date TEXT,
+            content_type TEXT,
+            page INTEGER DEFAULT 1,
+            fetched_at TEXT NOT NULL,
+            UNIQUE(category, period, genre, is_turkish, external_id)
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_cache_lookup
+        ON recommendation_cache(category, period, genre, is_turkish, page)
+    ''')
+
+
+def _normalize_month_dates(conn):
+    """Eski 'YYYY-MM' tarihlerini 'YYYY-MM-01' biçimine çevirir."""
+    normalized = conn.execute("UPDATE activities SET date = date || '-01' WHERE length(date) = 7").rowcount
+    if normalized > 0:
+        logger.info(f"Tarih formati normalize edildi: {normalized} kayit YYYY-MM -> YYYY-MM-01")
+
+
+def _type_key_and_indexes(conn):
+    """Türkçe katlanmış type_key kolonu ve sorgu indeksleri."""
+    if "type_key" not in _columns(conn, "activities"):
+        conn.execute(
+            f"ALTER TABLE activities ADD COLUMN type_key TEXT "
+            f"GENERATED ALWAYS AS ({type_key_sql('type')}) VIRTUAL"
+        )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_activities_date ON activities(date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_activities_type_key_date ON activities(type_key, date)")
+    conn.execute("DROP INDEX IF EXISTS idx_activities_type")
+    conn.execute("DROP INDEX IF EXISTS idx_activities_type_date")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_plans_scope_year ON plans(scope, year, month)")
+
+
+def _fts_index(conn):
+    """İsim ve yorumlar için FTS5 indeksi."""
+    create_fts_index(conn)
+
+
+def _monthly_agg(conn):
+    """Trigger ile güncellenen aylık özet tablosu."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS activity_monthly_agg (
+            year INTEGER NOT NULL,
+            month INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            rating_sum INTEGER NOT NULL DEFAULT 0,   -- yalnızca puanlı (rating > 0) kayıtlar
+            rated_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (year, month, type)
+        ) WITHOUT ROWID
+    ''')
+    for sql in _AGG_TRIGGERS.values():
+        conn.execute(sql)
+    rebuild_monthly_agg(conn)
+
+
+def _change_log(conn):
+    """Arayüzün artımlı güncellemesi için trigger ile doldurulan değişiklik günlüğü."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS activity_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            op TEXT NOT NULL,               -- 'I' ekleme, 'U' güncelleme, 'D' silme
+            activity_id INTEGER NOT NULL,
+            old_type TEXT, old_date TEXT, old_end_date TEXT, old_rating INTEGER,
+            new_type TEXT, new_date TEXT, new_end_date TEXT, new_rating INTEGER
+        )
+    ''')
+    for sql in _CHANGE_TRIGGERS.values():
+        conn.execute(sql)
+
+
+def _interval_index(conn):
+    """Dönemle çakışan kayıtlar (date .. end_date) için R*Tree aralık indeksi."""
+    create_interval_index(conn)
+
+
+def _name_index(conn):
+    """Otomatik tamamlama için isim tablosu ve trigram indeksi."""
+    create_name_index(conn)
+
+
+def _normalize_types(conn):
+    """Eski kayıtlardaki tür yazımlarını tek biçime indirir ve kullanılan türleri kaydeder.
+
+    Aynı type_key'e sahip yazımlar ('film', 'FİLM', ' Film') birleştirilir: kayıtlı
+    olan, aralarında da en çok kullanılan yazım kalır. Bundan sonra normalizasyon
+    yazma sırasında yapılır (type_repository.resolve_type); açılışta tarama gerekmez.
+    """
+    # Kullanılan yazımlar özet tablosundan: activities taranmaz
+    usage = dict(conn.execute(
+        "SELECT type, SUM(count) FROM activity_monthly_agg WHERE type IS NOT NULL GROUP BY type"
+    ).fetchall())
+    registered = {row[0] for row in conn.execute("SELECT name FROM activity_types")}
+
+    groups = {}
+    for name in set(usage) | registered:
+        normalized = normalize_type_name(name)
+        if normalized:
+            groups.setdefault(type_key(normalized), []).append(name)
+
+    renamed = 0
+    for names in groups.values():
+        best = min(names, key=lambda n: (n not in registered, -usage.get(n, 0), n))
+        canonical = normalize_type_name(best)
+        for name in names:
+            if name != canonical and name in usage:
+                renamed += conn.execute(
+                    f"UPDATE activities SET type = ? WHERE type_key = {type_key_sql('?')} AND type = ?",
+                    (canonical, name, name),
+                ).rowcount
+        conn.executemany(
+            "DELETE FROM activity_types WHERE name = ?",
+            [(name,) for name in names if name in registered and name != canonical],
+        )
+        conn.execute("INSERT OR IGNORE INTO activity_types (name) VALUES (?)", (canonical,))
+    if renamed:
+        logger.info(f"Tür yazımları normalize edildi: {renamed} kayıt")
+
+
+def _cache_read_index(conn):
+    """Öneri önbelleği okuma indeksi: anahtar + sayfa + fetched_at.
+
+    Süre kontrolü (fetched_at > ?) indeksten yapılır; get_max_cached_page ve
+    has_valid_cache tabloya hiç gitmez. Aynı önekli eski indeks gereksizleşir.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_cache_lookup")
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_cache_page_read
+        ON recommendation_cache(category, period, genre, is_turkish, page, fetched_at)
+    ''')
+
+
+def _cache_position(conn):
+    """Öneri önbelleğine API sırası (position) ve sırayı da içeren okuma indeksi.
+
+    Upsert satırları yerinde güncellediği için id artık API sırasını izlemez;
+    sayfalar (page, position) sırasında okunur. Mevcut satırların position'ı
+    sayfa içindeki id sırasından doldurulur.
+    """
+    if "position" not in _columns(conn, "recommendation_cache"):
+        conn.execute("ALTER TABLE recommendation_cache ADD COLUMN position INTEGER NOT NULL DEFAULT 0")
+    conn.execute('''
+        UPDATE recommendation_cache SET position = (
+            SELECT COUNT(*) FROM recommendation_cache AS r
+            WHERE r.category = recommendation_cache.category AND r.period = recommendation_cache.period
+                  AND r.genre = recommendation_cache.genre AND r.is_turkish = recommendation_cache.is_turkish
+                  AND r.page = recommendation_cache.page AND r.id < recommendation_cache.id
+        )
+    ''')
+    conn.execute("DROP INDEX IF EXISTS idx_cache_page_read")
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_cache_page_rank
+        ON recommendation_cache(category, period, genre, is_turkish, page, position, fetched_at)
+    ''')
+
+
+# (sürüm, açıklama, adım) — sıralı ve boşluksuz olmalıdır
+MIGRATIONS = [
+    (1, "Temel tablolar", _base_tables),
+    (2, "YYYY-MM tarihleri normalize edildi", _normalize_month_dates),
+    (3, "type_key kolonu ve indeksler", _type_key_and_indexes),
+    (4, "FTS5 arama indeksi", _fts_index),
+    (5, "Aylık özet tablosu", _monthly_agg),
+    (6, "Değişiklik günlüğü (activity_changes)", _change_log),
+    (7, "Tarih aralığı R*Tree indeksi", _interval_index),
+    (8, "Otomatik tamamlama isim indeksi", _name_index),
+    (9, "Tür yazımları normalize edildi", _normalize_types),
+    (10, "Öneri önbelleği okuma indeksi", _cache_read_index),
+    (11, "Öneri önbelleği sıra kolonu (position)", _cache_position),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def enable_incremental_vacuum(conn, max_bytes=None) -> bool:
+    """auto_vacuum'u INCREMENTAL yapar; boş sayfalar PRAGMA incremental_vacuum ile
+    dosyadan geri verilebilir (bkz. database/maintenance.py).
+
+    Tablo içeren veritabanında mod ancak VACUUM ile değişir (tüm dosya yeniden
+    yazılır); dosya max_bytes'tan büyükse dönüştürme atlanır ve False döner.
+    Açık işlem içinde çağrılmamalıdır.
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return True
+    if max_bytes is not None:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        if conn.execute("PRAGMA page_count").fetchone()[0] * page_size > max_bytes:
+            return False
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("VACUUM")
+    logger.info("auto_vacuum = INCREMENTAL olarak ayarlandı")
+    return True
+
+
+def migrate(conn, migrations=None) -> int:
+    """Eksik migration'ları tek işlemde uygular ve ulaşılan sürümü döndürür.
+
+    Bir adım hata verirse işlem geri alınır; veritabanı önceki sürümde kalır.
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    target = migrations[-1][0]
+
+    current = get_schema_version(conn)
+    if current >= target:
+        if current > target:
+            logger.warning(f"Veritabanı şema sürümü ({current}) uygulamanınkinden ({target}) yeni.")
+        return current
+
+    if current == 0 and conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0:
+        # Yeni veritabanı: tablolar oluşmadan dönüştürmek bedava
+        enable_incremental_vacuum(conn)
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Kilit alınana kadar başka bir süreç migration'ı tamamlamış olabilir
+        current = get_schema_version(conn)
+        for version, description, step in migrations:
+            if version <= current:
+                continue
+            step(conn)
+            logger.info(f"Şema migration uygulandı: v{version} - {description}")
+        conn.execute(f"PRAGMA user_version = {target}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return target
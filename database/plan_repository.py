@@ -1,5 +1,6 @@
 # database/plan_repository.py
-from .connection import get_db
+from .connection import get_db, init_db, model_cursor
+from .write_queue import execute_write
 from models import Plan, Folder
 from logger_setup import logger
 
@@ -8,32 +9,16 @@ class PlanRepository:
     """Plan, hedef ve klasör işlemleri için veritabanı sınıfı."""
 
     def __init__(self):
-        self.ensure_folders_table_exists()
-        self.ensure_plans_table_exists()
+        init_db()
 
     # --- Klasör (Folder) İşlemleri ---
 
-    def ensure_folders_table_exists(self):
-        """Folders tablosunu oluşturur."""
-        sql = '''
-            CREATE TABLE IF NOT EXISTS folders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        '''
-        try:
-            with get_db() as conn:
-                conn.execute(sql)
-        except Exception as e:
-            logger.error(f"Hata (PlanRepository.ensure_folders_table_exists): {e}")
-
     def get_folders(self) -> list:
         """Tüm klasörleri getirir."""
         sql = "SELECT id, name, created_at FROM folders ORDER BY name"
         try:
             with get_db() as conn:
-                return [Folder.from_row(row) for row in conn.execute(sql).fetchall()]
+                return model_cursor(conn, Folder).execute(sql).fetchall()
         except Exception as e:
             logger.error(f"Hata (PlanRepository.get_folders): {e}")
             return []
@@ -41,8 +26,7 @@ class PlanRepository:
     def add_folder(self, name: str) -> bool:
         """Yeni klasör ekler."""
         try:
-            with get_db() as conn:
-                conn.execute("INSERT INTO folders (name) VALUES (?)", (name,))
+            execute_write("INSERT INTO folders (name) VALUES (?)", (name,))
             return True
         except Exception as e:
             logger.error(f"Hata (PlanRepository.add_folder): {e}")
@@ -51,8 +35,7 @@ class PlanRepository:
     def update_folder(self, folder_id: int, name: str) -> bool:
         """Klasör ismini günceller."""
         try:
-            with get_db() as conn:
-                conn.execute("UPDATE folders SET name=? WHERE id=?", (name, folder_id))
+            execute_write("UPDATE folders SET name=? WHERE id=?", (name, folder_id))
             return True
         except Exception as e:
             logger.error(f"Hata (PlanRepository.update_folder): {e}")
@@ -61,53 +44,72 @@ class PlanRepository:
     def delete_folder(self, folder_id: int) -> bool:
         """Klasörü siler. İçindeki planların folder_id'si NULL olur (ON DELETE SET NULL)."""
         try:
-            with get_db() as conn:
-                conn.execute("DELETE FROM folders WHERE id=?", (folder_id,))
+            execute_write("DELETE FROM folders WHERE id=?", (folder_id,))
             return True
         except Exception as e:
             logger.error(f"Hata (PlanRepository.delete_folder): {e}")
             return False
 
+    def add_folders(self, folders: list):
+        """Klasörleri tek işlemde ekler ve yeni ID'leri aynı sırayla döndürür
+        (içe aktarmada planların folder_id eşlemesi için). Hata olursa None."""
+        try:
+            with get_db() as conn:
+                return [
+                    conn.execute(
+                        "INSERT INTO folders (name, created_at) VALUES (?, COALESCE(?, CURRENT_TIMESTAMP))",
+                        (folder.name, folder.created_at or None),
+                    ).lastrowid
+                    for folder in folders
+                ]
+        except Exception as e:
+            logger.error(f"Hata (PlanRepository.add_folders): {e}")
+            return None
+
+    def iter_folders(self, batch_size: int = 500):
+        """Tüm klasörleri ID sırasıyla fetchmany ile üretir (dışa aktarma)."""
+        with get_db() as conn:
+            cursor = model_cursor(conn, Folder).execute("SELECT id, name, created_at FROM folders ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+
     # --- Plan / Hedef İşlemleri ---
 
-    def ensure_plans_table_exists(self):
-        """Plans tablosunu oluşturur."""
+    def add_plan(self, plan: Plan) -> bool:
+        """Yeni plan ekler."""
         sql = '''
-            CREATE TABLE IF NOT EXISTS plans (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                scope TEXT NOT NULL,
-                year INTEGER NOT NULL,
-                month INTEGER,
-                status TEXT DEFAULT 'planned',
-                progress INTEGER DEFAULT 0,
-                priority TEXT DEFAULT 'medium',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                folder_id INTEGER REFERENCES folders(id) ON DELETE SET NULL
-            )
+            INSERT INTO plans (title, description, scope, year, month, status, progress, priority, created_at, folder_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
         try:
-            with get_db() as conn:
-                conn.execute(sql)
+            execute_write(sql, (
+                plan.title, plan.description, plan.scope, plan.year, plan.month,
+                plan.status, plan.progress, plan.priority, plan.created_at, plan.folder_id
+            ))
+            return True
         except Exception as e:
-            logger.error(f"Hata (PlanRepository.ensure_plans_table_exists): {e}")
+            logger.error(f"Hata (PlanRepository.add_plan): {e}")
+            return False
 
-    def add_plan(self, plan: Plan) -> bool:
-        """Yeni plan ekler."""
+    def add_plans(self, plans: list) -> bool:
+        """Planları tek işlemde executemany ile ekler (toplu içe aktarma)."""
         sql = '''
             INSERT INTO plans (title, description, scope, year, month, status, progress, priority, created_at, folder_id)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         '''
         try:
             with get_db() as conn:
-                conn.execute(sql, (
-                    plan.title, plan.description, plan.scope, plan.year, plan.month,
-                    plan.status, plan.progress, plan.priority, plan.created_at, plan.folder_id
+                conn.executemany(sql, (
+                    (p.title, p.description, p.scope, p.year, p.month,
+                     p.status, p.progress, p.priority, p.created_at, p.folder_id)
+                    for p in plans
                 ))
             return True
         except Exception as e:
-            logger.error(f"Hata (PlanRepository.add_plan): {e}")
+            logger.error(f"Hata (PlanRepository.add_plans): {e}")
             return False
 
     def update_plan(self, plan: Plan) -> bool:
@@ -118,11 +120,10 @@ class PlanRepository:
             WHERE id=?
         '''
         try:
-            with get_db() as conn:
-                conn.execute(sql, (
-                    plan.title, plan.description, plan.status,
-                    plan.progress, plan.priority, plan.folder_id, plan.id
-                ))
+            execute_write(sql, (
+                plan.title, plan.description, plan.status,
+                plan.progress, plan.priority, plan.folder_id, plan.id
+            ))
             return True
         except Exception as e:
             logger.error(f"Hata (PlanRepository.update_plan): {e}")
@@ -131,8 +132,7 @@ class PlanRepository:
     def update_plan_progress(self, plan_id: int, progress: int, status: str) -> bool:
         """Sadece ilerleme ve durumu günceller."""
         try:
-            with get_db() as conn:
-                conn.execute("UPDATE plans SET progress=?, status=? WHERE id=?", (progress, status, plan_id))
+            execute_write("UPDATE plans SET progress=?, status=? WHERE id=?", (progress, status, plan_id))
             return True
         except Exception as e:
             logger.error(f"Hata (PlanRepository.update_plan_progress): {e}")
@@ -141,8 +141,7 @@ class PlanRepository:
     def delete_plan(self, plan_id: int) -> bool:
         """Planı siler."""
         try:
-            with get_db() as conn:
-                conn.execute("DELETE FROM plans WHERE id=?", (plan_id,))
+            execute_write("DELETE FROM plans WHERE id=?", (plan_id,))
             return True
         except Exception as e:
             logger.error(f"Hata (PlanRepository.delete_plan): {e}")
@@ -164,7 +163,21 @@ class PlanRepository:
 
         try:
             with get_db() as conn:
-                return [Plan.from_row(row) for row in conn.execute(query, params).fetchall()]
+                return model_cursor(conn, Plan).execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"Hata (PlanRepository.get_plans): {e}")
             return []
+
+    def iter_plans(self, batch_size: int = 500):
+        """Tüm planları ID sırasıyla fetchmany ile üretir (dışa aktarma)."""
+        query = (
+            "SELECT id, title, description, scope, year, month, status, progress, priority, created_at, folder_id "
+            "FROM plans ORDER BY id"
+        )
+        with get_db() as conn:
+            cursor = model_cursor(conn, Plan).execute(query)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
@@ -8,9 +8,60 @@ import sqlite3
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import List, Optional
-from database.connection import get_connection
+from database.connection import get_connection, get_db, init_db
+from database.write_queue import execute_write, run_write
 from logger_setup import logger
 
+# Upsert: INSERT OR REPLACE gibi satırı silip yeniden eklemez; id ve UNIQUE indeks
+# girdileri yerinde kalır. Sıra id'den değil position kolonundan (API sırası) gelir,
+# yenilemede güncellenir; başka sayfaya kayan öğenin page/position'ı da güncellenir.
+_UPSERT_SQL = '''
+    INSERT INTO recommendation_cache
+    (category, period, genre, is_turkish, external_id, title,
+     description, rating, image_url, release_date, content_type,
+     page, position, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (category, period, genre, is_turkish, external_id) DO UPDATE SET
+        title = excluded.title,
+        description = excluded.description,
+        rating = excluded.rating,
+        image_url = excluded.image_url,
+        release_date = excluded.release_date,
+        content_type = excluded.content_type,
+        page = excluded.page,
+        position = excluded.position,
+        fetched_at = excluded.fetched_at
+'''
+
+# Sayfadan düşen öğeler: yeni partide olmayan satırlar (yer tutucular çağıran tarafta eklenir)
+_DELETE_DROPPED_SQL = '''
+    DELETE FROM recommendation_cache
+    WHERE category = ? AND period = ? AND genre = ? AND is_turkish = ? AND page = ?
+          AND external_id NOT IN ({placeholders})
+'''
+
+
+def _delete_dropped_sql(count: int) -> str:
+    return _DELETE_DROPPED_SQL.format(placeholders=", ".join("?" * count))
+
+
+# Sayfa okumalarında yalnızca kartın kullandığı kolonlar seçilir (to_display_dict sırası)
+_DISPLAY_COLUMNS = "title, description, rating, image_url, release_date, content_type, external_id"
+
+
+def _display_row(cursor, row):
+    """Cursor row_factory'si: _DISPLAY_COLUMNS tuple'ından doğrudan display dict
+    (sqlite3.Row ve CachedRecommendation ara nesneleri oluşturulmaz)."""
+    return {
+        'title': row[0],
+        'description': row[1],
+        'rating': row[2],
+        'image': row[3],
+        'date': row[4],
+        'type': row[5],
+        'id': row[6]
+    }
+
 
 @dataclass
 class CachedRecommendation:
@@ -56,99 +107,54 @@ class RecommendationRepository:
     
     CACHE_EXPIRY_DAYS = 7
     ITEMS_PER_PAGE = 10
+    STREAM_CHUNK_SIZE = 50      # iter_cached_pages'in ürettiği parça (öğe)
     
     def __init__(self):
-        self._ensure_table_exists()
-    
-    def _ensure_table_exists(self):
-        """Cache tablosunu oluşturur."""
-        conn = get_connection()
-        if not conn:
-            return
-        
-        try:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS recommendation_cache (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    category TEXT NOT NULL,
-                    period TEXT NOT NULL,
-                    genre TEXT DEFAULT 'all',
-                    is_turkish INTEGER DEFAULT 0,
-                    external_id TEXT,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    rating REAL DEFAULT 0,
-                    image_url TEXT,
-                    release_date TEXT,
-                    content_type TEXT,
-                    page INTEGER DEFAULT 1,
-                    fetched_at TEXT NOT NULL,
-                    UNIQUE(category, period, genre, is_turkish, external_id)
-                )
-            ''')
-            
-            # Index for faster queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_cache_lookup 
-                ON recommendation_cache(category, period, genre, is_turkish, page)
-            ''')
-            
-            conn.commit()
-            logger.info("Recommendation cache tablosu hazır.")
-        except Exception as e:
-            logger.error(f"Cache tablosu oluşturulurken hata: {e}")
-        finally:
-            conn.close()
+        init_db()
     
     def add_recommendations(self, recommendations: List[dict], category: str, 
                            period: str, genre: str = None, is_turkish: bool = False,
                            page: int = 1) -> bool:
         """
         API'den gelen önerileri cache'e ekler.
+        Sayfa tek executemany upsert ile yazılır (bkz. _UPSERT_SQL); position öğenin
+        API sırasıdır. Sayfadan düşen öğeler aynı işlemde silinir.
         """
-        conn = get_connection()
-        if not conn:
-            return False
-        
         genre_key = genre if genre else 'all'
         fetched_at = datetime.now().isoformat()
+        key = (category, period, genre_key, 1 if is_turkish else 0)
+        # external_id -> satır; partide tekrar eden öğe ilk sırasını korur, verisi güncellenir
+        rows = {}
+        for position, item in enumerate(recommendations):
+            external_id = str(item.get('id', item.get('title', '')))
+            if external_id in rows:
+                position = rows[external_id][12]
+            rows[external_id] = key + (
+                external_id,
+                item.get('title', 'Başlıksız'),
+                item.get('description', ''),
+                item.get('rating', 0) or 0,
+                item.get('image', ''),
+                item.get('date', ''),
+                item.get('type', category),
+                page,
+                position,
+                fetched_at
+            )
+        
+        def op(conn):
+            conn.execute(_delete_dropped_sql(len(rows)), key + (page,) + tuple(rows))
+            conn.executemany(_UPSERT_SQL, rows.values())
         
         try:
-            cursor = conn.cursor()
-            
-            for item in recommendations:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO recommendation_cache 
-                    (category, period, genre, is_turkish, external_id, title, 
-                     description, rating, image_url, release_date, content_type, 
-                     page, fetched_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    category,
-                    period,
-                    genre_key,
-                    1 if is_turkish else 0,
-                    str(item.get('id', item.get('title', ''))),
-                    item.get('title', 'Başlıksız'),
-                    item.get('description', ''),
-                    item.get('rating', 0) or 0,
-                    item.get('image', ''),
-                    item.get('date', ''),
-                    item.get('type', category),
-                    page,
-                    fetched_at
-                ))
-            
-            conn.commit()
+            # Tek yazıcı thread'de diğer yazmalarla birlikte commit edilir
+            run_write(op)
             logger.info(f"Cache'e {len(recommendations)} öneri eklendi. ({category}/{period}/{page})")
             return True
             
         except Exception as e:
             logger.error(f"Cache'e ekleme hatası: {e}")
             return False
-        finally:
-            conn.close()
     
     def get_cached_recommendations(self, category: str, period: str, 
                                    genre: str = None, is_turkish: bool = False,
@@ -165,27 +171,21 @@ class RecommendationRepository:
         
         try:
             cursor = conn.cursor()
+            cursor.row_factory = _display_row
             
             # Expiry check
             expiry_date = (datetime.now() - timedelta(days=self.CACHE_EXPIRY_DAYS)).isoformat()
             
-            cursor.execute('''
-                SELECT id, category, period, genre, is_turkish, external_id,
-                       title, description, rating, image_url, release_date,
-                       content_type, page, fetched_at
+            cursor.execute(f'''
+                SELECT {_DISPLAY_COLUMNS}
                 FROM recommendation_cache
                 WHERE category = ? AND period = ? AND genre = ? 
                       AND is_turkish = ? AND page = ?
                       AND fetched_at > ?
-                ORDER BY id ASC
+                ORDER BY position ASC
             ''', (category, period, genre_key, 1 if is_turkish else 0, page, expiry_date))
             
-            rows = cursor.fetchall()
-            results = []
-            
-            for row in rows:
-                rec = CachedRecommendation.from_row(row)
-                results.append(rec.to_display_dict())
+            results = cursor.fetchall()
             
             logger.debug(f"Cache'den {len(results)} öneri çekildi. ({category}/{period}/{page})")
             return results
@@ -196,6 +196,43 @@ class RecommendationRepository:
         finally:
             conn.close()
     
+    def iter_cached_pages(self, category: str, period: str,
+                          genre: str = None, is_turkish: bool = False,
+                          max_page: int = None, chunk_size: int = None):
+        """
+        Anahtarın süresi dolmamış tüm sayfalarını tek sıralı aralık sorgusuyla
+        (page, position sırasında) okur ve chunk_size'lık display dict listeleri
+        halinde üretir (generator). Sayfa sayısından bağımsız olarak tek sorgu
+        ve tek bağlantı kullanılır. max_page verilirse yalnızca 1..max_page.
+        Hatalar çağırana iletilir.
+        """
+        genre_key = genre if genre else 'all'
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        expiry_date = (datetime.now() - timedelta(days=self.CACHE_EXPIRY_DAYS)).isoformat()
+        params = [category, period, genre_key, 1 if is_turkish else 0]
+        page_range = "page >= 1"
+        if max_page is not None:
+            page_range = "page BETWEEN 1 AND ?"
+            params.append(max_page)
+        params.append(expiry_date)
+        
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = _display_row
+            cursor.execute(f'''
+                SELECT {_DISPLAY_COLUMNS}
+                FROM recommendation_cache
+                WHERE category = ? AND period = ? AND genre = ? 
+                      AND is_turkish = ? AND {page_range}
+                      AND fetched_at > ?
+                ORDER BY page ASC, position ASC
+            ''', params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+    
     def get_max_cached_page(self, category: str, period: str, 
                             genre: str = None, is_turkish: bool = False) -> int:
         """
@@ -261,24 +298,16 @@ class RecommendationRepository:
     def clear_expired_cache(self) -> int:
         """
         Süresi dolmuş cache kayıtlarını siler.
-        Silinen kayıt sayısını döndürür.
+        Silinen kayıt sayısını döndürür. Bakım zamanlayıcısı çağırır
+        (bkz. database/maintenance.py).
         """
-        conn = get_connection()
-        if not conn:
-            return 0
-        
         try:
-            cursor = conn.cursor()
             expiry_date = (datetime.now() - timedelta(days=self.CACHE_EXPIRY_DAYS)).isoformat()
-            
-            cursor.execute('''
+            deleted_count = execute_write('''
                 DELETE FROM recommendation_cache
                 WHERE fetched_at < ?
             ''', (expiry_date,))
             
-            deleted_count = cursor.rowcount
-            conn.commit()
-            
             if deleted_count > 0:
                 logger.info(f"Süresi dolmuş {deleted_count} cache kaydı silindi.")
             
@@ -287,8 +316,6 @@ class RecommendationRepository:
         except Exception as e:
             logger.error(f"Cache temizleme hatası: {e}")
             return 0
-        finally:
-            conn.close()
     
     def clear_all_cache(self) -> bool:
         """Tüm cache'i temizler."""
@@ -0,0 +1,142 @@
+# database/replica.py
+"""
+Analiz sorguları için salt okunur, bellek içi veritabanı kopyası.
+
+StatsPage, ComparePage, TrendAnalysisWidget ve PdfPage'in toplama sorguları
+disk yerine bu kopyada çalışır; böylece yazmalarla yarışmaz ve disk G/Ç'si
+ödemez. Kopya sqlite3.Connection.backup ile doldurulur ve
+MainController.activity_changed ile yenilenir.
+
+Kopya, alındığı andaki havuz yazma sayacını (write_generation) saklar. Sayaç
+ilerlemişse (yenileme henüz bitmemişse) sorgular diske düşer; kopya hiçbir
+zaman eski veri döndürmez.
+"""
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from . import connection
+from logger_setup import logger
+
+
+class AnalyticsReplica:
+    """Disk veritabanının bellek içi, salt okunur kopyası."""
+
+    def __init__(self):
+        self._conn = None
+        self._pool = None           # kopyanın alındığı havuz
+        self._generation = -1       # kopyanın alındığı andaki write_generation
+        self._lock = threading.Lock()           # sorgular ve bağlantı değişimi
+        self._refresh_lock = threading.Lock()   # aynı anda tek yenileme
+        self.hits = 0
+        self.fallbacks = 0
+        self.last_refresh_ms = 0.0
+
+    def refresh(self) -> bool:
+        """Disk veritabanını yeni bir bellek bağlantısına kopyalayıp eskisinin yerine koyar."""
+        with self._refresh_lock:
+            pool = connection._pool
+            # Sayaç kopyadan ÖNCE okunur: arada yazma olursa kopya eski sayılır (güvenli taraf)
+            generation = pool.write_generation
+            start = time.perf_counter()
+            memory = sqlite3.connect(":memory:", check_same_thread=False)
+            try:
+                with connection.get_db() as disk:
+                    disk.backup(memory)
+                memory.row_factory = sqlite3.Row
+                memory.execute("PRAGMA query_only = ON")
+            except Exception as e:
+                memory.close()
+                logger.error(f"Hata (AnalyticsReplica.refresh): {e}")
+                return False
+
+            with self._lock:
+                old, self._conn = self._conn, memory
+                self._pool, self._generation = pool, generation
+            if old is not None:
+                old.close()
+            self.last_refresh_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"Analiz kopyası yenilendi ({self.last_refresh_ms:.1f} ms)")
+            return True
+
+    def close(self):
+        with self._lock:
+            old, self._conn = self._conn, None
+            self._pool, self._generation = None, -1
+        if old is not None:
+            old.close()
+
+    def is_fresh(self) -> bool:
+        """Kopya aktif havuzun son yazmasını içeriyor mu?"""
+        pool = connection._pool
+        return self._conn is not None and self._pool is pool and self._generation == pool.write_generation
+
+    @contextmanager
+    def read(self):
+        """Güncelse kopyayı, değilse havuzdan disk bağlantısını verir."""
+        with self._lock:
+            if self.is_fresh():
+                self.hits += 1
+                yield self._conn
+                return
+            self.fallbacks += 1
+        with connection.get_db() as conn:
+            yield conn
+
+    def stats(self) -> dict:
+        return {
+            'loaded': self._conn is not None,
+            'fresh': self.is_fresh(),
+            'hits': self.hits,
+            'fallbacks': self.fallbacks,
+            'last_refresh_ms': self.last_refresh_ms,
+        }
+
+
+_replica = None
+
+
+def enable_replica(refresh=True) -> bool:
+    """Analiz kopyasını açar; refresh=False ise doldurma refresh_replica'ya bırakılır
+    (o zamana kadar sorgular diske gider)."""
+    global _replica
+    if _replica is None:
+        _replica = AnalyticsReplica()
+    return _replica.refresh() if refresh else True
+
+
+def disable_replica():
+    """Analiz kopyasını kapatır; sorgular yeniden diske gider."""
+    global _replica
+    replica, _replica = _replica, None
+    if replica is not None:
+        replica.close()
+
+
+def refresh_replica() -> bool:
+    """Kopya açıksa yeniler (activity_changed sonrası). Kapalıysa bir şey yapmaz."""
+    replica = _replica
+    return replica.refresh() if replica is not None else False
+
+
+def is_replica_enabled() -> bool:
+    return _replica is not None
+
+
+def get_replica_stats():
+    """Kopya istatistiklerini döndürür; kopya kapalıysa None."""
+    replica = _replica
+    return replica.stats() if replica is not None else None
+
+
+@contextmanager
+def analytics_db():
+    """Analiz sorguları için bağlantı: kopya açık ve güncelse bellek, değilse disk."""
+    replica = _replica
+    if replica is None:
+        with connection.get_db() as conn:
+            yield conn
+    else:
+        with replica.read() as conn:
+            yield conn
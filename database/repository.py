@@ -1,88 +1,152 @@
 # database/repository.py
-from .connection import get_db, get_connection, init_db
-from models import Activity, ActivityFilter
-from utils import is_valid_yyyymm, is_valid_yyyy
+import re
+from .connection import get_db, get_connection, init_db, get_write_generation, model_cursor
+from .replica import analytics_db
+from .write_queue import execute_write, run_write
+from .migrations import (
+    fts5_supported, create_fts_index, rebuild_monthly_agg,
+    rtree_supported, create_interval_index, day_key,
+    trigram_supported, create_name_index,
+)
+from .type_key import type_key, type_key_sql
+from .type_repository import resolve_type
+from models import Activity, ActivityFilter, ActivityChange, ChangeSet
+from utils import is_valid_yyyymm, is_valid_yyyy, date_prefix_bounds
 from logger_setup import logger
 
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_fts_query(search_term: str):
+    """Arama metnini FTS5 önek sorgusuna çevirir: 'kay yol' -> '"kay"* "yol"*'.
+    Aranabilir kelime yoksa None döner."""
+    tokens = _FTS_TOKEN_RE.findall(search_term or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{t}"*' for t in tokens)
+
 
 class ActivityRepository:
     """Faaliyet kayıtları için CRUD ve istatistik sorguları."""
 
+    _COUNT_CACHE_SIZE = 32
+    CHANGE_BATCH_LIMIT = 200    # bundan fazla değişiklikte dinleyiciler tam yükleme yapar
+    CHANGE_LOG_KEEP = 10000     # trim_change_log sonrası tutulan en fazla günlük satırı
+    NAME_SUGGESTION_LIMIT = 10
+    NAME_INFIX_MIN_CHARS = 3    # trigram indeksinin eşleştirebildiği en kısa metin
+
     def __init__(self):
+        self._count_cache = {}  # filtre anahtarı -> (write_generation, toplam)
         init_db()
-        self.check_and_migrate_schema()
+        self.fts_enabled = fts5_supported()
+        self.interval_index_enabled = rtree_supported()
+        self.name_trigram_enabled = trigram_supported()
 
-    def check_and_migrate_schema(self):
-        """Veritabanı şemasını kontrol eder ve eksik kolonları ekler."""
+    def rebuild_monthly_agg(self) -> bool:
+        """Özet tablosunu activities üzerinden baştan hesaplar (sapma olduğunda)."""
         try:
             with get_db() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute("PRAGMA table_info(activities)")
-                columns = [row[1] for row in cursor.fetchall()]
-
-                if "end_date" not in columns:
-                    logger.info("Şema güncelleniyor: 'end_date' kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE activities ADD COLUMN end_date TEXT")
-
-                cursor.execute("PRAGMA index_list(activities)")
-                indexes = [row[1] for row in cursor.fetchall()]
+                rebuild_monthly_agg(conn)
+            return True
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.rebuild_monthly_agg): {e}")
+            return False
 
-                if "idx_activities_date" not in indexes:
-                    cursor.execute("CREATE INDEX idx_activities_date ON activities(date)")
-                    logger.info("İndeks oluşturuldu: idx_activities_date")
+    def rebuild_fts_index(self) -> bool:
+        """FTS tablosunu ve trigger'larını yeniden kurup indeksi baştan doldurur
+        (örn. veritabanı FTS5'siz bir SQLite ile taşındıysa)."""
+        try:
+            with get_db() as conn:
+                self.fts_enabled = create_fts_index(conn)
+            return self.fts_enabled
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.rebuild_fts_index): {e}")
+            return False
 
-                if "idx_activities_type" not in indexes:
-                    cursor.execute("CREATE INDEX idx_activities_type ON activities(type)")
-                    logger.info("İndeks oluşturuldu: idx_activities_type")
+    def rebuild_interval_index(self) -> bool:
+        """Tarih aralığı (R*Tree) indeksini ve trigger'larını yeniden kurar."""
+        try:
+            with get_db() as conn:
+                self.interval_index_enabled = create_interval_index(conn)
+            return self.interval_index_enabled
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.rebuild_interval_index): {e}")
+            return False
 
-                cursor.execute("PRAGMA table_info(plans)")
-                plan_columns = [row[1] for row in cursor.fetchall()]
+    def rebuild_name_index(self) -> bool:
+        """Otomatik tamamlama isim tablosunu ve trigram indeksini yeniden kurar."""
+        try:
+            with get_db() as conn:
+                self.name_trigram_enabled = create_name_index(conn)
+            return True
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.rebuild_name_index): {e}")
+            return False
 
-                if plan_columns and "folder_id" not in plan_columns:
-                    logger.info("Şema güncelleniyor: plans tablosuna 'folder_id' kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE plans ADD COLUMN folder_id INTEGER REFERENCES folders(id) ON DELETE SET NULL")
+    def add(self, activity: Activity) -> bool:
+        """Yeni bir faaliyeti veritabanına ekler. Tür, kayıtlı yazımına çevrilir."""
+        sql = '''
+            INSERT INTO activities (type, name, date, comment, rating, end_date)
+            VALUES (?, ?, ?, ?, ?, ?)
+        '''
 
-                cursor.execute("UPDATE activities SET date = date || '-01' WHERE length(date) = 7")
-                normalized = cursor.rowcount
-                if normalized > 0:
-                    logger.info(f"Tarih formati normalize edildi: {normalized} kayit YYYY-MM -> YYYY-MM-01")
+        def op(conn):
+            activity.type = resolve_type(conn, activity.type)
+            conn.execute(sql, (
+                activity.type, activity.name, activity.date,
+                activity.comment, activity.rating, activity.end_date
+            ))
 
+        try:
+            run_write(op)
+            logger.info(f"Yeni faaliyet eklendi: {activity.name} ({activity.type})")
+            return True
         except Exception as e:
-            logger.error(f"Hata (ActivityRepository.check_and_migrate_schema): {e}")
+            logger.error(f"Hata (ActivityRepository.add): {e}")
+            return False
 
-    def add(self, activity: Activity) -> bool:
-        """Yeni bir faaliyeti veritabanına ekler."""
+    def add_many(self, activities: list) -> bool:
+        """Faaliyetleri tek işlemde executemany ile ekler (toplu içe aktarma).
+        Bir satır bile başarısız olursa hiçbiri eklenmez."""
         sql = '''
             INSERT INTO activities (type, name, date, comment, rating, end_date)
             VALUES (?, ?, ?, ?, ?, ?)
         '''
         try:
             with get_db() as conn:
-                conn.execute(sql, (
-                    activity.type, activity.name, activity.date,
-                    activity.comment, activity.rating, activity.end_date
-                ))
-            logger.info(f"Yeni faaliyet eklendi: {activity.name} ({activity.type})")
+                # Türler executemany'den önce ayrı bir adımda çözülür (gerekirse activity_types'a
+                # eklenir); executemany sürerken aynı bağlantıda başka deyim çalışmaz
+                types = {}
+                for a in activities:
+                    if a.type not in types:
+                        types[a.type] = resolve_type(conn, a.type)
+                conn.executemany(sql, [
+                    (types[a.type], a.name, a.date, a.comment, a.rating, a.end_date)
+                    for a in activities
+                ])
             return True
         except Exception as e:
-            logger.error(f"Hata (ActivityRepository.add): {e}")
+            logger.error(f"Hata (ActivityRepository.add_many): {e}")
             return False
 
     def update(self, activity: Activity) -> bool:
-        """Mevcut bir faaliyeti ID'sine göre günceller."""
+        """Mevcut bir faaliyeti ID'sine göre günceller. Tür, kayıtlı yazımına çevrilir."""
         sql = '''
             UPDATE activities
             SET type = ?, name = ?, date = ?, comment = ?, rating = ?, end_date = ?
             WHERE id = ?
         '''
+
+        def op(conn):
+            activity.type = resolve_type(conn, activity.type)
+            conn.execute(sql, (
+                activity.type, activity.name, activity.date,
+                activity.comment, activity.rating, activity.end_date,
+                activity.id
+            ))
+
         try:
-            with get_db() as conn:
-                conn.execute(sql, (
-                    activity.type, activity.name, activity.date,
-                    activity.comment, activity.rating, activity.end_date,
-                    activity.id
-                ))
+            run_write(op)
             logger.info(f"Faaliyet güncellendi: ID {activity.id} - {activity.name}")
             return True
         except Exception as e:
@@ -92,8 +156,7 @@ class ActivityRepository:
     def delete(self, activity_id: int) -> bool:
         """Bir faaliyeti ID'sine göre siler."""
         try:
-            with get_db() as conn:
-                conn.execute("DELETE FROM activities WHERE id = ?", (activity_id,))
+            execute_write("DELETE FROM activities WHERE id = ?", (activity_id,))
             logger.info(f"Faaliyet silindi: ID {activity_id}")
             return True
         except Exception as e:
@@ -105,91 +168,271 @@ class ActivityRepository:
         sql = "SELECT id, type, name, date, comment, rating, end_date FROM activities WHERE id = ?"
         try:
             with get_db() as conn:
-                row = conn.execute(sql, (activity_id,)).fetchone()
-            return Activity.from_row(row) if row else None
+                return model_cursor(conn, Activity).execute(sql, (activity_id,)).fetchone()
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_by_id): {e}")
             return None
 
-    def get_all_filtered(self, filter_obj: ActivityFilter):
-        """Filtrelenmiş ve sayfalanmış faaliyet listesini döndürür."""
-        base_query_parts = ["FROM activities WHERE 1=1"]
+    def _cached_count(self, conn, filter_obj: ActivityFilter, base_query: str, params: list) -> int:
+        """Filtrenin toplam kayıt sayısını döndürür; bir sonraki yazmaya kadar önbellekte tutar."""
+        key = filter_obj.count_key()
+        generation = get_write_generation()
+        cached = self._count_cache.get(key)
+        if cached and cached[0] == generation:
+            return cached[1]
+
+        total = conn.execute(f"SELECT COUNT(*) {base_query}", params).fetchone()[0]
+        if len(self._count_cache) >= self._COUNT_CACHE_SIZE:
+            self._count_cache.clear()
+        self._count_cache[key] = (generation, total)
+        return total
+
+    def _filter_where(self, filter_obj: ActivityFilter):
+        """Filtreden WHERE ifadesini üretir: (where, params, fts_query).
+        fts_query None değilse arama FTS5 ile yapılmalıdır."""
+        conditions = ["1=1"]
         params = []
 
         if filter_obj.type_filter != "Hepsi":
-            base_query_parts.append("AND lower(type) = lower(?)")
+            conditions.append(f"type_key = {type_key_sql('?')}")
             params.append(filter_obj.type_filter)
 
+        fts_query = None
         if filter_obj.search_term:
-            base_query_parts.append("AND name LIKE ?")
-            params.append(f"%{filter_obj.search_term}%")
+            fts_query = build_fts_query(filter_obj.search_term) if self.fts_enabled else None
+            if fts_query is None:
+                conditions.append("name LIKE ?")
+                params.append(f"%{filter_obj.search_term}%")
+
+        bounds = date_prefix_bounds(filter_obj.date_filter) if filter_obj.date_filter else None
+        if bounds:
+            # Dönemle çakışan kayıtlar: dönem bitmeden başlamış, dönem başladıktan sonra bitmiş
+            start_date, end_exclusive = bounds
+            if self.interval_index_enabled:
+                # Adaylar R*Tree'den; kesin koşul aşağıda (hatalı tarihli kayıtlar için)
+                conditions.append(
+                    "id IN (SELECT id FROM activities_interval WHERE start_day < ? AND end_day >= ?)"
+                )
+                params.extend([day_key(end_exclusive), day_key(start_date)])
+            conditions.append("date < ? AND COALESCE(end_date, date) >= ?")
+            params.append(end_exclusive)
+            params.append(start_date)
 
-        if filter_obj.date_filter:
-            date_f = filter_obj.date_filter
-            start_date, end_date = None, None
+        return " AND ".join(conditions), params, fts_query
 
-            if is_valid_yyyymm(date_f):
-                start_date = f"{date_f}"
-                end_date = f"{date_f}-31"
-            elif is_valid_yyyy(date_f):
-                start_date = f"{date_f}"
-                end_date = f"{date_f}-12-31"
+    def get_all_filtered(self, filter_obj: ActivityFilter):
+        """Filtrelenmiş ve sayfalanmış faaliyet listesini döndürür.
 
-            if start_date and end_date:
-                base_query_parts.append("AND date <= ? AND COALESCE(end_date, date) >= ?")
-                params.append(end_date)
-                params.append(start_date)
+        filter_obj.cursor verilirse (önceki sayfanın son (date, id) değeri)
+        OFFSET yerine seek yapılır; sayfa numarası maliyeti etkilemez.
+        Arama FTS5 ile yapılır ve sonuçlar bm25 skoruna göre sıralanır
+        (bu durumda cursor kullanılmaz); FTS5 yoksa isimde LIKE araması yapılır.
+        """
+        where, params, fts_query = self._filter_where(filter_obj)
+        columns = "activities.id, type, activities.name, date, activities.comment, rating, end_date"
 
-        base_query = " ".join(base_query_parts)
+        try:
+            with get_db() as conn:
+                if fts_query:
+                    count_query = (
+                        f"FROM activities WHERE {where} AND id IN "
+                        f"(SELECT rowid FROM activities_fts WHERE activities_fts MATCH ?)"
+                    )
+                    total_count = self._cached_count(conn, filter_obj, count_query, params + [fts_query])
+
+                    offset = (filter_obj.page - 1) * filter_obj.items_per_page
+                    data_query = (
+                        f"SELECT {columns} FROM activities_fts "
+                        f"JOIN activities ON activities.id = activities_fts.rowid "
+                        f"WHERE activities_fts MATCH ? AND {where} "
+                        f"ORDER BY bm25(activities_fts, 10.0, 1.0), date DESC, activities.id DESC "
+                        f"LIMIT ? OFFSET ?"
+                    )
+                    page_params = [fts_query] + params + [filter_obj.items_per_page, offset]
+                else:
+                    base_query = f"FROM activities WHERE {where}"
+                    total_count = self._cached_count(conn, filter_obj, base_query, params)
+
+                    if filter_obj.cursor:
+                        data_query = (
+                            f"SELECT {columns} {base_query} "
+                            f"AND (date, id) < (?, ?) ORDER BY date DESC, id DESC LIMIT ?"
+                        )
+                        page_params = params + list(filter_obj.cursor) + [filter_obj.items_per_page]
+                    else:
+                        offset = (filter_obj.page - 1) * filter_obj.items_per_page
+                        data_query = (
+                            f"SELECT {columns} {base_query} "
+                            f"ORDER BY date DESC, id DESC LIMIT ? OFFSET ?"
+                        )
+                        page_params = params + [filter_obj.items_per_page, offset]
+                activities = model_cursor(conn, Activity).execute(data_query, page_params).fetchall()
+
+            return activities, total_count
 
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.get_all_filtered): {e}")
+            return [], 0
+
+    def count_filtered(self, filter_obj: ActivityFilter) -> int:
+        """Filtreye uyan kayıt sayısı (get_all_filtered ile aynı önbellek)."""
+        where, params, fts_query = self._filter_where(filter_obj)
+        if fts_query:
+            where += " AND id IN (SELECT rowid FROM activities_fts WHERE activities_fts MATCH ?)"
+            params = params + [fts_query]
         try:
             with get_db() as conn:
-                total_count = conn.execute(f"SELECT COUNT(*) {base_query}", params).fetchone()[0]
+                return self._cached_count(conn, filter_obj, f"FROM activities WHERE {where}", params)
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.count_filtered): {e}")
+            return 0
 
-                offset = (filter_obj.page - 1) * filter_obj.items_per_page
-                data_query = (
-                    f"SELECT id, type, name, date, comment, rating, end_date {base_query} "
-                    f"ORDER BY date DESC, id DESC LIMIT ? OFFSET ?"
-                )
-                rows = conn.execute(data_query, params + [filter_obj.items_per_page, offset]).fetchall()
+    def iter_filtered(self, filter_obj: ActivityFilter, batch_size: int = 500):
+        """Filtreye uyan tüm faaliyetleri tarih sırasıyla, fetchmany ile
+        batch_size'lık parçalar halinde üretir (dışa aktarma).
 
-            return [Activity.from_row(row) for row in rows], total_count
+        Bellek kullanımı sonuç boyutundan bağımsızdır. Sayfalama alanları
+        yok sayılır. Hatalar çağırana iletilir; yarım kalan akış sessizce
+        kesilmez.
+        """
+        where, params, fts_query = self._filter_where(filter_obj)
+        if fts_query:
+            where += " AND id IN (SELECT rowid FROM activities_fts WHERE activities_fts MATCH ?)"
+            params = params + [fts_query]
+        query = (
+            f"SELECT id, type, name, date, comment, rating, end_date FROM activities "
+            f"WHERE {where} ORDER BY date, id"
+        )
+        with get_db() as conn:
+            cursor = model_cursor(conn, Activity).execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+
+    # --- Değişiklik Günlüğü (activity_changes) ---
+
+    def get_last_change_seq(self) -> int:
+        """Günlükteki son değişikliğin sıra numarası (boşsa 0)."""
+        try:
+            with get_db() as conn:
+                return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM activity_changes").fetchone()[0]
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.get_last_change_seq): {e}")
+            return 0
 
+    def get_changes_since(self, seq: int, limit: int = CHANGE_BATCH_LIMIT):
+        """seq'ten sonraki değişiklikleri sırayla döndürür (ChangeSet).
+
+        Maliyet veritabanı boyutuna değil değişiklik sayısına bağlıdır (seq
+        birincil anahtar). limit aşılırsa truncated=True ve last_seq en son
+        sıra olur; dinleyici tam yeniden yükleme yapar. Hata olursa None.
+        """
+        query = '''
+            SELECT c.seq, c.op, c.activity_id,
+                   c.old_type, c.old_date, c.old_end_date, c.old_rating,
+                   c.new_type, c.new_date, c.new_end_date, c.new_rating,
+                   a.id, a.type, a.name, a.date, a.comment, a.rating, a.end_date
+            FROM activity_changes c LEFT JOIN activities a ON a.id = c.activity_id
+            WHERE c.seq > ? ORDER BY c.seq LIMIT ?
+        '''
+        try:
+            with get_db() as conn:
+                rows = conn.execute(query, (seq, limit + 1)).fetchall()
+                if len(rows) > limit:
+                    last = conn.execute("SELECT MAX(seq) FROM activity_changes").fetchone()[0]
+                    return ChangeSet(last_seq=last, truncated=True)
         except Exception as e:
-            logger.error(f"Hata (ActivityRepository.get_all_filtered): {e}")
-            return [], 0
+            logger.error(f"Hata (ActivityRepository.get_changes_since): {e}")
+            return None
+
+        changes = []
+        for row in rows:
+            activity = Activity(*row[11:18]) if row[11] is not None else None
+            changes.append(ActivityChange(*row[:11], activity=activity))
+        return ChangeSet(last_seq=changes[-1].seq if changes else seq, changes=changes)
 
-    def get_unique_names(self) -> list:
-        """Otomatik tamamlama için benzersiz faaliyet isimlerini getirir."""
-        sql = "SELECT DISTINCT name FROM activities ORDER BY name"
+    def trim_change_log(self, keep: int = CHANGE_LOG_KEEP) -> int:
+        """Günlüğün en yeni keep satırı dışındakileri siler; silinen sayıyı döndürür."""
+        try:
+            return execute_write(
+                "DELETE FROM activity_changes WHERE seq <= (SELECT MAX(seq) FROM activity_changes) - ?",
+                (keep,),
+            )
+        except Exception as e:
+            logger.error(f"Hata (ActivityRepository.trim_change_log): {e}")
+            return 0
+
+    def suggest_names(self, query: str, limit: int = NAME_SUGGESTION_LIMIT) -> list:
+        """Otomatik tamamlama önerileri: önce query ile başlayan, yer kalırsa içinde
+        geçen isimler; her grup kullanım sayısı ve son tarihe göre sıralı.
+
+        activity_names tablosundan okunur (trigger'larla güncel); önek araması
+        name_key indeksinde aralık taraması, içinde geçen arama trigram indeksidir.
+        Boş query en sık kullanılan isimleri döndürür.
+        """
+        key = type_key((query or "").strip())
+        order = "ORDER BY n.uses DESC, n.last_date DESC, n.name_key LIMIT ?"
         try:
             with get_db() as conn:
-                return [row[0] for row in conn.execute(sql).fetchall()]
+                if not key:
+                    return [row[0] for row in conn.execute(
+                        f"SELECT n.name FROM activity_names n {order}", (limit,)
+                    ).fetchall()]
+
+                # name_key >= 'kar' AND name_key < 'kas': indeks aralığı (LIKE 'kar%' indeks kullanmaz)
+                upper = key[:-1] + chr(ord(key[-1]) + 1)
+                names = [row[0] for row in conn.execute(
+                    f"SELECT n.name FROM activity_names n WHERE n.name_key >= ? AND n.name_key < ? {order}",
+                    (key, upper, limit),
+                ).fetchall()]
+                if len(names) >= limit or len(key) < self.NAME_INFIX_MIN_CHARS:
+                    return names
+
+                not_prefix = "NOT (n.name_key >= ? AND n.name_key < ?)"
+                if self.name_trigram_enabled:
+                    sql = (
+                        "SELECT n.name FROM activity_names_fts f JOIN activity_names n ON n.id = f.rowid "
+                        f"WHERE activity_names_fts MATCH ? AND {not_prefix} {order}"
+                    )
+                    match = '"' + key.replace('"', '""') + '"'
+                else:
+                    sql = f"SELECT n.name FROM activity_names n WHERE instr(n.name_key, ?) > 0 AND {not_prefix} {order}"
+                    match = key
+                names += [row[0] for row in conn.execute(sql, (match, key, upper, limit - len(names))).fetchall()]
+                return names
         except Exception as e:
-            logger.error(f"Hata (ActivityRepository.get_unique_names): {e}")
+            logger.error(f"Hata (ActivityRepository.suggest_names): {e}")
             return []
 
     # --- İstatistik, Karşılaştırma ve Rapor Sorguları ---
+    # Açıksa bellek içi analiz kopyasında çalışır (bkz. database/replica.py)
 
     def get_stats_by_type(self, date_prefix: str = "", year_only: bool = False, ignore_dates: bool = False) -> list:
-        """StatsPage için gruplanmış istatistikleri çeker. Dönüş: (type, count, average_rating)"""
-        query = "SELECT type, COUNT(*), AVG(CASE WHEN rating > 0 THEN rating END) FROM activities"
+        """StatsPage için gruplanmış istatistikleri çeker. Dönüş: (type, count, average_rating, rated_count)
+        — rated_count, değişiklik deltalarıyla ortalamanın yeniden hesaplanabilmesi içindir."""
+        query = (
+            "SELECT type, SUM(count), CAST(SUM(rating_sum) AS REAL) / NULLIF(SUM(rated_count), 0), SUM(rated_count) "
+            "FROM activity_monthly_agg"
+        )
         params = []
 
         if not ignore_dates:
             if year_only:
                 if not date_prefix or not is_valid_yyyy(date_prefix): return []
-                query += " WHERE date LIKE ?"
-                params.append(date_prefix + "%")
+                query += " WHERE year = ?"
+                params.append(int(date_prefix))
             else:
                 if not date_prefix or not is_valid_yyyymm(date_prefix): return []
-                query += " WHERE substr(date, 1, 7) = ?"
-                params.append(date_prefix)
+                year, month = date_prefix.split("-")
+                query += " WHERE year = ? AND month = ?"
+                params.extend([int(year), int(month)])
 
-        query += " GROUP BY type ORDER BY COUNT(*) DESC"
+        query += " GROUP BY type ORDER BY SUM(count) DESC"
 
         try:
-            with get_db() as conn:
+            with analytics_db() as conn:
                 return conn.execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_stats_by_type): {e}")
@@ -197,36 +440,46 @@ class ActivityRepository:
 
     def get_details_for_type(self, activity_type: str, date_prefix: str = "", year_only: bool = False, ignore_dates: bool = False) -> list:
         """StatsPage detayları için (isim, tarih) listesini çeker."""
-        query = "SELECT name, date FROM activities WHERE lower(type) = ?"
-        params = [activity_type.lower()]
+        query = f"SELECT name, date FROM activities WHERE type_key = {type_key_sql('?')}"
+        params = [activity_type]
 
         if not ignore_dates:
             if year_only:
                 if not date_prefix or not is_valid_yyyy(date_prefix): return []
-                query += " AND date LIKE ?"
-                params.append(date_prefix + "%")
             else:
                 if not date_prefix or not is_valid_yyyymm(date_prefix): return []
-                query += " AND substr(date, 1, 7) = ?"
-                params.append(date_prefix)
+            query += " AND date >= ? AND date < ?"
+            params.extend(date_prefix_bounds(date_prefix))
 
         query += " ORDER BY date DESC"
 
         try:
-            with get_db() as conn:
+            with analytics_db() as conn:
                 return conn.execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_details_for_type): {e}")
             return []
 
+    @staticmethod
+    def _date_prefix_clause(date_prefix: str):
+        """Dönem öneki için indeks dostu WHERE parçası döndürür. Boş önek tüm zamanlardır;
+        geçersiz önek için None döner."""
+        if not date_prefix:
+            return "1=1", []
+        bounds = date_prefix_bounds(date_prefix)
+        if not bounds:
+            return None
+        return "date >= ? AND date < ?", list(bounds)
+
     def get_comparison_data(self, date_prefix: str) -> list:
         """ComparePage için (tür, isim) listesini çeker."""
+        clause = self._date_prefix_clause(date_prefix)
+        if clause is None:
+            return []
+        where, params = clause
         try:
-            with get_db() as conn:
-                return conn.execute(
-                    "SELECT type, name FROM activities WHERE date LIKE ?",
-                    (f"{date_prefix}%",)
-                ).fetchall()
+            with analytics_db() as conn:
+                return conn.execute(f"SELECT type, name FROM activities WHERE {where}", params).fetchall()
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_comparison_data): {e}")
             return []
@@ -234,12 +487,12 @@ class ActivityRepository:
     def get_available_periods(self, period_type: str = "month") -> list:
         """ComparePage için mevcut dönemleri (YYYY-MM veya YYYY) çeker."""
         if period_type == "month":
-            query = "SELECT DISTINCT substr(date, 1, 7) as period FROM activities ORDER BY period DESC"
+            query = "SELECT DISTINCT printf('%04d-%02d', year, month) as period FROM activity_monthly_agg ORDER BY period DESC"
         else:
-            query = "SELECT DISTINCT substr(date, 1, 4) as period FROM activities ORDER BY period DESC"
+            query = "SELECT DISTINCT printf('%04d', year) as period FROM activity_monthly_agg ORDER BY period DESC"
 
         try:
-            with get_db() as conn:
+            with analytics_db() as conn:
                 return [row[0] for row in conn.execute(query).fetchall()]
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_available_periods): {e}")
@@ -247,31 +500,32 @@ class ActivityRepository:
 
     def get_detailed_data_for_pdf(self, date_prefix: str) -> list:
         """PDF Raporu için tüm detaylı veriyi çeker."""
-        query = "SELECT type, name, date, comment, rating, id, end_date FROM activities WHERE date LIKE ? ORDER BY date, type, name"
+        clause = self._date_prefix_clause(date_prefix)
+        if clause is None:
+            return []
+        where, params = clause
+        query = f"SELECT type, name, date, comment, rating, id, end_date FROM activities WHERE {where} ORDER BY date, type, name"
         try:
-            with get_db() as conn:
-                return conn.execute(query, (f"{date_prefix}%",)).fetchall()
+            with analytics_db() as conn:
+                return conn.execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_detailed_data_for_pdf): {e}")
             return []
 
     def get_monthly_activity_counts(self, year: int, category: str = None) -> list:
         """Trend Analizi için aylık aktivite sayılarını çeker. Dönüş: [(ay_numarası, sayi), ...]"""
-        query = """
-            SELECT CAST(substr(date, 6, 2) AS INTEGER) as month, COUNT(*)
-            FROM activities
-            WHERE substr(date, 1, 4) = ?
-        """
-        params = [str(year)]
+        query = "SELECT month, SUM(count) FROM activity_monthly_agg WHERE year = ?"
+        params = [int(year)]
 
         if category and category != "Hepsi":
-            query += " AND type = ?"
+            # Özet tablosunda type_key kolonu yok; anahtar yılın satırları (ay x tür) üzerinde türetilir
+            query += f" AND {type_key_sql('type')} = {type_key_sql('?')}"
             params.append(category)
 
         query += " GROUP BY month ORDER BY month"
 
         try:
-            with get_db() as conn:
+            with analytics_db() as conn:
                 return conn.execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_monthly_activity_counts): {e}")
@@ -279,17 +533,20 @@ class ActivityRepository:
 
     def get_activity_details_by_month(self, date_str: str, category: str = None) -> list:
         """Belirli bir aydaki aktivitelerin detaylarını getirir. Dönüş: [(name, date), ...]"""
-        query = "SELECT name, date FROM activities WHERE substr(date, 1, 7) = ?"
-        params = [date_str]
+        bounds = date_prefix_bounds(date_str)
+        if not bounds:
+            return []
+        query = "SELECT name, date FROM activities WHERE date >= ? AND date < ?"
+        params = list(bounds)
 
         if category and category != "Hepsi":
-            query += " AND type = ?"
+            query += f" AND type_key = {type_key_sql('?')}"
             params.append(category)
 
         query += " ORDER BY date DESC, name ASC"
 
         try:
-            with get_db() as conn:
+            with analytics_db() as conn:
                 return conn.execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"Hata (ActivityRepository.get_activity_details_by_month): {e}")
@@ -0,0 +1,39 @@
+# database/type_key.py
+"""
+Faaliyet türleri için Türkçe uyumlu karşılaştırma anahtarı.
+
+SQLite'ın lower() fonksiyonu yalnızca ASCII harfleri küçültür; 'Şehir' ile
+'ŞEHİR' eşleşmez. Anahtar saf SQL ile üretilir (generated column ve sorgu
+parametreleri aynı ifadeyi kullanır), böylece veritabanı harici araçlarla
+açıldığında da geçerli kalır. I/İ/ı/i harfleri aynı kabul edilir: 'DIZI',
+'Dizi' ve 'dızı' aynı türdür.
+"""
+
+# Önce Türkçe büyük harfler ve noktasız ı, ardından lower() ile ASCII harfler
+_FOLD_MAP = [
+    ("İ", "i"), ("I", "i"), ("ı", "i"),
+    ("Ç", "ç"), ("Ğ", "ğ"), ("Ö", "ö"), ("Ş", "ş"), ("Ü", "ü"),
+    ("Â", "â"), ("Î", "i"), ("î", "i"), ("Û", "û"),
+]
+
+
+def type_key_sql(expr: str) -> str:
+    """Verilen SQL ifadesinin (kolon adı veya '?') tür anahtarını üreten SQL'i döndürür."""
+    sql = expr
+    for src, dst in _FOLD_MAP:
+        sql = f"replace({sql}, '{src}', '{dst}')"
+    return f"lower({sql})"
+
+
+def type_key(name: str) -> str:
+    """type_key_sql ile aynı sonucu Python tarafında üretir."""
+    key = name or ""
+    for src, dst in _FOLD_MAP:
+        key = key.replace(src, dst)
+    return "".join(c.lower() if "A" <= c <= "Z" else c for c in key)
+
+
+def normalize_type_name(name: str) -> str:
+    """Tür adının saklanan biçimi: baştaki/sondaki boşluklar kırpılır, ilk harf büyütülür."""
+    stripped = (name or "").strip()
+    return (stripped[0].upper() + stripped[1:]) if stripped else stripped
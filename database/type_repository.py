@@ -1,39 +1,114 @@
 # database/type_repository.py
-from .connection import get_db
+import json
+import threading
+
+from . import connection
+from .connection import get_db, init_db
+from .write_queue import execute_write, run_write
+from .type_key import type_key, type_key_sql, normalize_type_name
+from constants import SETTING_TYPE_RENAME_JOB
 from logger_setup import logger
 
+# Birebir tür eşleşmesi; type_key koşulu (type_key, date) indeksini kullandırır
+_EXACT_TYPE = f"type_key = {type_key_sql('?')} AND type = ?"
 
-class TypeRepository:
-    """Faaliyet türleri ve uygulama ayarları için veritabanı işlemleri."""
+
+class _TypeCatalog:
+    """Tür listesi ve tür başına kayıt sayıları için süreç içi önbellek.
+
+    Bir kez yüklenir ve sayfalar bellekten okur. Geçerlilik iki şeye bağlıdır:
+    faaliyet yazmaları değişiklik günlüğünün son sıra numarasını (activity_changes)
+    ilerletir, tür tablosu yazmaları ise invalidate() çağırır. Havuzda yazma
+    olmadıysa (write_generation aynıysa) veritabanına hiç gidilmez; başka bir
+    tablo yazıldıysa yalnızca MAX(seq) okunur.
+    """
 
     def __init__(self):
-        self.ensure_types_table_exists()
-        self.ensure_settings_table_exists()
+        self._lock = threading.Lock()
+        self._pool = None           # yüklendiği havuz (configure_pool sonrası yeniden yüklenir)
+        self._generation = None     # son doğrulamadaki write_generation
+        self._change_seq = None     # yüklendiği andaki son değişiklik sıra numarası
+        self._usage = None          # {tür: kayıt sayısı}, kayıtlı ama kullanılmayanlar 0
+        self._types = []            # alfabetik tür listesi
 
-    # --- Tür Tablosu ---
+    def invalidate(self):
+        with self._lock:
+            self._usage = None
 
-    def ensure_types_table_exists(self):
-        """activity_types tablosunun varlığını kontrol eder ve oluşturur."""
-        from constants import FAALIYET_TURLERI
-        sql_create = '''
-            CREATE TABLE IF NOT EXISTS activity_types (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE
+    def _last_change_seq(self, conn) -> int:
+        return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM activity_changes").fetchone()[0]
+
+    def _load(self, conn):
+        # Kullanım sayıları aylık özet tablosundan: activities taranmaz
+        usage = {
+            row[0]: row[1] for row in conn.execute(
+                "SELECT type, SUM(count) FROM activity_monthly_agg "
+                "WHERE type IS NOT NULL AND type != '' GROUP BY type"
             )
-        '''
-        try:
+        }
+        for row in conn.execute("SELECT name FROM activity_types"):
+            usage.setdefault(row[0], 0)
+        self._usage = usage
+        self._types = sorted(usage)
+
+    def snapshot(self):
+        """Güncel (türler, kullanım) çiftini döndürür; gerekirse yeniden yükler."""
+        with self._lock:
+            pool = connection._pool
+            generation = pool.write_generation
+            if self._usage is not None and self._pool is pool and self._generation == generation:
+                return self._types, self._usage
+
             with get_db() as conn:
-                conn.execute(sql_create)
-                count = conn.execute("SELECT COUNT(*) FROM activity_types").fetchone()[0]
-                if count == 0:
-                    for t in FAALIYET_TURLERI:
-                        try:
-                            conn.execute("INSERT INTO activity_types (name) VALUES (?)", (t,))
-                        except Exception:
-                            pass
-                    logger.info("Varsayılan faaliyet türleri eklendi.")
-        except Exception as e:
-            logger.error(f"Hata (TypeRepository.ensure_types_table_exists): {e}")
+                seq = self._last_change_seq(conn)
+                if self._usage is None or self._pool is not pool or self._change_seq != seq:
+                    self._load(conn)
+            self._pool, self._generation, self._change_seq = pool, generation, seq
+            return self._types, self._usage
+
+
+_catalog = _TypeCatalog()
+
+
+def resolve_type(conn, name: str) -> str:
+    """Yazılacak tür adının saklanacak yazımını döndürür (yazma sırasında normalizasyon).
+
+    Aynı type_key'e sahip kayıtlı bir tür varsa onun yazımı kullanılır ('FİLM' ->
+    'Film'); yoksa ad normalize edilip activity_types'a eklenir. Böylece türler
+    açılışta taranıp düzeltilmek zorunda kalmaz. Yazma işleminin içinde çağrılmalıdır;
+    toplu yazmalar türleri executemany'den önce ayrı bir adımda çözer (add_many).
+    """
+    normalized = normalize_type_name(name)
+    if not normalized:
+        return normalized
+    row = conn.execute(
+        f"SELECT name FROM activity_types WHERE {type_key_sql('name')} = ? ORDER BY name = ? DESC, name LIMIT 1",
+        (type_key(normalized), normalized),
+    ).fetchone()
+    if row:
+        return row[0]
+    conn.execute("INSERT OR IGNORE INTO activity_types (name) VALUES (?)", (normalized,))
+    return normalized
+
+
+def invalidate_type_catalog():
+    """Tür kataloğunu bir sonraki okumada yeniden yüklenmek üzere geçersiz kılar.
+
+    Faaliyet yazmaları kendiliğinden algılanır; activity_types tablosunu
+    TypeRepository dışından değiştiren kod bunu çağırmalıdır.
+    """
+    _catalog.invalidate()
+
+
+class TypeRepository:
+    """Faaliyet türleri ve uygulama ayarları için veritabanı işlemleri."""
+
+    RENAME_CHUNK_IDS = 5000     # yeniden adlandırmada tek yazma işleminin kapsadığı id aralığı
+
+    def __init__(self):
+        init_db()
+
+    # --- Tür Tablosu ---
 
     def normalize_activity_types(self):
         """Veritabanındaki tüm tür isimlerini 'Başlık Düzeni'ne çevirir."""
@@ -44,18 +119,16 @@ class TypeRepository:
                     if row[0]
                 ]
                 for old_type in unique_types:
-                    _s = old_type.strip()
-                    new_type = (_s[0].upper() + _s[1:]) if _s else _s
+                    new_type = normalize_type_name(old_type)
                     if old_type != new_type:
                         logger.info(f"Normalizasyon: '{old_type}' -> '{new_type}' çevriliyor...")
-                        conn.execute("UPDATE activities SET type = ? WHERE type = ?", (new_type, old_type))
+                        conn.execute(f"UPDATE activities SET type = ? WHERE {_EXACT_TYPE}", (new_type, old_type, old_type))
 
                 registered_types = [
                     row[0] for row in conn.execute("SELECT name FROM activity_types").fetchall()
                 ]
                 for old_name in registered_types:
-                    _s = old_name.strip()
-                    new_name = (_s[0].upper() + _s[1:]) if _s else _s
+                    new_name = normalize_type_name(old_name)
                     if old_name != new_name:
                         exists = conn.execute(
                             "SELECT COUNT(*) FROM activity_types WHERE name = ?", (new_name,)
@@ -66,6 +139,8 @@ class TypeRepository:
                             conn.execute("UPDATE activity_types SET name = ? WHERE name = ?", (new_name, old_name))
         except Exception as e:
             logger.error(f"Hata (TypeRepository.normalize_activity_types): {e}")
+        finally:
+            _catalog.invalidate()
 
     def synchronize_types(self):
         """Activities tablosunda olup activity_types tablosunda olmayan türleri senkronize eder."""
@@ -88,30 +163,33 @@ class TypeRepository:
                         pass
         except Exception as e:
             logger.error(f"Hata (TypeRepository.synchronize_types): {e}")
+        finally:
+            _catalog.invalidate()
 
     def get_all_types(self) -> list:
-        """Tüm aktif türleri alfabetik sırayla döndürür (kayıtlı + kullanılan)."""
-        self.ensure_types_table_exists()
-        sql = """
-            SELECT DISTINCT name FROM (
-                SELECT name FROM activity_types
-                UNION
-                SELECT DISTINCT type as name FROM activities WHERE type IS NOT NULL AND type != ''
-            )
-            ORDER BY name ASC
-        """
+        """Tüm aktif türleri alfabetik sırayla döndürür (kayıtlı + kullanılan).
+        Katalogdan okunur; yalnızca tür veya faaliyet yazmasından sonra yeniden yüklenir."""
         try:
-            with get_db() as conn:
-                return [row[0] for row in conn.execute(sql).fetchall()]
+            types, _ = _catalog.snapshot()
+            return list(types)
         except Exception as e:
             logger.error(f"Hata (TypeRepository.get_all_types): {e}")
             return []
 
+    def get_type_usage(self) -> dict:
+        """{tür: kayıt sayısı} — alfabetik sırada; kayıtlı ama kullanılmayan türler 0."""
+        try:
+            types, usage = _catalog.snapshot()
+            return {t: usage[t] for t in types}
+        except Exception as e:
+            logger.error(f"Hata (TypeRepository.get_type_usage): {e}")
+            return {}
+
     def add_type(self, name: str) -> tuple:
         """Yeni bir tür ekler."""
         try:
-            with get_db() as conn:
-                conn.execute("INSERT INTO activity_types (name) VALUES (?)", (name,))
+            execute_write("INSERT INTO activity_types (name) VALUES (?)", (name,))
+            _catalog.invalidate()
             return True, "Tür başarıyla eklendi."
         except Exception as e:
             logger.error(f"Hata (TypeRepository.add_type): {e}")
@@ -119,31 +197,99 @@ class TypeRepository:
                 return False, "Bu tür zaten mevcut."
             return False, f"Hata: {e}"
 
-    def update_type(self, old_name: str, new_name: str) -> tuple:
-        """Bir türü yeniden adlandırır. Yeni isim zaten varsa BİRLEŞTİRİR."""
+    def update_type(self, old_name: str, new_name: str, progress=None, is_cancelled=None) -> tuple:
+        """Bir türü yeniden adlandırır. Yeni isim zaten varsa BİRLEŞTİRİR.
+
+        Tür tablosu tek yazmada değişir; kayıtlar ise RENAME_CHUNK_IDS'lik id
+        aralıklarıyla, her biri kısa bir yazma işleminde güncellenir (yazma kilidi
+        tüm tablo boyunca tutulmaz). İşin durumu her parçayla birlikte settings'e
+        (SETTING_TYPE_RENAME_JOB) yazılır: is_cancelled() ile durdurulan veya
+        uygulama kapanınca yarıda kalan iş resume_type_rename ile sürdürülür.
+        progress(taranan_id, toplam_id) her parçadan sonra çağrılır.
+        """
+        def start(conn):
+            if conn.execute("SELECT 1 FROM settings WHERE key = ?", (SETTING_TYPE_RENAME_JOB,)).fetchone():
+                return None
+            merge = conn.execute(
+                "SELECT COUNT(*) FROM activity_types WHERE name = ?", (new_name,)
+            ).fetchone()[0] > 0
+            if merge:
+                conn.execute("DELETE FROM activity_types WHERE name = ?", (old_name,))
+            elif conn.execute("UPDATE activity_types SET name = ? WHERE name = ?", (new_name, old_name)).rowcount == 0:
+                # Kayıtlı olmayan (yalnızca kayıtlarda geçen) tür
+                conn.execute("INSERT OR IGNORE INTO activity_types (name) VALUES (?)", (new_name,))
+            # Ayrı sorgular: tek MIN/MAX rowid'den okunur, ikisi birlikte tabloyu tarar
+            first_id = conn.execute("SELECT COALESCE(MIN(id), 1) FROM activities").fetchone()[0]
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM activities").fetchone()[0]
+            job = {
+                'old': old_name, 'new': new_name, 'merge': merge, 'updated': 0,
+                'first_id': first_id, 'next_id': first_id, 'max_id': max_id,
+            }
+            self._save_rename_job(conn, job)
+            return job
+
         try:
-            with get_db() as conn:
-                target_exists = conn.execute(
-                    "SELECT COUNT(*) FROM activity_types WHERE name = ?", (new_name,)
-                ).fetchone()[0] > 0
-
-                if target_exists:
-                    conn.execute("UPDATE activities SET type = ? WHERE type = ?", (new_name, old_name))
-                    conn.execute("DELETE FROM activity_types WHERE name = ?", (old_name,))
-                    return True, f"'{old_name}' türü mevcut '{new_name}' türü ile birleştirildi."
-                else:
-                    conn.execute("UPDATE activity_types SET name = ? WHERE name = ?", (new_name, old_name))
-                    conn.execute("UPDATE activities SET type = ? WHERE type = ?", (new_name, old_name))
-                    return True, f"'{old_name}' ismi '{new_name}' olarak değiştirildi."
+            job = run_write(start)
+            _catalog.invalidate()
+            if job is None:
+                return False, "Yarıda kalmış bir tür yeniden adlandırma işlemi var; önce o tamamlanmalı."
+            return self._run_rename_job(job, progress, is_cancelled)
         except Exception as e:
             logger.error(f"Hata (TypeRepository.update_type): {e}")
             return False, f"Hata: {e}"
 
+    def resume_type_rename(self, progress=None, is_cancelled=None):
+        """Yarıda kalmış yeniden adlandırmayı kaldığı parçadan sürdürür.
+        Bekleyen iş yoksa None, varsa update_type ile aynı sonucu döndürür."""
+        try:
+            value = self.get_setting(SETTING_TYPE_RENAME_JOB)
+            if not value:
+                return None
+            job = json.loads(value)
+            logger.info(f"Yarıda kalan tür yeniden adlandırma sürdürülüyor: '{job['old']}' -> '{job['new']}'")
+            return self._run_rename_job(job, progress, is_cancelled)
+        except Exception as e:
+            logger.error(f"Hata (TypeRepository.resume_type_rename): {e}")
+            return False, f"Hata: {e}"
+
+    @staticmethod
+    def _save_rename_job(conn, job):
+        conn.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            (SETTING_TYPE_RENAME_JOB, json.dumps(job, ensure_ascii=False)),
+        )
+
+    def _run_rename_job(self, job, progress=None, is_cancelled=None) -> tuple:
+        # Yalnızca "type = ?": id aralığı rowid üzerinden taranır, type_key indeksi seçilmez
+        sql = "UPDATE activities SET type = ? WHERE id BETWEEN ? AND ? AND type = ?"
+
+        while job['next_id'] <= job['max_id']:
+            if is_cancelled and is_cancelled():
+                return False, f"Yeniden adlandırma durduruldu ({job['updated']} kayıt güncellendi); kaldığı yerden sürdürülecek."
+            high = min(job['next_id'] + self.RENAME_CHUNK_IDS - 1, job['max_id'])
+
+            def step(conn, job=job, high=high):
+                updated = conn.execute(sql, (job['new'], job['next_id'], high, job['old'])).rowcount
+                next_job = dict(job, next_id=high + 1, updated=job['updated'] + updated)
+                self._save_rename_job(conn, next_job)
+                return next_job
+
+            job = run_write(step)
+            if progress:
+                progress(high - job['first_id'] + 1, job['max_id'] - job['first_id'] + 1)
+
+        execute_write("DELETE FROM settings WHERE key = ?", (SETTING_TYPE_RENAME_JOB,))
+        _catalog.invalidate()
+        logger.info(f"Tür yeniden adlandırıldı: '{job['old']}' -> '{job['new']}' ({job['updated']} kayıt)")
+        if job['merge']:
+            return True, f"'{job['old']}' türü mevcut '{job['new']}' türü ile birleştirildi."
+        return True, f"'{job['old']}' ismi '{job['new']}' olarak değiştirildi."
+
     def delete_type(self, name: str) -> tuple:
         """Bir türü siler. (Kullanımdaki kayıtlara dokunmaz, sadece listeden kaldırır)"""
         try:
-            with get_db() as conn:
-                conn.execute("DELETE FROM activity_types WHERE name = ?", (name,))
+            execute_write("DELETE FROM activity_types WHERE name = ?", (name,))
+            _catalog.invalidate()
             return True, "Tür silindi."
         except Exception as e:
             logger.error(f"Hata (TypeRepository.delete_type): {e}")
@@ -151,20 +297,6 @@ class TypeRepository:
 
     # --- Ayarlar ---
 
-    def ensure_settings_table_exists(self):
-        """Ayarlar tablosunu oluşturur."""
-        sql = '''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        '''
-        try:
-            with get_db() as conn:
-                conn.execute(sql)
-        except Exception as e:
-            logger.error(f"Hata (TypeRepository.ensure_settings_table_exists): {e}")
-
     def get_setting(self, key: str):
         """Belirtilen anahtarın değerini döndürür."""
         try:
@@ -178,8 +310,7 @@ class TypeRepository:
     def set_setting(self, key: str, value: str) -> bool:
         """Ayarı kaydeder veya günceller."""
         try:
-            with get_db() as conn:
-                conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
+            execute_write("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
             return True
         except Exception as e:
             logger.error(f"Hata (TypeRepository.set_setting): {e}")
@@ -0,0 +1,183 @@
+# database/write_queue.py
+"""
+Tek yazıcı thread'i ve toplu commit (group commit).
+
+Küçük yazmalar (faaliyet ekle/güncelle/sil, plan ilerlemesi, ayarlar, öneri
+önbelleği) kendi DbWorker bağlantılarında ayrı ayrı commit etmek yerine bu
+kuyruğa bırakılır. Yazıcı thread ilk işi aldıktan sonra WINDOW_MS içinde gelen
+diğer işleri de toplar ve hepsini tek işlemde (tek fsync) yazar. Böylece
+eşzamanlı yazmalar "database is locked" hatasıyla karşılaşmaz.
+
+Her iş kendi SAVEPOINT'inde çalışır: biri hata verirse yalnız o geri alınır,
+diğerleri commit edilir. Çağıran thread (DbWorker) sonuç gelene kadar bekler,
+dolayısıyla repository metodlarının dönüş değerleri ve callback'ler değişmez.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from . import connection
+from logger_setup import logger
+
+_STOP = object()
+
+
+class WriteQueue:
+    WINDOW_MS = 2       # ilk işten sonra diğer işlerin beklendiği süre
+    MAX_BATCH = 64      # tek işlemdeki en fazla iş
+
+    def __init__(self, window_ms=WINDOW_MS, max_batch=MAX_BATCH):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._conn = None   # yazıcı thread'in o anki bağlantısı (iç içe yazmalar için)
+        self._stats_lock = threading.Lock()
+        self._submitted = 0
+        self._committed = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_batch_seen = 0
+        self._max_depth = 0
+        self._thread.start()
+
+    # --- Çağıran taraf ---
+
+    def submit(self, op) -> Future:
+        """op(conn) işini kuyruğa ekler; sonucu commit'ten sonra Future ile döner."""
+        future = Future()
+        self._queue.put((connection.bind_trace_caller(op), future))
+        with self._stats_lock:
+            self._submitted += 1
+            self._max_depth = max(self._max_depth, self._queue.qsize())
+        return future
+
+    def execute(self, op):
+        """op(conn) işini yazıcı thread'de çalıştırır ve commit edilene kadar bekler.
+        op'un dönüş değerini döndürür; hata verirse aynı hatayı fırlatır."""
+        if threading.current_thread() is self._thread:
+            # Yazıcı thread içinden (iç içe) çağrı: aynı işleme dahil et
+            return op(self._conn)
+        return self.submit(op).result()
+
+    def shutdown(self, timeout=5.0):
+        """Kuyruktaki işleri yazıp thread'i durdurur."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # --- Yazıcı thread ---
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)  # mevcut parti yazıldıktan sonra dur
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._write_batch(self._collect(item))
+
+    def _write_batch(self, batch):
+        results = []
+        try:
+            with connection.get_db() as conn:
+                self._conn = conn
+                conn.execute("BEGIN IMMEDIATE")
+                for op, future in batch:
+                    conn.execute("SAVEPOINT write_op")
+                    try:
+                        results.append((future, op(conn), None))
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO write_op")
+                        results.append((future, None, e))
+                    conn.execute("RELEASE write_op")
+        except Exception as e:
+            # Commit veya işlem başlatma başarısız: partideki tüm yazmalar geri alındı
+            logger.error(f"Hata (WriteQueue._write_batch): {e}")
+            results = [(future, None, e) for _, future in batch]
+        finally:
+            self._conn = None
+
+        # Sonuçlar bağlantı havuza döndükten (write_generation arttıktan) sonra bildirilir
+        failed = 0
+        for future, value, error in results:
+            if error is None:
+                future.set_result(value)
+            else:
+                failed += 1
+                future.set_exception(error)
+        with self._stats_lock:
+            self._batches += 1
+            self._committed += len(batch) - failed
+            self._failed += failed
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+
+    def stats(self) -> dict:
+        """Kuyruk derinliği ve commit parti boyutu ölçümleri."""
+        with self._stats_lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self._max_depth,
+                'submitted': self._submitted,
+                'committed': self._committed,
+                'failed': self._failed,
+                'batches': self._batches,
+                'max_batch': self._max_batch_seen,
+                'avg_batch': (self._committed + self._failed) / self._batches if self._batches else 0.0,
+            }
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> WriteQueue:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = WriteQueue()
+        return _writer
+
+
+def run_write(op):
+    """op(conn)'u tek yazıcı thread'de, toplu commit ile çalıştırır; sonucunu döndürür."""
+    return _get_writer().execute(op)
+
+
+def execute_write(sql, params=()) -> int:
+    """Tek bir yazma ifadesini kuyruk üzerinden çalıştırır; etkilenen satır sayısını döndürür."""
+    return run_write(lambda conn: conn.execute(sql, params).rowcount)
+
+
+def shutdown_writer():
+    """Bekleyen yazmaları bitirip yazıcı thread'i durdurur (uygulama kapanırken).
+    Sonraki yazma yeni bir yazıcı başlatır."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.shutdown()
+        stats = writer.stats()
+        logger.info(
+            f"Yazma kuyruğu kapatıldı: {stats['committed']} yazma {stats['batches']} commit ile "
+            f"(en büyük parti {stats['max_batch']}, en yüksek kuyruk {stats['max_queue_depth']})."
+        )
+
+
+def get_writer_stats():
+    """Yazma kuyruğu ölçümlerini döndürür; yazıcı henüz başlamadıysa None."""
+    writer = _writer
+    return writer.stats() if writer is not None else None
@@ -9,7 +9,7 @@ _LOG_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
 _LOG_BACKUP_COUNT = 3
 
 
-def _get_log_file_path():
+def _get_log_file_path(filename=None):
     from constants import DATA_DIR_NAME, LOG_FILENAME
     if sys.platform == "win32":
         base = os.environ.get('LOCALAPPDATA') or os.path.expanduser("~")
@@ -17,7 +17,7 @@ def _get_log_file_path():
         base = os.path.join(os.path.expanduser("~"), ".config")
     log_dir = os.path.join(base, DATA_DIR_NAME)
     os.makedirs(log_dir, exist_ok=True)
-    return os.path.join(log_dir, LOG_FILENAME)
+    return os.path.join(log_dir, filename or LOG_FILENAME)
 
 
 def setup_logger():
@@ -48,5 +48,29 @@ def setup_logger():
 
     return logger
 
+def setup_slow_query_logger():
+    """Yavaş sorgu günlüğünü (ayrı dosya) oluşturur ve döndürür.
+
+    Sorgu izleme açıldığında çağrılır; kayıtlar uygulama günlüğüne karışmaz.
+    """
+    from constants import APP_NAME, SLOW_QUERY_LOG_FILENAME
+    slow_logger = logging.getLogger(f"{APP_NAME}.slow_queries")
+    if slow_logger.handlers:
+        return slow_logger
+    slow_logger.setLevel(logging.INFO)
+    slow_logger.propagate = False
+    try:
+        handler = logging.handlers.RotatingFileHandler(
+            _get_log_file_path(SLOW_QUERY_LOG_FILENAME),
+            maxBytes=_LOG_MAX_BYTES,
+            backupCount=_LOG_BACKUP_COUNT,
+            encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        slow_logger.addHandler(handler)
+    except Exception as e:
+        print(f"[logger_setup] Yavaş sorgu günlüğü oluşturulamadı: {e}", file=sys.stderr)
+    return slow_logger
+
 # Global logger nesnesi
 logger = setup_logger()
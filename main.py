@@ -122,6 +122,14 @@ def main():
         if os.path.exists(icon_path):
              app.setWindowIcon(QIcon(icon_path)) 
 
+        from database.connection import close_pool
+        from database.write_queue import shutdown_writer
+        from database.backup import shutdown_backups
+        # Önce bekleyen yazmalar bitirilir, sonra bağlantılar kapatılır
+        app.aboutToQuit.connect(shutdown_writer)
+        app.aboutToQuit.connect(shutdown_backups)
+        app.aboutToQuit.connect(close_pool)
+
         window = MainWindow()
         window.show()
         
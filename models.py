@@ -1,6 +1,24 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import Optional
 
+
+def _slotted(cls):
+    """@dataclass sınıfını __slots__'lu olarak yeniden oluşturur (Python 3.8'de
+    dataclass(slots=True) yok). Nesne başına __dict__ tutulmaz; büyük sonuç
+    kümelerinde bellek ve oluşturma süresi azalır."""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names + ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _optional(row, key):
+    """Satırda kolon yoksa None (eski şemadan gelen satırlar için)."""
+    try:
+        return row[key]
+    except (IndexError, KeyError):
+        return None
+
 @dataclass
 class ActivityFilter:
     """Filtreleme parametrelerini taşıyan sınıf."""
@@ -9,9 +27,16 @@ class ActivityFilter:
     date_filter: str = "" # "YYYY-MM" veya "YYYY"
     page: int = 1
     items_per_page: int = 15
+    cursor: Optional[tuple] = None # (date, id) — önceki sayfanın son kaydı; verilirse OFFSET yerine seek yapılır
+
+    def count_key(self) -> tuple:
+        """Toplam kayıt sayısını belirleyen alanlar (sayfalama alanları hariç)."""
+        return (self.type_filter, self.search_term, self.date_filter)
 
 
 class Activity:
+    __slots__ = ('id', 'type', 'name', 'date', 'end_date', 'comment', 'rating')
+
     def __init__(self, id, type, name, date, comment, rating, end_date=None):
         self.id = id
         self.type = type
@@ -21,19 +46,17 @@ class Activity:
         self.comment = comment
         self.rating = rating
 
+    @classmethod
+    def row_factory(cls, cursor, row):
+        """Cursor row_factory'si: (id, type, name, date, comment, rating, end_date)
+        sırasındaki tuple'dan doğrudan nesne oluşturur (bkz. database.connection.model_cursor)."""
+        return cls(*row)
+
     @classmethod
     def from_row(cls, row):
-        """Veritabanından gelen bir satırı Activity nesnesine çevirir."""
-        keys = row.keys() if hasattr(row, 'keys') else []
-        return cls(
-            id=row['id'],
-            type=row['type'],
-            name=row['name'],
-            date=row['date'],
-            comment=row['comment'],
-            rating=row['rating'],
-            end_date=row['end_date'] if 'end_date' in keys else None,
-        )
+        """Veritabanından gelen bir satırı (sqlite3.Row) Activity nesnesine çevirir."""
+        return cls(row['id'], row['type'], row['name'], row['date'], row['comment'], row['rating'],
+                   _optional(row, 'end_date'))
 
     def __str__(self):
         puan = self.rating if self.rating else 'N/A'
@@ -42,6 +65,7 @@ class Activity:
             date_str += f" -> {self.end_date}"
         return f"[{date_str}] {self.type.upper()}: {self.name} ({puan}/10)"
 
+@_slotted
 @dataclass
 class Folder:
     """Proje/Klasör Modeli."""
@@ -49,10 +73,16 @@ class Folder:
     name: str
     created_at: str
 
+    @classmethod
+    def row_factory(cls, cursor, row):
+        """(id, name, created_at) tuple'ından nesne oluşturan cursor row_factory'si."""
+        return cls(*row)
+
     @classmethod
     def from_row(cls, row):
         return cls(id=row['id'], name=row['name'], created_at=row['created_at'])
 
+@_slotted
 @dataclass
 class Plan:
     """Yıllık ve Aylık Plan/Hedef Modeli."""
@@ -68,9 +98,14 @@ class Plan:
     created_at: str
     folder_id: Optional[int] = None # Proje/Klasör ID'si
 
+    @classmethod
+    def row_factory(cls, cursor, row):
+        """Kolonları alan sırasıyla seçilmiş tuple'dan Plan oluşturan cursor row_factory'si."""
+        return cls(*row)
+
     @classmethod
     def from_row(cls, row):
-        """Veritabanı satırından Plan oluşturur."""
+        """Veritabanı satırından (sqlite3.Row) Plan oluşturur."""
         return cls(
             id=row['id'],
             title=row['title'],
@@ -82,5 +117,31 @@ class Plan:
             progress=row['progress'],
             priority=row['priority'],
             created_at=row['created_at'],
-            folder_id=row['folder_id'] if 'folder_id' in row.keys() else None,
+            folder_id=_optional(row, 'folder_id'),
         )
+
+@dataclass
+class ActivityChange:
+    """Değişiklik günlüğündeki (activity_changes) tek bir delta.
+    op: 'I' ekleme, 'U' güncelleme, 'D' silme. Eklemede old_*, silmede new_* alanları None'dır."""
+    seq: int
+    op: str
+    activity_id: int
+    old_type: Optional[str] = None
+    old_date: Optional[str] = None
+    old_end_date: Optional[str] = None
+    old_rating: Optional[int] = None
+    new_type: Optional[str] = None
+    new_date: Optional[str] = None
+    new_end_date: Optional[str] = None
+    new_rating: Optional[int] = None
+    activity: Optional[Activity] = None  # kaydın güncel hali (silindiyse None)
+
+@dataclass
+class ChangeSet:
+    """Bir seq'ten sonraki değişiklikler. truncated True ise değişiklik sayısı
+    sınırı aşmıştır (ör. toplu içe aktarma); dinleyiciler tam yeniden yükleme yapmalıdır."""
+    last_seq: int
+    changes: list = field(default_factory=list)
+    truncated: bool = False
+
@@ -0,0 +1,106 @@
+# services/export_service.py
+"""
+Faaliyet, plan ve klasörlerin CSV / JSON Lines olarak dışa aktarılması.
+
+Kayıtlar repository generator'larından (fetchmany) akış halinde okunup dosyaya
+satır satır yazılır; bellek kullanımı veri boyutundan bağımsızdır. Dosya önce
+'.part' uzantısıyla yazılır ve tamamlanınca yerine taşınır, böylece iptal veya
+hata durumunda yarım dosya kalmaz. Çıktılar ImportService ile geri okunabilir.
+"""
+import csv
+import json
+import os
+
+from models import ActivityFilter
+from services.import_service import ACTIVITY_FIELDS, PLAN_FIELDS, FOLDER_FIELDS, DATASETS, JSONL_EXTENSIONS
+from logger_setup import logger
+
+
+class ExportService:
+    BATCH_SIZE = 500        # fetchmany parça boyutu
+    PROGRESS_EVERY = 1000   # kaç satırda bir ilerleme bildirilir
+
+    def __init__(self, repository, plan_repository=None, batch_size=BATCH_SIZE):
+        self.repository = repository
+        self.plan_repository = plan_repository
+        self.batch_size = batch_size
+
+    def _write(self, path, fields, items, total=0, progress=None, is_cancelled=None):
+        """Nesneleri dosyaya yazar; yazılan satır sayısını, iptal edilirse None döndürür."""
+        as_jsonl = path.lower().endswith(JSONL_EXTENSIONS)
+        part_path = path + ".part"
+        count = 0
+        cancelled = False
+        try:
+            # CSV'de BOM: Excel Türkçe karakterleri doğru açar
+            with open(part_path, "w", newline="", encoding="utf-8" if as_jsonl else "utf-8-sig") as f:
+                if as_jsonl:
+                    def write_row(values):
+                        f.write(json.dumps(dict(zip(fields, values)), ensure_ascii=False))
+                        f.write("\n")
+                else:
+                    writer = csv.writer(f)
+                    writer.writerow(fields)
+
+                    def write_row(values):
+                        writer.writerow(["" if v is None else v for v in values])
+
+                for item in items:
+                    write_row([getattr(item, name) for name in fields])
+                    count += 1
+                    if count % self.PROGRESS_EVERY == 0:
+                        if progress:
+                            progress(count, max(total, count))
+                        if is_cancelled and is_cancelled():
+                            cancelled = True
+                            break
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        finally:
+            # Okuma bağlantısını beklemeden havuza iade et
+            items.close()
+
+        if cancelled:
+            os.remove(part_path)
+            return None
+        os.replace(part_path, path)
+        if progress:
+            progress(count, count)
+        logger.info(f"Dışa aktarma ({os.path.basename(path)}): {count} kayıt")
+        return count
+
+    def export_activities(self, path, filter_obj: ActivityFilter = None, progress=None, is_cancelled=None):
+        """ActivityFilter'a (tür, arama, dönem) uyan faaliyetleri tarih sırasıyla yazar.
+        Sayfalama alanları yok sayılır."""
+        filter_obj = filter_obj or ActivityFilter()
+        total = self.repository.count_filtered(filter_obj) if progress else 0
+        items = self.repository.iter_filtered(filter_obj, self.batch_size)
+        return self._write(path, ACTIVITY_FIELDS, items, total, progress, is_cancelled)
+
+    def export_plans(self, path, progress=None, is_cancelled=None):
+        items = self.plan_repository.iter_plans(self.batch_size)
+        return self._write(path, PLAN_FIELDS, items, 0, progress, is_cancelled)
+
+    def export_folders(self, path, progress=None, is_cancelled=None):
+        items = self.plan_repository.iter_folders(self.batch_size)
+        return self._write(path, FOLDER_FIELDS, items, 0, progress, is_cancelled)
+
+    def export_database(self, directory, fmt="jsonl", progress=None, is_cancelled=None):
+        """Tüm veriyi dizine folders/plans/activities.<fmt> olarak yazar.
+        Dönüş: {veri kümesi: kayıt sayısı}, iptal edilirse None."""
+        os.makedirs(directory, exist_ok=True)
+        exporters = {
+            "folders": self.export_folders,
+            "plans": self.export_plans,
+            "activities": self.export_activities,
+        }
+        counts = {}
+        for name, _ in DATASETS:
+            count = exporters[name](os.path.join(directory, f"{name}.{fmt}"),
+                                    progress=progress, is_cancelled=is_cancelled)
+            if count is None:
+                return None
+            counts[name] = count
+        return counts
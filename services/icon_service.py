@@ -48,6 +48,9 @@ class IconService:
         "random":        ("fa5s.random",               "sidebar"),
         "search":        ("fa5s.search",               "muted"),
         "key":           ("fa5s.key",                  "muted"),
+        "database":      ("fa5s.database",             "muted"),
+        "import":        ("fa5s.file-import",          "sidebar"),
+        "export":        ("fa5s.file-export",          "sidebar"),
         "menu":          ("fa5s.bars",                 "sidebar"),
 
         # — Durum göstergeleri —
@@ -0,0 +1,263 @@
+# services/import_service.py
+"""
+CSV / JSON Lines dosyalarından toplu içe aktarma.
+
+Dosya satır satır (generator) okunur, her satır uygulamanın kurallarıyla
+doğrulanır (utils.build_activity / build_plan) ve geçerli kayıtlar
+CHUNK_SIZE'lık parçalar halinde tek işlemde yazılır. Reddedilen satırlar satır
+numarası ve sebebiyle raporlanır.
+
+Faaliyet kolonları: type, name, date, comment, rating, end_date
+(Türkçe başlıklar da kabul edilir: tür, ad, tarih, yorum, puan, bitiş).
+ExportService'in ürettiği dosyalar (faaliyet, plan, klasör) aynen geri okunur.
+"""
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+
+from exceptions import ValidationError
+from models import Folder
+from utils import build_activity, build_plan
+from logger_setup import logger
+
+ACTIVITY_FIELDS = ("type", "name", "date", "comment", "rating", "end_date")
+PLAN_FIELDS = ("id", "title", "description", "scope", "year", "month",
+               "status", "progress", "priority", "created_at", "folder_id")
+FOLDER_FIELDS = ("id", "name", "created_at")
+
+# Veritabanı dışa/içe aktarma dosyaları; sıra içe aktarma sırasıdır
+# (planlar klasör ID'lerine bağlı olduğu için önce klasörler).
+DATASETS = (
+    ("folders", FOLDER_FIELDS),
+    ("plans", PLAN_FIELDS),
+    ("activities", ACTIVITY_FIELDS),
+)
+
+_FIELD_ALIASES = {
+    "tür": "type", "tur": "type",
+    "ad": "name", "isim": "name",
+    "tarih": "date", "başlangıç": "date", "baslangic": "date",
+    "yorum": "comment",
+    "puan": "rating",
+    "bitiş": "end_date", "bitis": "end_date",
+}
+
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+
+
+@dataclass
+class ImportReport:
+    """İçe aktarma sonucu."""
+    total: int = 0                                  # okunan veri satırı
+    imported: int = 0
+    rejected: list = field(default_factory=list)    # [(satır no, sebep, ham kayıt)]
+    cancelled: bool = False
+
+    def summary(self) -> str:
+        text = f"{self.imported} kayıt içe aktarıldı, {len(self.rejected)} satır reddedildi."
+        if self.cancelled:
+            text += " (İşlem iptal edildi)"
+        return text
+
+
+def _normalize_record(record: dict, fields=ACTIVITY_FIELDS) -> dict:
+    normalized = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        name = str(key).strip().lower()
+        name = _FIELD_ALIASES.get(name, name)
+        if name in fields:
+            normalized[name] = "" if value is None else str(value).strip()
+    return normalized
+
+
+def _iter_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.DictReader(f, dialect=dialect)
+        for record in reader:
+            # Başlık 1. satır; veri satırları 2'den başlar
+            yield reader.line_num, record, None
+
+
+def _iter_jsonl(path):
+    with open(path, encoding="utf-8-sig") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, None, f"Geçersiz JSON: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, None, "Satır bir JSON nesnesi değil."
+                continue
+            yield line_no, record, None
+
+
+def iter_records(path):
+    """Dosyadaki kayıtları (satır no, kayıt, hata) olarak sırayla üretir."""
+    if path.lower().endswith(JSONL_EXTENSIONS):
+        return _iter_jsonl(path)
+    return _iter_csv(path)
+
+
+def count_lines(path) -> int:
+    """İlerleme yüzdesi için satır sayısını tahmin eder (ikili okuma, ayrıştırmasız)."""
+    count = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+    return count
+
+
+def find_dataset_file(directory, name):
+    """Dizindeki <name>.jsonl / <name>.csv dosyasını döndürür; yoksa None."""
+    for ext in (".jsonl", ".csv"):
+        path = os.path.join(directory, name + ext)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+class ImportService:
+    CHUNK_SIZE = 1000
+
+    def __init__(self, repository, chunk_size=CHUNK_SIZE, plan_repository=None):
+        self.repository = repository
+        self.chunk_size = chunk_size
+        self.plan_repository = plan_repository
+
+    def _import(self, path, fields, build, write, progress=None, is_cancelled=None) -> ImportReport:
+        """Ortak okuma / doğrulama / parça parça yazma döngüsü.
+
+        build(alanlar) doğrulanmış nesneyi döndürür veya ValidationError
+        fırlatır; write(nesneler) bir parçayı tek işlemde yazar ve başarıyı
+        döndürür. progress(işlenen, toplam_tahmini) her parçadan sonra
+        çağrılır; is_cancelled() True dönerse sıradaki parçadan önce durulur
+        (yazılmış parçalar kalır).
+        """
+        report = ImportReport()
+        total_estimate = max(count_lines(path), 1)
+        chunk = []  # [(satır no, nesne, ham kayıt)]
+
+        def flush():
+            if not chunk:
+                return
+            if write([item for _, item, _ in chunk]):
+                report.imported += len(chunk)
+            else:
+                report.rejected.extend((line_no, "Veritabanına yazılamadı.", raw) for line_no, _, raw in chunk)
+            chunk.clear()
+            if progress:
+                progress(report.total, total_estimate)
+
+        for line_no, record, error in iter_records(path):
+            report.total += 1
+            if error:
+                report.rejected.append((line_no, error, record))
+                continue
+            try:
+                item = build(_normalize_record(record, fields))
+            except ValidationError as e:
+                report.rejected.append((line_no, str(e), record))
+                continue
+
+            chunk.append((line_no, item, record))
+            if len(chunk) >= self.chunk_size:
+                flush()
+                if is_cancelled and is_cancelled():
+                    report.cancelled = True
+                    break
+        else:
+            flush()
+
+        if progress:
+            progress(report.total, report.total)
+        logger.info(f"İçe aktarma ({os.path.basename(path)}): {report.summary()}")
+        return report
+
+    def import_file(self, path, progress=None, is_cancelled=None) -> ImportReport:
+        """Faaliyet dosyasını içe aktarır (AddPage kurallarıyla doğrulanır)."""
+        def build(f):
+            return build_activity(f.get("type"), f.get("name"), f.get("date"),
+                                  f.get("comment"), f.get("rating"), f.get("end_date") or None)
+
+        return self._import(path, ACTIVITY_FIELDS, build, self.repository.add_many, progress, is_cancelled)
+
+    def import_folders(self, path, progress=None, is_cancelled=None):
+        """Klasör dosyasını içe aktarır. Dönüş: (rapor, {eski id: yeni id})."""
+        folder_map = {}
+
+        def build(f):
+            if not f.get("name"):
+                raise ValidationError("Klasör adı boş olamaz.")
+            return f.get("id"), Folder(None, f["name"], f.get("created_at") or None)
+
+        def write(items):
+            new_ids = self.plan_repository.add_folders([folder for _, folder in items])
+            if new_ids is None:
+                return False
+            for (old_id, _), new_id in zip(items, new_ids):
+                if old_id:
+                    folder_map[old_id] = new_id
+            return True
+
+        report = self._import(path, FOLDER_FIELDS, build, write, progress, is_cancelled)
+        return report, folder_map
+
+    def import_plans(self, path, folder_map=None, progress=None, is_cancelled=None) -> ImportReport:
+        """Plan dosyasını içe aktarır. folder_map verilmezse klasör bağlantısı
+        kurulmaz (başka veritabanının ID'leri anlamsızdır)."""
+        folder_map = folder_map or {}
+
+        def build(f):
+            return build_plan(
+                f.get("title"), f.get("description"), f.get("scope"), f.get("year"), f.get("month"),
+                f.get("status"), f.get("progress"), f.get("priority"), f.get("created_at") or None,
+                folder_map.get(f.get("folder_id")),
+            )
+
+        return self._import(path, PLAN_FIELDS, build, self.plan_repository.add_plans, progress, is_cancelled)
+
+    def import_database(self, directory, progress=None, is_cancelled=None) -> dict:
+        """ExportService.export_database çıktısını (folders/plans/activities)
+        sırayla içe aktarır. Dönüş: {veri kümesi: ImportReport}."""
+        reports = {}
+        folder_map = {}
+        for name, _ in DATASETS:
+            path = find_dataset_file(directory, name)
+            if not path:
+                continue
+            if name == "folders":
+                reports[name], folder_map = self.import_folders(path, progress, is_cancelled)
+            elif name == "plans":
+                reports[name] = self.import_plans(path, folder_map, progress, is_cancelled)
+            else:
+                reports[name] = self.import_file(path, progress, is_cancelled)
+            if reports[name].cancelled:
+                break
+        return reports
+
+    @staticmethod
+    def write_rejected(report: ImportReport, path, fields=ACTIVITY_FIELDS) -> bool:
+        """Reddedilen satırları sebepleriyle birlikte CSV olarak kaydeder."""
+        try:
+            with open(path, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.writer(f)
+                writer.writerow(["satir", "hata", *fields])
+                for line_no, reason, raw in report.rejected:
+                    values = _normalize_record(raw, fields) if isinstance(raw, dict) else {}
+                    writer.writerow([line_no, reason, *(values.get(k, "") for k in fields)])
+            return True
+        except OSError as e:
+            logger.error(f"Hata (ImportService.write_rejected): {e}")
+            return False
@@ -0,0 +1,88 @@
+import sys
+import os
+import sqlite3
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool
+from database.repository import ActivityRepository
+from database import replica
+from models import Activity
+
+
+class TestAnalyticsReplica(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.repo.add_many([
+            Activity(None, "Film", "Dune", "2023-05-01", "", 8, None),
+            Activity(None, "Film", "Arrival", "2023-05-10", "", 6, None),
+            Activity(None, "Kitap", "Sefiller", "2023-06-01", "", 0, None),
+        ])
+
+    def tearDown(self):
+        replica.disable_replica()
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def analytics(self):
+        return (
+            [tuple(r) for r in self.repo.get_stats_by_type("2023", year_only=True)],
+            [tuple(r) for r in self.repo.get_details_for_type("film", "2023-05")],
+            sorted(tuple(r) for r in self.repo.get_comparison_data("2023")),
+            self.repo.get_available_periods("month"),
+            [tuple(r) for r in self.repo.get_detailed_data_for_pdf("")],
+            [tuple(r) for r in self.repo.get_monthly_activity_counts(2023)],
+            [tuple(r) for r in self.repo.get_activity_details_by_month("2023-05", "Film")],
+        )
+
+    def test_replica_matches_disk(self):
+        disk = self.analytics()
+        self.assertTrue(replica.enable_replica())
+        self.assertEqual(self.analytics(), disk)
+        stats = replica.get_replica_stats()
+        self.assertEqual((stats['hits'], stats['fallbacks']), (7, 0))
+
+    def test_stale_replica_falls_back_to_disk_until_refreshed(self):
+        replica.enable_replica()
+        self.repo.add(Activity(None, "Film", "Tenet", "2023-05-20", "", 7, None))
+
+        # Kopya henüz yenilenmedi: sonuç yine de güncel (diskten)
+        self.assertEqual(self.repo.get_stats_by_type("2023-05")[0][1], 3)
+        self.assertEqual(replica.get_replica_stats()['fallbacks'], 1)
+
+        self.assertTrue(replica.refresh_replica())
+        self.assertEqual(self.repo.get_stats_by_type("2023-05")[0][1], 3)
+        self.assertEqual(replica.get_replica_stats()['hits'], 1)
+
+    def test_not_loaded_and_disabled_use_disk(self):
+        replica.enable_replica(refresh=False)
+        self.assertEqual(len(self.repo.get_comparison_data("")), 3)
+        self.assertEqual(replica.get_replica_stats()['fallbacks'], 1)
+
+        replica.disable_replica()
+        self.assertIsNone(replica.get_replica_stats())
+        self.assertFalse(replica.refresh_replica())
+        self.assertEqual(len(self.repo.get_comparison_data("")), 3)
+
+    def test_replica_is_read_only_and_pool_bound(self):
+        replica.enable_replica()
+        with replica.analytics_db() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM activities")
+
+        # Havuz başka veritabanına yönlenince eski kopya kullanılmaz
+        configure_pool(os.path.join(self.tmp_dir, "other.db"))
+        other = ActivityRepository()
+        self.assertEqual(other.get_comparison_data(""), [])
+        self.assertFalse(replica.get_replica_stats()['fresh'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.backup import BackupManager, restore_backup, verify_snapshot
+from database.connection import configure_pool
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+
+
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "test.db")
+        configure_pool(self.db_path)
+        self.repo = ActivityRepository()
+        self.repo.add(Activity(None, "Film", "Dune", "2023-05-01", "", 8, None))
+        self.manager = BackupManager(self.db_path, keep=3)
+
+    def tearDown(self):
+        self.manager.close()
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def names(self):
+        return sorted(a.name for a in self.repo.get_all_filtered(ActivityFilter(items_per_page=100))[0])
+
+    def snapshot_names(self, path):
+        conn = sqlite3.connect(path)
+        try:
+            return sorted(r[0] for r in conn.execute("SELECT name FROM activities"))
+        finally:
+            conn.close()
+
+    def test_snapshot_is_consistent_single_file(self):
+        path = self.manager.backup()
+        self.assertTrue(verify_snapshot(path))
+        self.assertEqual(self.snapshot_names(path), ["Dune"])
+        self.assertFalse(os.path.exists(path + "-wal"))
+        self.assertEqual([s['path'] for s in self.manager.list_backups()], [path])
+
+    def test_unchanged_database_is_skipped(self):
+        first = self.manager.backup()
+        self.assertIsNone(self.manager.backup())
+
+        self.repo.add(Activity(None, "Dizi", "Dark", "2023-05-10", "", 9, None))
+        second = self.manager.backup()
+        self.assertIsNotNone(second)
+        self.assertEqual(self.snapshot_names(second), ["Dark", "Dune"])
+
+        # Yeni oturum (yeni bağlantı): son anlık görüntü güncel olduğu için atlanır
+        self.manager.close()
+        self.assertIsNone(BackupManager(self.db_path).backup())
+        self.assertEqual(len(self.manager.list_backups()), 2)
+        self.assertNotEqual(first, second)
+
+    def test_concurrent_commit_does_not_restart_backup(self):
+        for i in range(200):
+            self.repo.add(Activity(None, "Film", f"Film {i}", "2023-06-01", "x" * 500, 7, None))
+        steps = []
+
+        def progress(remaining, total):
+            if not steps:
+                # Kopyalama sürerken başka bağlantıdan commit
+                other = sqlite3.connect(self.db_path)
+                other.execute("INSERT INTO activities (type, name, date, comment, rating) "
+                              "VALUES ('Dizi', 'Dark', '2023-05-10', '', 9)")
+                other.commit()
+                other.close()
+            steps.append(remaining)
+
+        manager = BackupManager(self.db_path, pages=1)
+        try:
+            path = manager.backup(progress=progress)
+            self.assertIsNotNone(path)
+            self.assertGreater(len(steps), 1)
+            self.assertEqual(steps, sorted(steps, reverse=True))
+            self.assertNotIn("Dark", self.snapshot_names(path))
+            # Kopyalama sırasındaki commit bir sonraki yedeği tetikler
+            self.assertTrue(manager.has_changes())
+        finally:
+            manager.close()
+
+    def test_rotation_keeps_newest(self):
+        paths = [self.manager.backup(force=True) for _ in range(5)]
+        self.assertEqual([s['path'] for s in self.manager.list_backups()], paths[::-1][:3])
+
+    def test_restore_replaces_data_and_keeps_safety_copy(self):
+        snapshot = self.manager.backup()
+        self.repo.add(Activity(None, "Dizi", "Dark", "2023-05-10", "", 9, None))
+        self.manager.close()
+
+        configure_pool(self.db_path)
+        safety = restore_backup(snapshot, self.db_path)
+        self.assertIsNotNone(safety)
+        self.assertEqual(self.snapshot_names(safety), ["Dark", "Dune"])
+
+        configure_pool(self.db_path)
+        self.repo = ActivityRepository()
+        self.assertEqual(self.names(), ["Dune"])
+
+    def test_corrupt_snapshot_is_rejected(self):
+        bad = os.path.join(self.tmp_dir, "bad.db")
+        with open(bad, "wb") as f:
+            f.write(b"bozuk" * 100)
+        self.assertIsNone(restore_backup(bad, self.db_path))
+        self.assertEqual(self.names(), ["Dune"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import sys
+import os
+import json
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import bench_repositories
+from benchmarks.bench_repositories import REPOSITORIES, public_methods, uncovered_methods
+
+
+class TestBenchRepositories(unittest.TestCase):
+    def test_every_public_method_has_a_case(self):
+        # Repository'lere yeni public metod eklenince build_cases'e de eklenmeli
+        self.assertEqual(uncovered_methods(), [])
+
+    def test_small_run_produces_comparable_json(self):
+        report = bench_repositories.run([300], repeat=2, log=lambda *args: None)
+        report = json.loads(json.dumps(report))   # JSON'a yazılabilir olmalı
+
+        results = report["sizes"]["300"]["results"]
+        measured = {label.split(" ")[0] for label in results}
+        expected = {f"{cls.__name__}.{name}" for cls in REPOSITORIES for name in public_methods(cls)}
+        self.assertEqual(measured, expected)
+        self.assertTrue(all(r["median_ms"] >= 0 and r["calls"] >= 1 for r in results.values()))
+        self.assertEqual(report["meta"]["uncovered"], [])
+
+        rows = bench_repositories.compare(report, report)
+        self.assertEqual(len(rows), len(results))
+        self.assertTrue(all(before == after for _, _, before, after, _ in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+from utils import activity_matches_filter, apply_stats_change
+
+
+class TestChangeLog(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.repo.add_many([
+            Activity(None, "Film", "Dune", "2023-05-01", "", 8, None),
+            Activity(None, "Kitap", "Sefiller", "2023-04-20", "", 0, "2023-06-02"),
+            Activity(None, "Dizi", "Dark", "2022-11-01", "", 9, None),
+        ])
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def all_activities(self):
+        return self.repo.get_all_filtered(ActivityFilter(items_per_page=100))[0]
+
+    def test_insert_update_delete_are_journaled(self):
+        seq = self.repo.get_last_change_seq()
+        self.repo.add(Activity(None, "Film", "Tenet", "2023-05-20", "", 7, None))
+        tenet = next(a for a in self.all_activities() if a.name == "Tenet")
+        tenet.rating = 9
+        tenet.date = "2023-07-01"
+        self.repo.update(tenet)
+        dune = next(a for a in self.all_activities() if a.name == "Dune")
+        self.repo.delete(dune.id)
+
+        changeset = self.repo.get_changes_since(seq)
+        self.assertFalse(changeset.truncated)
+        self.assertEqual([c.op for c in changeset.changes], ["I", "U", "D"])
+        self.assertEqual(changeset.last_seq, changeset.changes[-1].seq)
+
+        insert, update, delete = changeset.changes
+        self.assertEqual((insert.old_type, insert.new_type, insert.new_rating), (None, "Film", 7))
+        self.assertEqual((update.old_date, update.new_date, update.old_rating, update.new_rating),
+                         ("2023-05-20", "2023-07-01", 7, 9))
+        self.assertEqual(update.activity.name, "Tenet")  # kaydın güncel hali
+        self.assertEqual((delete.activity_id, delete.old_type, delete.new_type), (dune.id, "Film", None))
+        self.assertIsNone(delete.activity)
+
+        # Son seq'ten sonra değişiklik yok
+        empty = self.repo.get_changes_since(changeset.last_seq)
+        self.assertEqual((empty.changes, empty.last_seq), ([], changeset.last_seq))
+
+    def test_large_batches_are_truncated(self):
+        seq = self.repo.get_last_change_seq()
+        self.repo.add_many([Activity(None, "Film", f"F{i}", "2023-01-01", "", 5, None) for i in range(6)])
+
+        changeset = self.repo.get_changes_since(seq, limit=5)
+        self.assertTrue(changeset.truncated)
+        self.assertEqual(changeset.changes, [])
+        self.assertEqual(changeset.last_seq, self.repo.get_last_change_seq())
+
+    def test_trim_keeps_newest_rows(self):
+        last = self.repo.get_last_change_seq()
+        self.assertEqual(self.repo.trim_change_log(keep=1), 2)
+        self.assertEqual(self.repo.get_last_change_seq(), last)
+        self.assertEqual(len(self.repo.get_changes_since(0).changes), 1)
+
+    def test_stats_deltas_match_fresh_query(self):
+        for prefix, ignore in (("2023", False), ("2023-05", False), ("", True)):
+            with self.subTest(period=prefix):
+                stats = {
+                    t: [count, (avg or 0) * rated, rated]
+                    for t, count, avg, rated in self.repo.get_stats_by_type(prefix, len(prefix) == 4, ignore)
+                }
+                seq = self.repo.get_last_change_seq()
+
+                self.repo.add(Activity(None, "Film", "Tenet", "2023-05-20", "", 7, None))
+                tenet = next(a for a in self.all_activities() if a.name == "Tenet")
+                tenet.type, tenet.rating = "Kitap", 0
+                self.repo.update(tenet)
+                self.repo.delete(next(a for a in self.all_activities() if a.name == "Dune").id)
+
+                for change in self.repo.get_changes_since(seq).changes:
+                    apply_stats_change(stats, change, prefix, ignore)
+                fresh = {
+                    t: (count, round((avg or 0) * rated), rated)
+                    for t, count, avg, rated in self.repo.get_stats_by_type(prefix, len(prefix) == 4, ignore)
+                }
+                self.assertEqual({t: (c, round(s), r) for t, (c, s, r) in stats.items()}, fresh)
+
+                # Sonraki dönem için başlangıç verisine geri dön
+                self.repo.delete(tenet.id)
+                self.repo.add(Activity(None, "Film", "Dune", "2023-05-01", "", 8, None))
+
+    def test_filter_match_agrees_with_query(self):
+        filters = [
+            ActivityFilter(),
+            ActivityFilter(type_filter="film"),
+            ActivityFilter(date_filter="2023-06"),   # Sefiller Haziran'a uzanıyor
+            ActivityFilter(date_filter="2022"),
+            ActivityFilter(type_filter="Kitap", date_filter="2023-05"),
+        ]
+        activities = self.all_activities()
+        for filter_obj in filters:
+            with self.subTest(filter=filter_obj.count_key()):
+                matched = sum(activity_matches_filter(filter_obj, a.type, a.date, a.end_date) for a in activities)
+                self.assertEqual(matched, self.repo.get_all_filtered(filter_obj)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import ConnectionPool
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.pool = ConnectionPool(os.path.join(self.tmp_dir, "pool.db"), max_idle=2)
+
+    def tearDown(self):
+        self.pool.close_all()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_connection_is_reused(self):
+        conn = self.pool.acquire()
+        conn.close()
+        again = self.pool.acquire()
+        self.assertIs(conn, again)
+        again.close()
+
+        stats = self.pool.stats()
+        self.assertEqual(stats['opened'], 1)
+        self.assertEqual(stats['reused'], 1)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 1)
+
+    def test_nested_acquire_opens_separate_connection(self):
+        outer = self.pool.acquire()
+        inner = self.pool.acquire()
+        self.assertIsNot(outer, inner)
+        inner.close()
+        outer.close()
+        self.assertEqual(self.pool.stats()['opened'], 2)
+
+    def test_uncommitted_work_is_rolled_back_on_release(self):
+        conn = self.pool.acquire()
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.close()
+
+        conn = self.pool.acquire()
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0], 0)
+        conn.close()
+
+    def test_connections_cross_threads(self):
+        def work():
+            conn = self.pool.acquire()
+            conn.execute("SELECT 1").fetchone()
+            conn.close()
+
+        for _ in range(5):
+            t = threading.Thread(target=work)
+            t.start()
+            t.join()
+
+        stats = self.pool.stats()
+        self.assertEqual(stats['opened'], 1)
+        self.assertEqual(stats['reused'], 4)
+
+    def test_profile_applied_on_creation(self):
+        conn = self.pool.acquire()
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+        self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)   # MEMORY
+        conn.close()
+
+    def test_profile_change_replaces_idle_connections(self):
+        conn = self.pool.acquire()
+        conn.close()
+        self.pool.set_profile("bulk-import")
+        self.assertEqual(self.pool.stats()['idle'], 0)
+
+        conn = self.pool.acquire()
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 0)  # OFF
+        conn.close()
+        self.assertEqual(self.pool.stats()['opened'], 2)
+
+        with self.assertRaises(ValueError):
+            self.pool.set_profile("yok")
+
+    def test_close_all_closes_idle_and_rejects_new(self):
+        conn = self.pool.acquire()
+        conn.close()
+        self.pool.close_all()
+        self.assertEqual(self.pool.stats()['idle'], 0)
+        with self.assertRaises(Exception):
+            self.pool.acquire()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,28 +1,28 @@
 
 import sys
 import os
+import shutil
+import tempfile
 import unittest
-from datetime import datetime
 
 # Proje kök dizinini path'e ekle
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from database.repository import ActivityRepository
 from models import Activity, ActivityFilter
-from database.connection import init_db, get_connection
+from database.connection import configure_pool, get_connection
 
 class TestDateRange(unittest.TestCase):
     def setUp(self):
-        # Test için veritabanını temizle veya bellek içi kullan
-        # Ancak mevcut repository connection.py üzerinden gerçek DB kullanıyor olabilir.
-        # Bu test mevcut DB'yi etkileyebilir, bu yüzden dikkatli olmalıyız.
-        # Güvenlik için test verilerini ekleyip sonra temizleyeceğiz.
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
         self.repo = ActivityRepository()
         self.created_ids = []
 
     def tearDown(self):
-        for aid in self.created_ids:
-            self.repo.delete(aid)
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
 
     def create_activity(self, name, start_date, end_date=None):
         act = Activity(None, "Test", name, start_date, "Test Comment", 5, end_date)
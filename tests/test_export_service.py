@@ -0,0 +1,108 @@
+import sys
+import os
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool
+from database.repository import ActivityRepository
+from database.plan_repository import PlanRepository
+from models import Activity, ActivityFilter, Plan
+from services.export_service import ExportService
+from services.import_service import ImportService
+
+
+class TestExportService(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.plan_repo = PlanRepository()
+        self.repo.add_many([
+            Activity(None, "Film", "Dune", "2023-05-01", "güzel, uzun", 8, None),
+            Activity(None, "Film", "Arrival", "2023-06-01", "", 9, None),
+            Activity(None, "Kitap", "Dune", "2022-01-01", "", 0, "2022-02-01"),
+        ])
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.tmp_dir, name)
+
+    def test_csv_export_respects_filter(self):
+        out = self.path("film.csv")
+        count = ExportService(self.repo, batch_size=1).export_activities(out, ActivityFilter(type_filter="film"))
+        self.assertEqual(count, 2)
+        with open(out, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([r["name"] for r in rows], ["Dune", "Arrival"])
+        self.assertEqual(rows[0]["comment"], "güzel, uzun")
+
+        count = ExportService(self.repo).export_activities(
+            self.path("ara.csv"), ActivityFilter(search_term="dune", date_filter="2022"))
+        self.assertEqual(count, 1)
+
+    def test_jsonl_export_reimports_identically(self):
+        out = self.path("hepsi.jsonl")
+        progress = []
+        ExportService(self.repo, batch_size=2).export_activities(out, progress=lambda d, t: progress.append((d, t)))
+        self.assertEqual(progress[-1], (3, 3))
+        with open(out, encoding="utf-8") as f:
+            first = json.loads(f.readline())
+        # Tarih sırası; Türkçe karakterler kaçışsız yazılır
+        self.assertEqual((first["type"], first["end_date"], first["rating"]), ("Kitap", "2022-02-01", 0))
+        with open(out, encoding="utf-8") as f:
+            self.assertIn("güzel", f.read())
+
+        key = lambda a: (a.type, a.name, a.date, a.comment, a.rating, a.end_date)
+        source = [key(a) for a in self.repo.iter_filtered(ActivityFilter())]
+
+        configure_pool(self.path("yeni.db"))
+        fresh = ActivityRepository()
+        report = ImportService(fresh).import_file(out)
+        self.assertEqual((report.imported, report.rejected), (3, []))
+        self.assertEqual([key(a) for a in fresh.iter_filtered(ActivityFilter())], source)
+
+    def test_cancel_leaves_no_file(self):
+        service = ExportService(self.repo)
+        service.PROGRESS_EVERY = 1
+        out = self.path("iptal.csv")
+        self.assertIsNone(service.export_activities(out, is_cancelled=lambda: True))
+        self.assertFalse(os.path.exists(out))
+        self.assertFalse(os.path.exists(out + ".part"))
+
+    def test_database_round_trip_remaps_folders(self):
+        self.plan_repo.add_folder("Proje")
+        self.plan_repo.add_folder("Boş")
+        folder_id = max(f.id for f in self.plan_repo.get_folders())
+        self.plan_repo.add_plan(Plan(None, "Hedef", "", "monthly", 2023, 5, "planned", 10, "high",
+                                     "2023-05-01 10:00:00", folder_id))
+
+        export_dir = self.path("yedek")
+        counts = ExportService(self.repo, self.plan_repo).export_database(export_dir)
+        self.assertEqual(counts, {"folders": 2, "plans": 1, "activities": 3})
+
+        configure_pool(self.path("yeni.db"))
+        repo, plan_repo = ActivityRepository(), PlanRepository()
+        plan_repo.add_folder("Önceden var")  # ID'ler kayar
+        reports = ImportService(repo, plan_repository=plan_repo).import_database(export_dir)
+
+        self.assertEqual({name: r.imported for name, r in reports.items()},
+                         {"folders": 2, "plans": 1, "activities": 3})
+        plan = next(plan_repo.iter_plans())
+        folders = {f.id: f.name for f in plan_repo.get_folders()}
+        self.assertEqual(folders[plan.folder_id], "Boş")
+        self.assertEqual((plan.title, plan.month, plan.priority, plan.created_at),
+                         ("Hedef", 5, "high", "2023-05-01 10:00:00"))
+
+
+if __name__ == '__main__':
+    unittest.main()
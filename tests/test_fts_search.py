@@ -0,0 +1,75 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.repository import ActivityRepository, build_fts_query
+from models import Activity, ActivityFilter
+
+
+class TestFtsSearch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.repo.add(Activity(None, "Film", "Yüzüklerin Efendisi", "2023-01-10", "Uzun ama güzel", 9))
+        self.repo.add(Activity(None, "Kitap", "Simyacı", "2023-02-01", "Efendisi olmayan bir yolculuk", 7))
+        self.repo.add(Activity(None, "Dizi", "Kayıp Şehir", "2023-03-01", "", 6))
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def search(self, term, **kwargs):
+        activities, total = self.repo.get_all_filtered(ActivityFilter(search_term=term, **kwargs))
+        return [a.name for a in activities], total
+
+    def test_build_fts_query(self):
+        self.assertEqual(build_fts_query("kay şeh"), '"kay"* "şeh"*')
+        self.assertIsNone(build_fts_query("  \"*- "))
+
+    def test_prefix_match_ranks_name_above_comment(self):
+        self.assertTrue(self.repo.fts_enabled)
+        names, total = self.search("efend")
+        self.assertEqual(total, 2)
+        self.assertEqual(names, ["Yüzüklerin Efendisi", "Simyacı"])
+
+    def test_combined_with_type_filter(self):
+        names, total = self.search("efend", type_filter="Kitap")
+        self.assertEqual((names, total), (["Simyacı"], 1))
+
+    def test_index_follows_update_and_delete(self):
+        activity = self.repo.get_all_filtered(ActivityFilter(search_term="kayıp"))[0][0]
+        activity.name = "Bulunan Şehir"
+        self.repo.update(activity)
+        self.assertEqual(self.search("kayıp")[1], 0)
+        self.assertEqual(self.search("bulunan")[0], ["Bulunan Şehir"])
+
+        self.repo.delete(activity.id)
+        self.assertEqual(self.search("bulunan")[1], 0)
+
+    def test_rebuild_when_triggers_missing(self):
+        with get_db() as conn:
+            conn.execute("DROP TRIGGER activities_fts_ai")
+            conn.execute("INSERT INTO activities (type, name, date, comment, rating) VALUES ('Film', 'Tetiksiz', '2023-04-01', '', 5)")
+        self.assertTrue(self.repo.rebuild_fts_index())
+        self.assertEqual(self.search("tetiksiz")[0], ["Tetiksiz"])
+
+        # Trigger yeniden kuruldu: sonraki eklemeler indekse düşer
+        with get_db() as conn:
+            conn.execute("INSERT INTO activities (type, name, date, comment, rating) VALUES ('Film', 'Tetikli', '2023-04-02', '', 5)")
+        self.assertEqual(self.search("tetikli")[0], ["Tetikli"])
+
+    def test_like_fallback(self):
+        self.repo.fts_enabled = False
+        names, total = self.search("üzük")
+        self.assertEqual((names, total), (["Yüzüklerin Efendisi"], 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import sys
+import os
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool
+from database.repository import ActivityRepository
+from exceptions import ValidationError
+from models import ActivityFilter
+from services.import_service import ImportService
+from utils import build_activity
+
+
+class CountingRepository(ActivityRepository):
+    """add_many çağrılarını sayan repository."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def add_many(self, activities):
+        self.batches.append(len(activities))
+        return super().add_many(activities)
+
+
+class TestBuildActivity(unittest.TestCase):
+    def test_same_rules_as_add_page(self):
+        activity = build_activity("Film", "  Dune ", "2023-05", " güzel ", "8")
+        self.assertEqual((activity.name, activity.date, activity.comment, activity.rating),
+                         ("Dune", "2023-05-01", "güzel", 8))
+        self.assertEqual(build_activity("Film", "X", "2023-05-02", "", "Seçiniz").rating, 0)
+
+        for args, message in [
+            (("Film", " ", "2023-05-01", "", "5"), "Faaliyet adı boş bırakılamaz."),
+            (("Film", "X", "", "", "5"), "Tarih seçimi zorunludur."),
+            (("Film", "X", "2023-13-01", "", "5"), "Tarih formatı geçersiz."),
+            (("Film", "X", "2023-05-01", "", "beş"), "Geçersiz puan değeri."),
+            (("Film", "X", "2023-05-01", "", "11"), "Puan 0-10 arasında olmalıdır (0: puansız)."),
+            (("", "X", "2023-05-01", "", "5"), "Faaliyet türü boş bırakılamaz."),
+        ]:
+            with self.subTest(message=message):
+                with self.assertRaises(ValidationError) as ctx:
+                    build_activity(*args)
+                self.assertEqual(str(ctx.exception), message)
+
+        with self.assertRaises(ValidationError):
+            build_activity("Dizi", "X", "2023-05-10", "", "5", end_date="2023-05-01")
+
+
+class TestImportService(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = CountingRepository()
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_csv_import_in_chunks_with_rejected_rows(self):
+        lines = ["type,name,date,comment,rating,end_date"]
+        lines += [f"Film,Film {i},2023-01-{i % 28 + 1:02d},,7," for i in range(7)]
+        lines.insert(3, "Film,,2023-01-01,,7,")           # satır 4: isim yok
+        lines.insert(5, "Kitap,Bozuk,2023-02-30,,7,")     # satır 6: geçersiz tarih
+        path = self.write("veri.csv", "\n".join(lines) + "\n")
+
+        progress = []
+        report = ImportService(self.repo, chunk_size=3).import_file(path, progress=lambda d, t: progress.append((d, t)))
+
+        self.assertEqual((report.total, report.imported), (9, 7))
+        self.assertEqual([(line, reason) for line, reason, _ in report.rejected],
+                         [(4, "Faaliyet adı boş bırakılamaz."), (6, "Tarih formatı geçersiz.")])
+        self.assertEqual(self.repo.batches, [3, 3, 1])
+        self.assertEqual(progress[-1], (9, 9))
+        self.assertEqual(self.repo.get_all_filtered(ActivityFilter())[1], 7)
+        # Özet tablo ve FTS trigger'ları executemany ile de çalışır
+        self.assertEqual(self.repo.get_all_filtered(ActivityFilter(search_term="film 3"))[1], 1)
+        self.assertEqual(self.repo.get_stats_by_type("2023-01")[0][1], 7)
+
+    def test_turkish_headers_and_semicolon(self):
+        path = self.write("excel.csv", "Tür;Ad;Tarih;Yorum;Puan;Bitiş\nDizi;Dark;2020-06;Harika;10;2020-07-15\n")
+        report = ImportService(self.repo).import_file(path)
+        self.assertEqual(report.imported, 1)
+        activity = self.repo.get_all_filtered(ActivityFilter())[0][0]
+        self.assertEqual((activity.type, activity.date, activity.end_date, activity.rating),
+                         ("Dizi", "2020-06-01", "2020-07-15", 10))
+
+    def test_jsonl_import_and_rejected_export(self):
+        rows = [
+            json.dumps({"type": "Oyun", "name": "Hades", "date": "2022-03-01", "rating": 9}),
+            "{bozuk json",
+            "",
+            json.dumps(["liste"]),
+            json.dumps({"type": "Oyun", "name": "Celeste", "date": "2022-04-01", "rating": None}),
+        ]
+        path = self.write("veri.jsonl", "\n".join(rows) + "\n")
+        report = ImportService(self.repo).import_file(path)
+
+        self.assertEqual(report.imported, 2)
+        self.assertEqual([line for line, _, _ in report.rejected], [2, 4])
+
+        out = os.path.join(self.tmp_dir, "red.csv")
+        self.assertTrue(ImportService.write_rejected(report, out))
+        with open(out, encoding="utf-8-sig") as f:
+            written = list(csv.reader(f))
+        self.assertEqual(written[0][:2], ["satir", "hata"])
+        self.assertEqual(len(written), 3)
+
+    def test_cancel_keeps_committed_chunks(self):
+        lines = ["type,name,date,comment,rating,end_date"]
+        lines += [f"Film,F{i},2023-01-01,,5," for i in range(10)]
+        path = self.write("veri.csv", "\n".join(lines) + "\n")
+
+        report = ImportService(self.repo, chunk_size=4).import_file(path, is_cancelled=lambda: True)
+        self.assertTrue(report.cancelled)
+        self.assertEqual(report.imported, 4)
+        self.assertEqual(self.repo.get_all_filtered(ActivityFilter())[1], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
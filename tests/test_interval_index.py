@@ -0,0 +1,100 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.migrations import day_key
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+from benchmarks.synthetic import populate_activities
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        if not self.repo.interval_index_enabled:
+            self.skipTest("SQLite R*Tree desteği yok")
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def names(self, date_filter):
+        activities, _ = self.repo.get_all_filtered(ActivityFilter(date_filter=date_filter, items_per_page=100))
+        return sorted(a.name for a in activities)
+
+    def both_ways(self, filter_obj):
+        """(R*Tree ile, R*Tree olmadan) sonuçları: [id], toplam."""
+        results = []
+        for enabled in (True, False):
+            self.repo.interval_index_enabled = enabled
+            self.repo._count_cache.clear()
+            activities, total = self.repo.get_all_filtered(filter_obj)
+            results.append(([a.id for a in activities], total))
+        self.repo.interval_index_enabled = True
+        return results
+
+    def test_day_key(self):
+        self.assertEqual(day_key("2023-01-10"), 20230110)
+        self.assertEqual(day_key("2023-01"), 20230100)
+        self.assertEqual(day_key("2023"), 20230000)
+
+    def test_overlap_semantics_match_date_range(self):
+        # tests/test_date_range.py senaryosu
+        self.repo.add_many([
+            Activity(None, "Test", "A1", "2023-01-10", "", 5, None),
+            Activity(None, "Test", "A2", "2023-01-20", "", 5, "2023-02-05"),
+            Activity(None, "Test", "A3", "2023-03-01", "", 5, None),
+            Activity(None, "Test", "Uzun", "2022-11-15", "", 5, "2023-04-01"),   # aylara yayılan dizi
+        ])
+        self.assertEqual(self.names("2023-01"), ["A1", "A2", "Uzun"])
+        self.assertEqual(self.names("2023-02"), ["A2", "Uzun"])
+        self.assertEqual(self.names("2023-03"), ["A3", "Uzun"])
+        self.assertEqual(self.names("2023-04"), ["Uzun"])   # bitiş günü ayın ilk günü
+        self.assertEqual(self.names("2023-05"), [])
+        self.assertEqual(self.names("2022"), ["Uzun"])
+        self.assertEqual(self.names("2023"), ["A1", "A2", "A3", "Uzun"])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.repo.add(Activity(None, "Dizi", "Dark", "2023-01-10", "", 9, None))
+        dark = self.repo.get_all_filtered(ActivityFilter())[0][0]
+        self.assertEqual(self.names("2023-03"), [])
+
+        dark.end_date = "2023-03-02"
+        self.repo.update(dark)
+        self.assertEqual(self.names("2023-03"), ["Dark"])
+
+        self.repo.delete(dark.id)
+        with get_db() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM activities_interval").fetchone()[0], 0)
+
+    def test_matches_plain_predicate_on_synthetic_data(self):
+        with get_db() as conn:
+            populate_activities(conn, 3000)
+        # Bitişi başlangıçtan önce olan hatalı kayıt da aynı sonucu vermeli
+        self.repo.add(Activity(None, "Dizi", "Ters", "2020-06-10", "", 5, "2020-05-01"))
+
+        filters = [
+            ActivityFilter(date_filter="2020-06", items_per_page=50),
+            ActivityFilter(date_filter="2020-05", items_per_page=50),
+            ActivityFilter(date_filter="2024", items_per_page=50),
+            ActivityFilter(date_filter="2024", page=3, items_per_page=50),
+            ActivityFilter(type_filter="Dizi", date_filter="2023-12", items_per_page=50),
+            ActivityFilter(search_term="Gece", date_filter="2022", items_per_page=50),
+        ]
+        for filter_obj in filters:
+            with self.subTest(filter=filter_obj):
+                indexed, plain = self.both_ways(filter_obj)
+                self.assertEqual(indexed, plain)
+
+
+if __name__ == '__main__':
+    unittest.main()
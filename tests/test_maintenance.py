@@ -0,0 +1,110 @@
+import argparse
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import maintenance
+from database.__main__ import _maintenance
+from database.connection import configure_pool, get_db
+from database.maintenance import DAY, MAINTENANCE_TASKS, MaintenanceScheduler
+from database.repository import ActivityRepository
+from benchmarks.synthetic import populate_recommendations
+
+
+class FakeClock:
+    def __init__(self, now=1_800_000_000):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestMaintenance(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        ActivityRepository()
+        self.clock = FakeClock()
+        self.scheduler = MaintenanceScheduler(budget_s=60, clock=self.clock)
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def pragma(self, name):
+        with get_db() as conn:
+            return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_new_database_uses_incremental_vacuum(self):
+        self.assertEqual(self.pragma("auto_vacuum"), 2)
+
+    def test_last_run_bookkeeping(self):
+        all_tasks = {name for name, *_ in MAINTENANCE_TASKS}
+        self.assertEqual(set(self.scheduler.due_tasks()), all_tasks)
+
+        self.assertEqual(set(self.scheduler.run_due()), all_tasks)
+        self.assertEqual(set(self.scheduler.last_runs()), all_tasks)
+        self.assertEqual(self.scheduler.due_tasks(), [])
+
+        # Günlük işler bir gün sonra, haftalık ANALYZE bir hafta sonra vadeye girer
+        self.clock.now += DAY
+        due = self.scheduler.due_tasks()
+        self.assertIn("change_log_trim", due)
+        self.assertNotIn("analyze", due)
+
+    def test_budget_defers_remaining_tasks(self):
+        results = self.scheduler.run_due(budget_s=0)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(len(self.scheduler.due_tasks()), len(MAINTENANCE_TASKS) - 1)
+
+    def test_cache_churn_is_returned_to_filesystem(self):
+        with get_db() as conn:
+            populate_recommendations(conn, 5000)
+        pages = self.pragma("page_count")
+
+        self.scheduler.run_due()
+        with get_db() as conn:
+            # Sentetik verinin ~%20'si süresi dolmuş: bakım turunda silinmiş olmalı
+            self.assertLess(conn.execute("SELECT COUNT(*) FROM recommendation_cache").fetchone()[0], 4500)
+            conn.execute("DELETE FROM recommendation_cache")
+        self.assertGreater(self.pragma("freelist_count"), 0)
+
+        self.scheduler.run_due(force=True)
+        self.assertEqual(self.pragma("freelist_count"), 0)
+        self.assertLess(self.pragma("page_count"), pages)
+
+    def test_idle_tick_does_not_convert_large_file(self):
+        with get_db() as conn:
+            # Dönüştürülmemiş (auto_vacuum = NONE) eski bir veritabanı
+            conn.execute("PRAGMA auto_vacuum = NONE")
+            conn.execute("VACUUM")
+            populate_recommendations(conn, 2000)
+        self.assertEqual(self.pragma("auto_vacuum"), 0)
+
+        original = maintenance.VACUUM_CONVERT_IDLE_MAX_BYTES
+        maintenance.VACUUM_CONVERT_IDLE_MAX_BYTES = 1024
+        try:
+            results = self.scheduler.run_due(force=True)
+        finally:
+            maintenance.VACUUM_CONVERT_IDLE_MAX_BYTES = original
+        self.assertIn("--force", results["incremental_vacuum"])
+        self.assertEqual(self.pragma("auto_vacuum"), 0)
+
+        # Açık yol: python -m database maintenance --force
+        self.assertEqual(_maintenance(argparse.Namespace(force=True)), 0)
+        self.assertEqual(self.pragma("auto_vacuum"), 2)
+
+    def test_analyze_writes_statistics(self):
+        self.scheduler.run_due(force=True)
+        with get_db() as conn:
+            self.assertGreater(conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import migrations
+from database.connection import configure_pool, get_db
+from database.migrations import SCHEMA_VERSION, migrate
+from database.plan_repository import PlanRepository
+from database.recommendation_repository import RecommendationRepository
+from database.repository import ActivityRepository
+from database.type_repository import TypeRepository
+from models import ActivityFilter
+
+
+class TestMigrations(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "test.db")
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def user_version(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_fresh_database_reaches_latest_version(self):
+        configure_pool(self.db_path)
+        ActivityRepository()
+        self.assertEqual(self.user_version(), SCHEMA_VERSION)
+
+        with get_db() as conn:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            types = conn.execute("SELECT COUNT(*) FROM activity_types").fetchone()[0]
+        for table in ("activities", "plans", "folders", "activity_types", "settings",
+                      "recommendation_cache", "activity_monthly_agg"):
+            self.assertIn(table, tables)
+        self.assertGreater(types, 0)
+
+    def test_legacy_database_is_upgraded(self):
+        # Sürüm takibinden önceki şema: end_date / folder_id yok, tarihler YYYY-MM
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript('''
+            CREATE TABLE activities (id INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT NOT NULL,
+                                     name TEXT NOT NULL, date TEXT NOT NULL, comment TEXT, rating INTEGER);
+            CREATE TABLE plans (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, description TEXT,
+                                scope TEXT NOT NULL, year INTEGER NOT NULL, month INTEGER);
+            CREATE INDEX idx_activities_type ON activities(type);
+            INSERT INTO activities (type, name, date, comment, rating) VALUES ('Kitap', 'Simyacı', '2021-03', '', 8);
+        ''')
+        conn.close()
+
+        configure_pool(self.db_path)
+        repo = ActivityRepository()
+        self.assertEqual(self.user_version(), SCHEMA_VERSION)
+
+        activities, total = repo.get_all_filtered(ActivityFilter(type_filter="KİTAP", search_term="simya"))
+        self.assertEqual(total, 1)
+        self.assertEqual(activities[0].date, "2021-03-01")
+        self.assertEqual([tuple(r) for r in repo.get_stats_by_type("2021", year_only=True)], [("Kitap", 1, 8.0, 1)])
+        with get_db() as conn:
+            plan_columns = {row[1] for row in conn.execute("PRAGMA table_info(plans)")}
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(activities)")}
+        self.assertIn("folder_id", plan_columns)
+        self.assertNotIn("idx_activities_type", indexes)
+
+    def test_up_to_date_startup_is_single_pragma_read(self):
+        configure_pool(self.db_path)
+        ActivityRepository()
+
+        pool = configure_pool(self.db_path, max_idle=1)
+        conn = pool.acquire()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        conn.close()
+
+        ActivityRepository()
+        PlanRepository()
+        TypeRepository()
+        RecommendationRepository()
+        self.assertEqual(statements, ["PRAGMA user_version"])
+        self.assertEqual(pool.stats()['opened'], 1)
+
+    def test_failed_step_rolls_back_whole_upgrade(self):
+        def broken(conn):
+            conn.execute("CREATE TABLE half_done (x INTEGER)")
+            raise sqlite3.OperationalError("bozuk adım")
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                migrate(conn, migrations.MIGRATIONS + [(SCHEMA_VERSION + 1, "bozuk", broken)])
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 0)
+            tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+            self.assertEqual(tables, [])
+        finally:
+            conn.close()
+
+    def test_registry_is_ordered_without_gaps(self):
+        versions = [version for version, _, _ in migrations.MIGRATIONS]
+        self.assertEqual(versions, list(range(1, len(versions) + 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+
+
+class TestMonthlyAgg(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.repo.add(Activity(None, "Film", "A", "2023-01-10", "", 8))
+        self.repo.add(Activity(None, "Film", "B", "2023-01-20", "", 0))
+        self.repo.add(Activity(None, "Dizi", "C", "2023-02-05", "", 6, "2023-03-01"))
+        self.repo.add(Activity(None, "Kitap", "D", "2022-12-31", "", 4))
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def agg_rows(self):
+        with get_db() as conn:
+            return conn.execute(
+                "SELECT year, month, type, count, rating_sum, rated_count FROM activity_monthly_agg ORDER BY 1, 2, 3"
+            ).fetchall()
+
+    def expected_rows(self):
+        with get_db() as conn:
+            return conn.execute('''
+                SELECT CAST(substr(date, 1, 4) AS INTEGER), CAST(substr(date, 6, 2) AS INTEGER), type,
+                       COUNT(*), COALESCE(SUM(CASE WHEN rating > 0 THEN rating END), 0),
+                       COUNT(CASE WHEN rating > 0 THEN 1 END)
+                FROM activities GROUP BY 1, 2, 3 ORDER BY 1, 2, 3
+            ''').fetchall()
+
+    def assertAggInSync(self):
+        self.assertEqual([tuple(r) for r in self.agg_rows()], [tuple(r) for r in self.expected_rows()])
+
+    def test_stats_queries(self):
+        stats = {row[0]: (row[1], row[2]) for row in self.repo.get_stats_by_type("2023-01")}
+        self.assertEqual(stats, {"Film": (2, 8.0)})
+
+        stats = {row[0]: (row[1], row[2]) for row in self.repo.get_stats_by_type("2023", year_only=True)}
+        self.assertEqual(stats, {"Film": (2, 8.0), "Dizi": (1, 6.0)})
+
+        self.assertEqual(len(self.repo.get_stats_by_type(ignore_dates=True)), 3)
+        self.assertEqual([tuple(r) for r in self.repo.get_monthly_activity_counts(2023)], [(1, 2), (2, 1)])
+        self.assertEqual([tuple(r) for r in self.repo.get_monthly_activity_counts(2023, "Dizi")], [(2, 1)])
+        # Diğer tür filtreleri gibi büyük/küçük harf ve Türkçe harflerden bağımsız
+        self.assertEqual([tuple(r) for r in self.repo.get_monthly_activity_counts(2023, "DİZİ")], [(2, 1)])
+        self.assertEqual(self.repo.get_available_periods("month"), ["2023-02", "2023-01", "2022-12"])
+        self.assertEqual(self.repo.get_available_periods("year"), ["2023", "2022"])
+
+    def test_triggers_follow_updates_and_deletes(self):
+        self.assertAggInSync()
+        film = self.repo.get_all_filtered(ActivityFilter(search_term="A"))[0][0]
+        self.repo.update(Activity(film.id, "Oyun", film.name, "2024-05-01", "", 3))
+        self.assertAggInSync()
+
+        self.repo.delete(film.id)
+        self.assertAggInSync()
+        self.assertNotIn("2024-05", self.repo.get_available_periods("month"))
+
+    def test_rebuild_fixes_drift(self):
+        with get_db() as conn:
+            conn.execute("UPDATE activity_monthly_agg SET count = 99")
+        self.assertTrue(self.repo.rebuild_monthly_agg())
+        self.assertAggInSync()
+
+
+if __name__ == '__main__':
+    unittest.main()
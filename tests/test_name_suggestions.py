@@ -0,0 +1,80 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+from benchmarks.synthetic import populate_activities
+
+
+class TestNameSuggestions(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.repo.add_many([
+            Activity(None, "Film", "Karanlık", "2023-01-01", "", 8, None),
+            Activity(None, "Dizi", "KARANLIK", "2023-02-01", "", 9, None),   # aynı isim, daha yeni yazım
+            Activity(None, "Film", "Kara Şövalye", "2022-01-01", "", 9, None),
+            Activity(None, "Film", "Bir Karanlık Gece", "2021-01-01", "", 7, None),
+            Activity(None, "Kitap", "Şeker Portakalı", "2020-01-01", "", 10, None),
+        ])
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_prefix_ranked_by_uses_then_infix(self):
+        self.assertEqual(self.repo.suggest_names("kar"), ["KARANLIK", "Kara Şövalye", "Bir Karanlık Gece"])
+        self.assertEqual(self.repo.suggest_names("kar", limit=2), ["KARANLIK", "Kara Şövalye"])
+        # 3 harften kısa sorguda yalnızca önek
+        self.assertEqual(self.repo.suggest_names("ka"), ["KARANLIK", "Kara Şövalye"])
+        self.assertEqual(self.repo.suggest_names(""), ["KARANLIK", "Kara Şövalye", "Bir Karanlık Gece", "Şeker Portakalı"])
+
+    def test_turkish_case_folding(self):
+        self.assertEqual(self.repo.suggest_names("ŞEKER"), ["Şeker Portakalı"])
+        self.assertEqual(self.repo.suggest_names("portakali"), ["Şeker Portakalı"])
+        self.assertEqual(self.repo.suggest_names('"; DROP'), [])
+
+    def test_index_follows_updates_and_deletes(self):
+        activities = self.repo.get_all_filtered(ActivityFilter(items_per_page=100))[0]
+        kara = next(a for a in activities if a.name == "Kara Şövalye")
+        kara.name = "Kara Kedi"
+        self.repo.update(kara)
+        self.assertEqual(self.repo.suggest_names("kara k"), ["Kara Kedi"])
+        self.assertEqual(self.repo.suggest_names("şöv"), [])
+
+        self.repo.delete(kara.id)
+        with get_db() as conn:
+            self.assertIsNone(conn.execute(
+                "SELECT 1 FROM activity_names WHERE name_key = 'kara kedi'").fetchone())
+            uses = conn.execute("SELECT uses FROM activity_names WHERE name_key = 'karanlik'").fetchone()[0]
+        self.assertEqual(uses, 2)
+
+    def test_rebuild_and_like_fallback_match_trigram(self):
+        with get_db() as conn:
+            populate_activities(conn, 2000)
+        self.assertTrue(self.repo.rebuild_name_index())
+        with get_db() as conn:
+            distinct = conn.execute("SELECT COUNT(DISTINCT lower(name)) FROM activities").fetchone()[0]
+            indexed = conn.execute("SELECT COUNT(*) FROM activity_names").fetchone()[0]
+        self.assertLessEqual(indexed, distinct)
+
+        for query in ("gec", "ece", "yıldız 1", "ışık", "zzz"):
+            with self.subTest(query=query):
+                self.repo.name_trigram_enabled = True
+                trigram = self.repo.suggest_names(query, limit=25)
+                self.repo.name_trigram_enabled = False
+                like = self.repo.suggest_names(query, limit=25)
+                self.assertEqual(trigram, like)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+
+
+class TestKeysetPagination(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        for i in range(40):
+            # Aynı tarihte birden çok kayıt: sıralamada id ikinci anahtar
+            self.repo.add(Activity(None, "Film" if i % 2 else "Dizi", f"F{i}", f"2023-01-{i // 4 + 1:02d}", "", 5))
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_cursor_pages_match_offset_pages(self):
+        cursor = None
+        for page in range(1, 5):
+            by_offset, total = self.repo.get_all_filtered(ActivityFilter(page=page, items_per_page=12))
+            by_cursor, total_c = self.repo.get_all_filtered(
+                ActivityFilter(page=page, items_per_page=12, cursor=cursor)
+            )
+            self.assertEqual([a.id for a in by_offset], [a.id for a in by_cursor])
+            self.assertEqual(total, total_c)
+            if by_cursor:
+                cursor = (by_cursor[-1].date, by_cursor[-1].id)
+
+    def test_cursor_respects_filters(self):
+        first, total = self.repo.get_all_filtered(ActivityFilter(type_filter="Film", items_per_page=5))
+        self.assertEqual(total, 20)
+        cursor = (first[-1].date, first[-1].id)
+        second, _ = self.repo.get_all_filtered(ActivityFilter(type_filter="Film", items_per_page=5, page=2, cursor=cursor))
+        self.assertTrue(all(a.type == "Film" for a in second))
+        self.assertFalse({a.id for a in first} & {a.id for a in second})
+
+    def test_total_cached_until_next_write(self):
+        _, total = self.repo.get_all_filtered(ActivityFilter())
+        self.assertEqual(total, 40)
+
+        # Yazma içermeyen bağlantı kullanımı önbelleği geçersiz kılmaz...
+        with get_db() as conn:
+            conn.execute("SELECT 1").fetchone()
+        _, cached_total = self.repo.get_all_filtered(ActivityFilter(page=3))
+        self.assertEqual(cached_total, 40)
+
+        # ...ama repository üzerinden yapılan her yazma kılar.
+        self.repo.add(Activity(None, "Film", "Yeni", "2024-01-01", "", 5))
+        _, total = self.repo.get_all_filtered(ActivityFilter())
+        self.assertEqual(total, 41)
+
+
+if __name__ == '__main__':
+    unittest.main()
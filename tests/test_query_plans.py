@@ -0,0 +1,113 @@
+import sys
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_connection, get_pool_stats
+from database.repository import ActivityRepository
+from database.plan_repository import PlanRepository
+from models import Activity, ActivityFilter
+
+# Tabloyu (veya bir indeksini) baştan sona tarayan plan satırı: "SCAN activities [USING ...]".
+# LIMIT'li sorgularda sıralı indeks taraması erken biter, tam tarama sayılmaz.
+_SCAN_RE = re.compile(r"^SCAN (activities|plans|activity_changes|activity_names|n)(\s|$)")
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+# Tasarım gereği tüm tabloyu okuyan sorgular (gerekçesiyle)
+FULL_SCAN_ALLOWED = {
+    "get_all_filtered": "filtresiz COUNT(*) tüm indeksi okur (sonuç yazmaya kadar önbellekte)",
+    "get_detailed_data_for_pdf(tüm zamanlar)": "tüm zamanlar raporu bütün kayıtları okur",
+}
+
+
+class TestQueryPlans(unittest.TestCase):
+    """Her repository sorgusunu EXPLAIN QUERY PLAN ile denetler; tam tablo taramasında başarısız olur."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "test.db")
+        configure_pool(self.db_path, max_idle=1)
+        self.repo = ActivityRepository()
+        self.plan_repo = PlanRepository()
+        self.repo.add(Activity(None, "Film", "A", "2023-01-10", "", 8))
+        self.repo.add(Activity(None, "Dizi", "B", "2023-02-05", "", 6, "2023-03-01"))
+
+        # Tek thread'de havuz aynı bağlantıyı yeniden kullanır; izleme onun üzerine kurulur
+        self.statements = []
+        conn = get_connection()
+        conn.set_trace_callback(self.statements.append)
+        conn.close()
+        self.explainer = sqlite3.connect(self.db_path)
+
+    def tearDown(self):
+        self.explainer.close()
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def cases(self):
+        film = Activity(1, "Film", "A", "2023-01-10", "", 9)
+        return [
+            ("get_by_id", self.repo.get_by_id, 1),
+            ("get_all_filtered", self.repo.get_all_filtered, ActivityFilter()),
+            ("get_all_filtered(type)", self.repo.get_all_filtered, ActivityFilter(type_filter="Film")),
+            ("get_all_filtered(month)", self.repo.get_all_filtered, ActivityFilter(date_filter="2023-01")),
+            ("get_all_filtered(year)", self.repo.get_all_filtered, ActivityFilter(date_filter="2023")),
+            ("get_all_filtered(cursor)", self.repo.get_all_filtered, ActivityFilter(page=2, cursor=("2023-02-05", 2))),
+            ("get_all_filtered(search)", self.repo.get_all_filtered, ActivityFilter(search_term="A")),
+            ("suggest_names(önek)", self.repo.suggest_names, "a"),
+            ("suggest_names(içinde)", self.repo.suggest_names, "xyz"),
+            ("get_stats_by_type(month)", self.repo.get_stats_by_type, "2023-01"),
+            ("get_stats_by_type(year)", self.repo.get_stats_by_type, "2023", True),
+            ("get_details_for_type(month)", self.repo.get_details_for_type, "Film", "2023-01"),
+            ("get_details_for_type(year)", self.repo.get_details_for_type, "Film", "2023", True),
+            ("get_details_for_type(ignore_dates)", self.repo.get_details_for_type, "Film", "", False, True),
+            ("get_comparison_data(month)", self.repo.get_comparison_data, "2023-01"),
+            ("get_comparison_data(year)", self.repo.get_comparison_data, "2023"),
+            ("get_available_periods", self.repo.get_available_periods, "month"),
+            ("get_detailed_data_for_pdf(month)", self.repo.get_detailed_data_for_pdf, "2023-01"),
+            ("get_detailed_data_for_pdf(year)", self.repo.get_detailed_data_for_pdf, "2023"),
+            ("get_detailed_data_for_pdf(tüm zamanlar)", self.repo.get_detailed_data_for_pdf, ""),
+            ("get_monthly_activity_counts", self.repo.get_monthly_activity_counts, 2023, "Film"),
+            ("get_activity_details_by_month", self.repo.get_activity_details_by_month, "2023-01"),
+            ("get_activity_details_by_month(type)", self.repo.get_activity_details_by_month, "2023-01", "Film"),
+            ("get_last_change_seq", self.repo.get_last_change_seq),
+            ("get_changes_since", self.repo.get_changes_since, 1),
+            ("update", self.repo.update, film),
+            ("delete", self.repo.delete, 2),
+            ("get_plans(monthly)", self.plan_repo.get_plans, "monthly", 2023, 1),
+            ("get_plans(yearly)", self.plan_repo.get_plans, "yearly", 2023),
+        ]
+
+    def plan_for(self, sql):
+        return [row[3] for row in self.explainer.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()]
+
+    def test_no_full_table_scans(self):
+        for label, func, *args in self.cases():
+            with self.subTest(query=label):
+                self.statements.clear()
+                func(*args)
+                queries = {s for s in self.statements if s.lstrip().upper().startswith(_EXPLAINABLE)}
+                self.assertTrue(queries, f"{label}: hiç sorgu yakalanmadı")
+
+                scans = [
+                    (sql, detail) for sql in queries if not _LIMIT_RE.search(sql)
+                    for detail in self.plan_for(sql) if _SCAN_RE.match(detail)
+                ]
+                if label in FULL_SCAN_ALLOWED:
+                    self.assertTrue(scans, f"{label}: artık tam tarama yapmıyor, FULL_SCAN_ALLOWED'dan çıkarın")
+                else:
+                    self.assertFalse(scans, f"{label}: tam tablo taraması {scans}")
+
+        # Tüm çağrılar izlenen tek bağlantı üzerinden yapıldı mı?
+        self.assertEqual(get_pool_stats()['opened'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
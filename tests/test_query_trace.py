@@ -0,0 +1,80 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from constants import APP_NAME
+from database.connection import (configure_pool, enable_query_tracing, disable_query_tracing,
+                                 get_query_trace_summary, reset_query_trace, normalize_sql, params_shape)
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter
+
+
+class TestQueryTrace(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.repo.add_many([
+            Activity(None, "Film", "Dune", "2023-05-01", "", 8, None),
+            Activity(None, "Dizi", "Dark", "2023-05-10", "", 9, None),
+        ])
+
+    def tearDown(self):
+        disable_query_tracing()
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def find(self, caller):
+        return [row for row in get_query_trace_summary() if caller in row['callers']]
+
+    def test_disabled_by_default(self):
+        self.repo.get_all_filtered(ActivityFilter())
+        self.assertEqual(get_query_trace_summary(), [])
+
+    def test_records_caller_rows_and_shape(self):
+        enable_query_tracing()
+        self.repo.get_all_filtered(ActivityFilter(type_filter="Film"))
+        self.repo.get_all_filtered(ActivityFilter(type_filter="Dizi"))
+
+        select = [r for r in self.find("ActivityRepository.get_all_filtered") if r['sql'].startswith("SELECT")]
+        self.assertEqual(len(select), 1)
+        self.assertEqual(select[0]['count'], 2)
+        self.assertEqual(select[0]['rows'], 2)
+        self.assertEqual(select[0]['shapes'], ["(str, int, int)"])
+        self.assertGreaterEqual(select[0]['max_ms'], 0)
+
+        reset_query_trace()
+        self.assertEqual(get_query_trace_summary(), [])
+
+    def test_queued_writes_keep_repository_caller(self):
+        enable_query_tracing()
+        self.repo.add(Activity(None, "Film", "Tenet", "2023-05-20", "", 7, None))
+        insert = self.find("ActivityRepository.add")
+        self.assertTrue(any(r['sql'].startswith("INSERT INTO activities") and r['rows'] == 1 for r in insert))
+        # Tetikleyici ifadeleri (FTS, özet, değişiklik günlüğü) de sayılır
+        self.assertTrue(any(r['statements'] > 1 for r in insert))
+
+    def test_slow_queries_are_logged_with_plan(self):
+        enable_query_tracing(slow_ms=0)
+        with self.assertLogs(f"{APP_NAME}.slow_queries", level="WARNING") as cm:
+            self.repo.get_all_filtered(ActivityFilter(date_filter="2023-05"))
+        output = "\n".join(cm.output)
+        self.assertIn("ActivityRepository.get_all_filtered", output)
+        self.assertIn("PLAN:", output)
+        self.assertIn("activities", output.split("PLAN:")[1])
+
+    def test_normalization(self):
+        self.assertEqual(normalize_sql("SELECT *\n  FROM t WHERE id IN (?, ?,?)"),
+                         "SELECT * FROM t WHERE id IN (?, …)")
+        self.assertEqual(params_shape(("a", 1, None)), "(str, int, NoneType)")
+        self.assertEqual(params_shape([("a",), ("b",)], many=True), "2 x (str)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import migrations
+from database.connection import configure_pool, get_db
+from database.recommendation_repository import RecommendationRepository
+
+
+def make_items(prefix, count=10, rating=7.0):
+    return [{'id': f"{prefix}-{i}", 'title': f"{prefix} {i}", 'rating': rating} for i in range(count)]
+
+
+class TestRecommendationCache(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = RecommendationRepository()
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def row_ids(self):
+        with get_db() as conn:
+            return dict(conn.execute("SELECT external_id, id FROM recommendation_cache"))
+
+    def test_refresh_follows_current_ranking(self):
+        self.assertTrue(self.repo.add_recommendations(make_items("a"), "Film", "this_month", page=1))
+        self.assertTrue(self.repo.add_recommendations(make_items("b"), "Film", "this_month", page=2))
+        before = self.row_ids()
+
+        # Yenilenen 1. sayfa: sıra ters döndü, a-9 düştü, b-0 2. sayfadan geldi
+        refreshed = [{'id': "b-0", 'title': "b 0", 'rating': 9.0}] + make_items("a", 9, rating=8.0)[::-1]
+        self.assertTrue(self.repo.add_recommendations(refreshed, "Film", "this_month", page=1))
+        page = self.repo.get_cached_recommendations("Film", "this_month", page=1)
+        self.assertEqual([r['id'] for r in page], ["b-0"] + [f"a-{i}" for i in range(8, -1, -1)])
+        self.assertTrue(all(r['rating'] >= 8.0 for r in page))
+        # Kalan satırlar silinip yeniden eklenmez: id'ler yerinde, yalnızca a-9 silindi
+        after = self.row_ids()
+        self.assertNotIn("a-9", after)
+        self.assertEqual(after, {k: v for k, v in before.items() if k != "a-9"})
+
+        # Sonradan yenilenen 2. sayfada b-0 yeni sıralamadaki yerini alır
+        self.repo.add_recommendations(make_items("b", 9)[1:] + [{'id': "b-0", 'title': "b 0"}],
+                                      "Film", "this_month", page=2)
+        self.assertEqual([r['id'] for r in self.repo.get_cached_recommendations("Film", "this_month", page=2)],
+                         [f"b-{i}" for i in range(1, 9)] + ["b-0"])
+        self.assertEqual(self.repo.get_cached_recommendations("Film", "this_month", page=1)[0]['id'], "a-8")
+        with get_db() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM recommendation_cache").fetchone()[0], 18)
+
+    def test_duplicates_within_a_batch(self):
+        items = make_items("b", 3) + [{'id': "b-0", 'title': "Yeni başlık", 'rating': 5}]
+        self.assertTrue(self.repo.add_recommendations(items, "Dizi", "must_see"))
+        page = self.repo.get_cached_recommendations("Dizi", "must_see")
+        self.assertEqual(len(page), 3)
+        self.assertEqual(page[0]['title'], "Yeni başlık")
+
+    def test_iter_cached_pages_single_ordered_read(self):
+        for page in (3, 1, 2):
+            self.repo.add_recommendations(make_items(f"p{page}"), "Oyun", "all_time_best", page=page)
+        self.repo.add_recommendations(make_items("baska"), "Oyun", "this_month", page=1)
+        with get_db() as conn:
+            # 2. sayfanın süresi dolmuş
+            conn.execute("UPDATE recommendation_cache SET fetched_at = '2000-01-01' WHERE page = 2")
+
+        chunks = list(self.repo.iter_cached_pages("Oyun", "all_time_best", chunk_size=6))
+        self.assertEqual([len(c) for c in chunks], [6, 6, 6, 2])
+        ids = [item['id'] for chunk in chunks for item in chunk]
+        self.assertEqual(ids, [f"p1-{i}" for i in range(10)] + [f"p3-{i}" for i in range(10)])
+
+        limited = [item['id'] for chunk in self.repo.iter_cached_pages("Oyun", "all_time_best", max_page=2)
+                   for item in chunk]
+        self.assertEqual(limited, [f"p1-{i}" for i in range(10)])
+        self.assertEqual(list(self.repo.iter_cached_pages("Kitap", "all_time_best")), [])
+
+    def test_read_index_covers_order_and_expiry(self):
+        with get_db() as conn:
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(recommendation_cache)")}
+
+            def plan(sql, params):
+                return " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+            key = ("Film", "this_month", "all", 0)
+            max_page = plan("SELECT MAX(page) FROM recommendation_cache WHERE category = ? AND period = ? "
+                            "AND genre = ? AND is_turkish = ? AND fetched_at > ?", key + ("",))
+            page_read = plan("SELECT title FROM recommendation_cache WHERE category = ? AND period = ? "
+                             "AND genre = ? AND is_turkish = ? AND page = ? AND fetched_at > ? "
+                             "ORDER BY position ASC", key + (1, ""))
+        self.assertIn("idx_cache_page_rank", indexes)
+        self.assertNotIn("idx_cache_lookup", indexes)
+        self.assertNotIn("idx_cache_page_read", indexes)
+        self.assertIn("COVERING INDEX idx_cache_page_rank", max_page)
+        self.assertIn("idx_cache_page_rank", page_read)
+        self.assertNotIn("TEMP B-TREE", page_read)
+
+    def test_migration_fills_position_from_id_order(self):
+        self.repo.add_recommendations(make_items("a", 4), "Film", "this_month", page=1)
+        self.repo.add_recommendations(make_items("b", 3), "Film", "this_month", page=2)
+        with get_db() as conn:
+            # Sürüm 10'daki satırlar: position yok (varsayılan 0)
+            conn.execute("UPDATE recommendation_cache SET position = 0")
+            migrations._cache_position(conn)
+            positions = dict(conn.execute("SELECT external_id, position FROM recommendation_cache"))
+        self.assertEqual(positions, {"a-0": 0, "a-1": 1, "a-2": 2, "a-3": 3, "b-0": 0, "b-1": 1, "b-2": 2})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool
+from database.plan_repository import PlanRepository
+from database.repository import ActivityRepository
+from models import Activity, ActivityFilter, Folder, Plan
+
+
+class TestRowModels(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.plan_repo = PlanRepository()
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_models_are_slotted(self):
+        plan = Plan(None, "Hedef", "", "monthly", 2023, 5, "planned", 0, "low", "")
+        for obj in (Activity(None, "Film", "Dune", "2023-05-01", "", 8), plan, Folder(1, "İş", "")):
+            with self.subTest(model=type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+        # dataclass davranışı korunur: varsayılan, eşitlik, alan güncelleme
+        self.assertIsNone(plan.folder_id)
+        self.assertEqual(plan, Plan(None, "Hedef", "", "monthly", 2023, 5, "planned", 0, "low", ""))
+        plan.progress = 50
+        self.assertEqual(plan.progress, 50)
+
+    def test_repository_returns_models_from_tuples(self):
+        self.repo.add(Activity(None, "Dizi", "Dark", "2023-05-01", "yorum", 9, "2023-06-01"))
+        self.plan_repo.add_folder("Okuma")
+        folder = self.plan_repo.get_folders()[0]
+        self.plan_repo.add_plan(Plan(None, "Hedef", "açıklama", "yearly", 2023, None, "planned", 10, "high",
+                                     "2023-01-01 00:00:00", folder.id))
+
+        activity = self.repo.get_all_filtered(ActivityFilter())[0][0]
+        self.assertIsInstance(activity, Activity)
+        self.assertEqual((activity.type, activity.name, activity.comment, activity.rating, activity.end_date),
+                         ("Dizi", "Dark", "yorum", 9, "2023-06-01"))
+        self.assertEqual(self.repo.get_by_id(activity.id).name, "Dark")
+        self.assertEqual([a.id for a in self.repo.iter_filtered(ActivityFilter())], [activity.id])
+
+        plan = self.plan_repo.get_plans("yearly", 2023)[0]
+        self.assertEqual((plan.title, plan.month, plan.progress, plan.folder_id), ("Hedef", None, 10, folder.id))
+        self.assertEqual(list(self.plan_repo.iter_plans()), [plan])
+        self.assertEqual(list(self.plan_repo.iter_folders()), [folder])
+
+    def test_from_row_handles_missing_optional_columns(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT 1 AS id, 'Film' AS type, 'Dune' AS name, '2023-05-01' AS date, "
+                           "'' AS comment, 8 AS rating").fetchone()
+        self.assertIsNone(Activity.from_row(row).end_date)
+        conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
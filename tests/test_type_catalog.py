@@ -0,0 +1,81 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database import connection
+from database.connection import configure_pool
+from database.repository import ActivityRepository
+from database.type_repository import TypeRepository
+from constants import FAALIYET_TURLERI
+from models import Activity
+
+
+class TestTypeCatalog(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.types = TypeRepository()
+        self.repo.add_many([
+            Activity(None, "Film", "Dune", "2023-05-01", "", 8, None),
+            Activity(None, "Film", "Arrival", "2022-03-01", "", 9, None),
+            Activity(None, "Dizi", "Dark", "2023-06-01", "", 9, None),
+        ])
+        self.types.add_type("Belgesel")
+        # Yeni veritabanına varsayılan türler eklenir (kullanılmayanlar 0)
+        self.defaults = {t: 0 for t in FAALIYET_TURLERI}
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_usage_counts_include_unused_registered_types(self):
+        expected = {**self.defaults, "Belgesel": 0, "Dizi": 1, "Film": 2}
+        self.assertEqual(self.types.get_all_types(), sorted(expected))
+        self.assertEqual(self.types.get_type_usage(), expected)
+
+    def test_served_from_memory_until_a_write(self):
+        self.types.get_all_types()
+        connection.enable_query_tracing()
+        try:
+            connection.reset_query_trace()
+            for _ in range(5):
+                self.types.get_all_types()
+                self.types.get_type_usage()
+            self.assertEqual(connection.get_query_trace_summary(), [])
+
+            # İlgisiz bir yazma: yalnızca değişiklik günlüğünün sırası okunur
+            self.types.set_setting("tema", "koyu")
+            self.types.get_all_types()
+            sqls = [entry['sql'] for entry in connection.get_query_trace_summary()]
+            self.assertFalse(any("activity_monthly_agg" in sql for sql in sqls))
+        finally:
+            connection.disable_query_tracing()
+
+    def test_activity_and_type_writes_invalidate(self):
+        self.types.get_all_types()
+        self.repo.add(Activity(None, "Oyun", "Hades", "2023-07-01", "", 10, None))
+        self.assertEqual(self.types.get_type_usage()["Oyun"], 1)
+
+        self.types.update_type("Dizi", "Film")
+        usage = self.types.get_type_usage()
+        self.assertEqual(usage["Film"], 3)
+        self.assertNotIn("Dizi", usage)
+
+        self.types.delete_type("Belgesel")
+        self.assertNotIn("Belgesel", self.types.get_all_types())
+
+    def test_new_pool_reloads(self):
+        self.assertIn("Belgesel", self.types.get_all_types())
+        configure_pool(os.path.join(self.tmp_dir, "bos.db"))
+        self.assertEqual(TypeRepository().get_type_usage(), self.defaults)
+
+
+if __name__ == '__main__':
+    unittest.main()
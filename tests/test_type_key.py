@@ -0,0 +1,64 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.repository import ActivityRepository
+from database.type_key import type_key
+from models import Activity, ActivityFilter
+
+
+class TestTypeKey(unittest.TestCase):
+    def test_turkish_case_folding(self):
+        self.assertEqual(type_key("ŞEHİR"), type_key("şehir"))
+        self.assertEqual(type_key("DIZI"), type_key("Dizi"))
+        self.assertEqual(type_key("Dızı"), "dizi")
+        self.assertEqual(type_key("ÇİZGİ"), "çizgi")
+
+
+class TestTypeKeyColumn(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.repo.add(Activity(None, "Şehir Gezisi", "Kapadokya", "2023-05-01", "", 8))
+        self.repo.add(Activity(None, "Dizi", "Dark", "2023-05-10", "", 9))
+        self.repo.add(Activity(None, "Film", "Inception", "2023-06-01", "", 10))
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_sql_and_python_keys_agree(self):
+        with get_db() as conn:
+            rows = conn.execute("SELECT type, type_key FROM activities").fetchall()
+        for row in rows:
+            self.assertEqual(row['type_key'], type_key(row['type']))
+
+    def test_filter_matches_any_turkish_casing(self):
+        for term in ("ŞEHİR GEZİSİ", "şehir gezisi", "Şehir Gezisi"):
+            with self.subTest(term=term):
+                rows, total = self.repo.get_all_filtered(ActivityFilter(type_filter=term))
+                self.assertEqual(total, 1)
+                self.assertEqual(rows[0].name, "Kapadokya")
+
+        rows, _ = self.repo.get_all_filtered(ActivityFilter(type_filter="DIZI"))
+        self.assertEqual([a.name for a in rows], ["Dark"])
+        self.assertEqual(self.repo.get_details_for_type("DIZI", "", "", ignore_dates=True)[0][0], "Dark")
+
+    def test_type_filter_uses_index(self):
+        with get_db() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM activities WHERE type_key = ?", ("dizi",)
+            ).fetchall()
+        self.assertTrue(any("idx_activities_type_key_date" in row[3] for row in plan))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.repository import ActivityRepository
+from database.type_key import normalize_type_name
+from database.type_repository import TypeRepository
+from models import Activity, ActivityFilter
+
+
+class TestTypeNormalization(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "test.db")
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def stored_types(self):
+        with get_db() as conn:
+            return sorted(row[0] for row in conn.execute("SELECT DISTINCT type FROM activities"))
+
+    def test_normalize_type_name(self):
+        self.assertEqual(normalize_type_name("  belgesel "), "Belgesel")
+        self.assertEqual(normalize_type_name("şehir"), "Şehir")
+        self.assertEqual(normalize_type_name("   "), "")
+
+    def test_writes_use_registered_spelling(self):
+        configure_pool(self.db_path)
+        repo = ActivityRepository()
+        activity = Activity(None, "FİLM", "Dune", "2023-05-01", "", 8, None)
+        self.assertTrue(repo.add(activity))
+        self.assertEqual(activity.type, "Film")
+
+        repo.add_many([
+            Activity(None, " belgesel", "Kozmos", "2023-01-01", "", 9, None),
+            Activity(None, "BELGESEL", "Gezegen", "2023-02-01", "", 8, None),
+            Activity(None, "şehir", "Roma", "2023-03-01", "", 10, None),
+        ])
+        self.assertEqual(self.stored_types(), ["Belgesel", "Film", "Şehir"])
+        self.assertIn("Belgesel", TypeRepository().get_all_types())
+
+        stored = repo.get_all_filtered(ActivityFilter(items_per_page=10))[0]
+        dune = next(a for a in stored if a.name == "Dune")
+        dune.type = "dizi"
+        repo.update(dune)
+        self.assertEqual(repo.get_by_id(dune.id).type, "Dizi")
+
+    def test_migration_merges_legacy_variants(self):
+        # Sürüm 8'deki veritabanı: yazma sırasında normalizasyon öncesi kayıtlar
+        configure_pool(self.db_path)
+        ActivityRepository()
+        configure_pool()
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript('''
+            INSERT INTO activities (type, name, date, comment, rating) VALUES
+                ('film', 'A', '2023-01-01', '', 5),
+                ('FİLM', 'B', '2023-01-02', '', 5),
+                ('anime', 'C', '2023-01-03', '', 5),
+                ('ANIME', 'D', '2023-01-04', '', 5),
+                ('ANIME', 'E', '2023-01-05', '', 5);
+            INSERT INTO activity_types (name) VALUES ('kurs ');
+            DELETE FROM activity_types WHERE name = 'Kurs';
+            PRAGMA user_version = 8;
+        ''')
+        conn.close()
+
+        configure_pool(self.db_path)
+        ActivityRepository()
+        self.assertEqual(self.stored_types(), ["ANIME", "Film"])
+        types = TypeRepository().get_all_types()
+        self.assertIn("Kurs", types)
+        self.assertNotIn("kurs ", types)
+        self.assertNotIn("film", types)
+        with get_db() as conn:
+            counts = dict(conn.execute("SELECT type, SUM(count) FROM activity_monthly_agg GROUP BY type"))
+        self.assertEqual(counts, {"ANIME": 3, "Film": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
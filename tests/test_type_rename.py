@@ -0,0 +1,73 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db
+from database.repository import ActivityRepository
+from database.type_repository import TypeRepository
+from constants import SETTING_TYPE_RENAME_JOB
+from models import Activity
+
+
+class TestTypeRename(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.types = TypeRepository()
+        self.types.RENAME_CHUNK_IDS = 10
+        self.repo.add_many(
+            [Activity(None, "Anime", f"Anime {i}", "2023-01-01", "", 7, None) for i in range(35)]
+            + [Activity(None, "Film", f"Film {i}", "2023-02-01", "", 8, None) for i in range(5)]
+        )
+
+    def tearDown(self):
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def counts(self):
+        with get_db() as conn:
+            return dict(conn.execute("SELECT type, COUNT(*) FROM activities GROUP BY type"))
+
+    def test_rename_in_chunks_reports_progress(self):
+        calls = []
+        ok, _ = self.types.update_type("Anime", "Çizgi Film", progress=lambda done, total: calls.append((done, total)))
+        self.assertTrue(ok)
+        self.assertEqual(calls, [(10, 40), (20, 40), (30, 40), (40, 40)])
+        self.assertEqual(self.counts(), {"Çizgi Film": 35, "Film": 5})
+        self.assertIn("Çizgi Film", self.types.get_all_types())
+        self.assertNotIn("Anime", self.types.get_all_types())
+        self.assertIsNone(self.types.get_setting(SETTING_TYPE_RENAME_JOB))
+
+    def test_merge_into_existing_type(self):
+        ok, msg = self.types.update_type("Anime", "Film")
+        self.assertTrue(ok)
+        self.assertIn("birleştirildi", msg)
+        self.assertEqual(self.counts(), {"Film": 40})
+        self.assertEqual(self.types.get_type_usage()["Film"], 40)
+
+    def test_interrupted_rename_resumes(self):
+        calls = []
+        ok, _ = self.types.update_type("Anime", "Çizgi Film", is_cancelled=lambda: len(calls) >= 2,
+                                       progress=lambda done, total: calls.append(done))
+        self.assertFalse(ok)
+        self.assertEqual(self.counts(), {"Anime": 15, "Çizgi Film": 20, "Film": 5})
+        self.assertIsNotNone(self.types.get_setting(SETTING_TYPE_RENAME_JOB))
+
+        # Bekleyen iş varken yeni bir yeniden adlandırma başlatılmaz
+        self.assertFalse(self.types.update_type("Film", "Sinema")[0])
+
+        ok, _ = TypeRepository().resume_type_rename()
+        self.assertTrue(ok)
+        self.assertEqual(self.counts(), {"Çizgi Film": 35, "Film": 5})
+        self.assertIsNone(self.types.resume_type_rename())
+
+
+if __name__ == '__main__':
+    unittest.main()
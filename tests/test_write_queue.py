@@ -0,0 +1,111 @@
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+# Proje kök dizinini path'e ekle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import configure_pool, get_db, get_write_generation
+from database.repository import ActivityRepository
+from database.write_queue import WriteQueue
+from models import Activity, ActivityFilter
+
+
+def insert(name):
+    def op(conn):
+        return conn.execute(
+            "INSERT INTO activities (type, name, date, comment, rating) VALUES ('Film', ?, '2023-01-01', '', 5)",
+            (name,),
+        ).lastrowid
+    return op
+
+
+class TestWriteQueue(unittest.TestCase):
+    def setUp(self):
+        # Kullanıcının gerçek veritabanına dokunmamak için geçici dosya
+        self.tmp_dir = tempfile.mkdtemp()
+        configure_pool(os.path.join(self.tmp_dir, "test.db"))
+        self.repo = ActivityRepository()
+        self.writer = WriteQueue(window_ms=20)
+
+    def tearDown(self):
+        self.writer.shutdown()
+        configure_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def count(self):
+        with get_db() as conn:
+            return conn.execute("SELECT COUNT(*) FROM activities").fetchone()[0]
+
+    def test_burst_is_group_committed(self):
+        gate = threading.Event()
+        first = self.writer.submit(lambda conn: gate.wait(5))
+        futures = [self.writer.submit(insert(f"F{i}")) for i in range(10)]
+        gate.set()
+
+        ids = [f.result(5) for f in futures]
+        self.assertTrue(first.result(5))
+        self.assertEqual(len(set(ids)), 10)   # her çağıran kendi sonucunu alır
+        self.assertEqual(self.count(), 10)
+
+        stats = self.writer.stats()
+        self.assertLessEqual(stats['batches'], 2)
+        self.assertGreaterEqual(stats['max_batch'], 10)
+        self.assertEqual((stats['committed'], stats['failed'], stats['queue_depth']), (11, 0, 0))
+        self.assertGreaterEqual(stats['max_queue_depth'], 10)
+
+    def test_failing_write_does_not_roll_back_others(self):
+        gate = threading.Event()
+        self.writer.submit(lambda conn: gate.wait(5))
+        ok = self.writer.submit(insert("iyi"))
+        bad = self.writer.submit(lambda conn: conn.execute("INSERT INTO activities (type) VALUES ('eksik')"))
+        also_ok = self.writer.submit(insert("iyi 2"))
+        gate.set()
+
+        self.assertTrue(ok.result(5) and also_ok.result(5))
+        with self.assertRaises(Exception):
+            bad.result(5)
+        self.assertEqual(self.count(), 2)
+        self.assertEqual(self.writer.stats()['failed'], 1)
+
+    def test_nested_write_joins_current_transaction(self):
+        def op(conn):
+            insert("dış")(conn)
+            # Yazıcı thread içinden çağrı kuyrukta beklemez (kilitlenme olmaz)
+            return self.writer.execute(insert("iç"))
+        self.assertIsNotNone(self.writer.execute(op))
+        self.assertEqual(self.count(), 2)
+        self.assertEqual(self.writer.stats()['batches'], 1)
+
+    def test_shutdown_flushes_pending_writes(self):
+        futures = [self.writer.submit(insert(f"F{i}")) for i in range(5)]
+        self.writer.shutdown()
+        self.assertTrue(all(f.done() for f in futures))
+        self.assertEqual(self.count(), 5)
+
+    def test_repository_writes_go_through_queue(self):
+        generation = get_write_generation()
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(
+                self.repo.add(Activity(None, "Kitap", f"K{i}", "2023-02-01", "", 7, None))))
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, [True] * 8)
+        self.assertGreater(get_write_generation(), generation)
+        self.assertEqual(self.repo.get_all_filtered(ActivityFilter())[1], 8)
+        activity = self.repo.get_all_filtered(ActivityFilter())[0][0]
+        self.assertTrue(self.repo.delete(activity.id))
+        self.assertEqual(self.repo.get_all_filtered(ActivityFilter())[1], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,10 @@
 import sys
 import os
 from datetime import datetime
+from constants import PLAN_SCOPES, PLAN_STATUSES, PLAN_PRIORITIES
+from exceptions import ValidationError
+from models import Activity, Plan
+from database.type_key import type_key
 
 def get_resource_path(relative_path):
     """
@@ -41,4 +45,139 @@ def extract_year_month(date_str):
         return dt.year, dt.month
     elif is_valid_yyyy(date_str):
         return int(date_str), None
-    return None, None
\ No newline at end of file
+    return None, None
+
+def date_prefix_bounds(date_prefix):
+    """YYYY-MM veya YYYY önekini yarı açık [başlangıç, bitiş) aralığına çevirir.
+
+    '2023-12' -> ('2023-12', '2024-01'), '2023' -> ('2023', '2024').
+    Sınırlar önek olduğu için hem 'YYYY-MM' hem 'YYYY-MM-DD' kayıtlarını kapsar
+    ve tarih indeksi üzerinde aralık taraması yapılabilir. Geçersizse None döner.
+    """
+    if is_valid_yyyymm(date_prefix):
+        year, month = map(int, date_prefix.split("-"))
+        start = f"{year:04d}-{month:02d}"
+        if month == 12:
+            return start, f"{year + 1:04d}-01"
+        return start, f"{year:04d}-{month + 1:02d}"
+    if is_valid_yyyy(date_prefix):
+        year = int(date_prefix)
+        return f"{year:04d}", f"{year + 1:04d}"
+    return None
+
+
+def build_activity(type_val, name, date_val, comment, rating_val, end_date=None):
+    """Form veya içe aktarma alanlarını doğrulayıp yeni bir Activity döndürür.
+
+    Kurallar AddPage ile aynıdır; ihlalde kullanıcıya gösterilecek mesajla
+    ValidationError fırlatır. 'YYYY-MM' tarihleri 'YYYY-MM-01' olarak saklanır.
+    """
+    if not type_val or not str(type_val).strip():
+        raise ValidationError("Faaliyet türü boş bırakılamaz.")
+    if not name or not name.strip():
+        raise ValidationError("Faaliyet adı boş bırakılamaz.")
+    if not date_val:
+        raise ValidationError("Tarih seçimi zorunludur.")
+    try:
+        if len(date_val.split('-')) == 2:
+            year, month = map(int, date_val.split('-'))
+            selected_date = datetime(year, month, 1)
+            date_val = selected_date.strftime("%Y-%m-%d")
+        else:
+            selected_date = datetime.strptime(date_val, "%Y-%m-%d")
+    except ValueError:
+        raise ValidationError("Tarih formatı geçersiz.")
+    if end_date:
+        try:
+            dt_end = datetime.strptime(end_date, "%Y-%m-%d")
+        except ValueError:
+            raise ValidationError("Bitiş tarihi formatı geçersiz.")
+        if dt_end < selected_date:
+            raise ValidationError("Bitiş tarihi, başlangıç tarihinden önce olamaz.")
+    try:
+        rating = int(rating_val) if rating_val and rating_val != "Seçiniz" else 0
+    except ValueError:
+        raise ValidationError("Geçersiz puan değeri.")
+    if not 0 <= rating <= 10:
+        raise ValidationError("Puan 0-10 arasında olmalıdır (0: puansız).")
+
+    return Activity(None, str(type_val).strip(), name.strip(), date_val, (comment or "").strip(), rating, end_date or None)
+
+
+def _optional_int(value, message):
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError(message)
+
+
+def build_plan(title, description, scope, year, month=None, status="planned",
+               progress=0, priority="medium", created_at=None, folder_id=None):
+    """İçe aktarılan plan alanlarını doğrulayıp yeni bir Plan döndürür.
+    İhlalde ValidationError fırlatır."""
+    if not title or not str(title).strip():
+        raise ValidationError("Başlık boş olamaz.")
+    if scope not in PLAN_SCOPES:
+        raise ValidationError(f"Geçersiz kapsam: {scope}")
+    year = _optional_int(year, "Geçersiz yıl.")
+    if year is None:
+        raise ValidationError("Yıl zorunludur.")
+    month = _optional_int(month, "Geçersiz ay.")
+    if scope == "monthly" and not (month and 1 <= month <= 12):
+        raise ValidationError("Aylık plan için 1-12 arası ay zorunludur.")
+    if scope == "yearly":
+        month = None
+    status = status or "planned"
+    if status not in PLAN_STATUSES:
+        raise ValidationError(f"Geçersiz durum: {status}")
+    priority = priority or "medium"
+    if priority not in PLAN_PRIORITIES:
+        raise ValidationError(f"Geçersiz öncelik: {priority}")
+    progress = _optional_int(progress, "Geçersiz ilerleme değeri.") or 0
+    if not 0 <= progress <= 100:
+        raise ValidationError("İlerleme 0-100 arasında olmalıdır.")
+    created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    return Plan(None, str(title).strip(), description or "", scope, year, month,
+                status, progress, priority, created_at, folder_id)
+
+
+def activity_matches_filter(filter_obj, type_val, date_val, end_date=None) -> bool:
+    """Kaydın ActivityFilter'ın tür ve dönem koşullarına uyup uymadığını
+    repository sorgusuyla aynı kurallarla döndürür (arama terimi hariç)."""
+    if type_val is None or date_val is None:
+        return False
+    if filter_obj.type_filter != "Hepsi" and type_key(type_val) != type_key(filter_obj.type_filter):
+        return False
+    bounds = date_prefix_bounds(filter_obj.date_filter) if filter_obj.date_filter else None
+    if bounds:
+        # Dönemle çakışma: dönem bitmeden başlamış, dönem başladıktan sonra bitmiş
+        start_date, end_exclusive = bounds
+        if not (date_val < end_exclusive and (end_date or date_val) >= start_date):
+            return False
+    return True
+
+
+def apply_stats_change(stats: dict, change, date_prefix="", ignore_dates=False):
+    """Bir ActivityChange'i StatsPage sayaçlarına uygular.
+
+    stats: {tür: [adet, puan toplamı, puanlı adet]}. Dönem kuralı özet
+    tablosuyla aynıdır: kayıt başlangıç tarihinin ayına/yılına sayılır.
+    """
+    for sign, type_val, date_val, rating in (
+        (-1, change.old_type, change.old_date, change.old_rating),
+        (1, change.new_type, change.new_date, change.new_rating),
+    ):
+        if type_val is None or date_val is None:
+            continue
+        if not ignore_dates and not (date_prefix and date_val.startswith(date_prefix)):
+            continue
+        entry = stats.setdefault(type_val, [0, 0, 0])
+        entry[0] += sign
+        if rating and rating > 0:
+            entry[1] += sign * rating
+            entry[2] += sign
+        if entry[0] <= 0:
+            del stats[type_val]
@@ -0,0 +1,87 @@
+# views/dialogs/query_trace_dialog.py
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt
+
+
+class QueryTraceDialog(QDialog):
+    """Sorgu izleme özetini (sorgu başına sayı, süre, satır) tablo olarak gösterir."""
+
+    LIMIT = 50
+    COLUMNS = ("Sorgu", "Çağıran", "Sayı", "Toplam ms", "Ort. ms", "En uzun ms", "Satır", "Yavaş")
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.setWindowTitle("Sorgu İzleme Özeti")
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        self.resize(900, 500)
+        self.init_ui()
+        self.load_summary()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        self.lbl_info = QLabel("")
+        self.lbl_info.setStyleSheet("color: #7F8C8D; font-size: 12px;")
+        self.lbl_info.setWordWrap(True)
+        layout.addWidget(self.lbl_info)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for col in range(1, len(self.COLUMNS)):
+            header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        layout.addWidget(self.table)
+
+        btn_layout = QHBoxLayout()
+        btn_reset = QPushButton("Sıfırla")
+        btn_reset.setCursor(Qt.PointingHandCursor)
+        btn_reset.clicked.connect(self.reset_summary)
+        btn_layout.addWidget(btn_reset)
+        btn_layout.addStretch()
+
+        btn_refresh = QPushButton("Yenile")
+        btn_refresh.setCursor(Qt.PointingHandCursor)
+        btn_refresh.clicked.connect(self.load_summary)
+        btn_layout.addWidget(btn_refresh)
+
+        btn_close = QPushButton("Kapat")
+        btn_close.setObjectName("btn_primary")
+        btn_close.setCursor(Qt.PointingHandCursor)
+        btn_close.clicked.connect(self.accept)
+        btn_layout.addWidget(btn_close)
+        layout.addLayout(btn_layout)
+
+    def load_summary(self):
+        rows = self.controller.get_query_trace_summary(self.LIMIT)
+        if not self.controller.is_query_tracing_enabled():
+            self.lbl_info.setText("Sorgu izleme kapalı. Ayarlar sayfasından açabilirsiniz.")
+        else:
+            self.lbl_info.setText(
+                f"Toplam süreye göre ilk {self.LIMIT} sorgu. Eşiği aşan sorgular planlarıyla "
+                "birlikte slow_queries.log dosyasına yazılır."
+            )
+
+        self.table.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            sql_item = QTableWidgetItem(row['sql'])
+            sql_item.setToolTip(row['sql'] + "\n\nParametreler: " + " | ".join(row['shapes']))
+            self.table.setItem(i, 0, sql_item)
+            self.table.setItem(i, 1, QTableWidgetItem(", ".join(row['callers'])))
+            values = (row['count'], row['total_ms'], row['avg_ms'], row['max_ms'], row['rows'], row['slow'])
+            for col, value in enumerate(values, start=2):
+                text = f"{value:.1f}" if isinstance(value, float) else str(value)
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(i, col, item)
+
+    def reset_summary(self):
+        self.controller.reset_query_trace()
+        self.load_summary()
@@ -237,7 +237,8 @@ class MainWindow(QMainWindow):
         self.trend_analysis_page.back_clicked.connect(self.close_trend_analysis)
 
         # Observer: aktivite veya plan değişince aktif sayfayı yenile
-        self.controller.activity_changed.connect(self._on_activity_changed)
+        # Faaliyet değişiklikleri değişiklik günlüğünden delta olarak gelir
+        self.controller.activities_delta.connect(self._on_activities_delta)
         self.controller.plan_changed.connect(self._on_plan_changed)
 
     def switch_page(self, index):
@@ -279,9 +280,11 @@ class MainWindow(QMainWindow):
             elif hasattr(page, 'refresh_statistics'):
                 page.refresh_statistics()
 
-    def _on_activity_changed(self):
-        for page in (self.list_page, self.stats_page, self.compare_page, self.pdf_page):
-            self._refresh_current(page)
+    def _on_activities_delta(self, changeset):
+        """Aktif sayfaya yalnızca değişen kayıtları uygular; diğer sayfalar açılınca zaten yenilenir."""
+        for page in (self.list_page, self.stats_page, self.compare_page):
+            if self.stacked_widget.currentWidget() is page:
+                page.apply_changes(changeset)
 
     def _on_plan_changed(self):
         self._refresh_current(self.plans_page)
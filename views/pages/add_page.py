@@ -2,7 +2,7 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit,
                              QTextEdit, QComboBox, QPushButton, QMessageBox,
                              QDateEdit, QFormLayout, QFrame, QShortcut, QCompleter, QCheckBox, QHBoxLayout)
-from PyQt5.QtCore import QDate, Qt, QLocale, QTimer
+from PyQt5.QtCore import QDate, Qt, QLocale, QTimer, QStringListModel
 from PyQt5.QtGui import QKeySequence, QFont
 from utils import get_resource_path
 import os
@@ -12,6 +12,8 @@ from views.widgets.styled_combo import StyledComboBox
 
 
 class AddPage(QWidget):
+    SUGGEST_DELAY_MS = 120   # tuş vuruşları arasında öneri sorgusu beklemesi
+
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
@@ -205,36 +207,61 @@ class AddPage(QWidget):
         return label
 
     def setup_autocomplete(self):
-        if hasattr(self.controller, 'get_all_activity_names'):
-            self.controller.get_all_activity_names(self.on_names_loaded)
-
-    def on_names_loaded(self, names_list):
-        if names_list:
-            self.completer = QCompleter(names_list)
-            self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-            self.completer.setFilterMode(Qt.MatchContains)
-            self.completer.setMaxVisibleItems(8)
-            self.completer.popup().setStyleSheet("""
-                QListView {
-                    background-color: white;
-                    border: 2px solid #E2E8F0;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    padding: 5px;
-                }
-                QListView::item {
-                    padding: 10px 15px;
-                    border-radius: 5px;
-                }
-                QListView::item:hover {
-                    background-color: #F1F5F9;
-                }
-                QListView::item:selected {
-                    background-color: #3B82F6;
-                    color: white;
-                }
-            """)
-            self.input_name.setCompleter(self.completer)
+        """Öneriler her tuş vuruşunda (kısa bekleme ile) veritabanından ilk N isim
+        olarak gelir; tüm isim listesi belleğe alınmaz. Sıralama ve eşleştirme
+        sorguda yapıldığından completer filtrelemez."""
+        if hasattr(self, 'completer') or not hasattr(self.controller, 'suggest_activity_names'):
+            return
+        self.name_model = QStringListModel(self)
+        self.completer = QCompleter(self.name_model, self)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.completer.setMaxVisibleItems(8)
+        self.completer.popup().setStyleSheet("""
+            QListView {
+                background-color: white;
+                border: 2px solid #E2E8F0;
+                border-radius: 8px;
+                font-size: 14px;
+                padding: 5px;
+            }
+            QListView::item {
+                padding: 10px 15px;
+                border-radius: 5px;
+            }
+            QListView::item:hover {
+                background-color: #F1F5F9;
+            }
+            QListView::item:selected {
+                background-color: #3B82F6;
+                color: white;
+            }
+        """)
+        self.input_name.setCompleter(self.completer)
+
+        self.suggest_timer = QTimer(self)
+        self.suggest_timer.setSingleShot(True)
+        self.suggest_timer.setInterval(self.SUGGEST_DELAY_MS)
+        self.suggest_timer.timeout.connect(self.request_name_suggestions)
+        # textEdited yalnızca kullanıcı yazınca tetiklenir (öneri seçimi tetiklemez)
+        self.input_name.textEdited.connect(lambda _: self.suggest_timer.start())
+
+    def request_name_suggestions(self):
+        query = self.input_name.text().strip()
+        if not query:
+            self.name_model.setStringList([])
+            return
+        self.controller.suggest_activity_names(
+            query, lambda names, q=query: self.on_names_loaded(q, names)
+        )
+
+    def on_names_loaded(self, query, names_list):
+        # Bu arada yazmaya devam edildiyse eski sonuç gösterilmez
+        if query != self.input_name.text().strip():
+            return
+        self.name_model.setStringList(names_list or [])
+        if names_list and self.input_name.hasFocus():
+            self.completer.complete()
 
     def on_range_toggled(self, checked):
         if checked:
@@ -295,7 +322,6 @@ class AddPage(QWidget):
                 window.statusBar().showMessage(message, 3000)
 
             self.clear_inputs()
-            self.setup_autocomplete()
         else:
             QMessageBox.warning(self, "Hata", message)
 
@@ -332,4 +358,3 @@ class AddPage(QWidget):
 
     def refresh_data(self):
         self.load_types()
-        self.setup_autocomplete()
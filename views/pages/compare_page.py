@@ -77,6 +77,14 @@ class ComparePage(QWidget):
         if hasattr(self.controller, 'get_all_activity_types'):
             self.controller.get_all_activity_types(self.on_types_loaded)
 
+    def apply_changes(self, changeset):
+        """Tablo başlıkları yalnızca yeni bir tür ortaya çıktığında yenilenir."""
+        known = {t.casefold() for t in getattr(self, 'activity_types', [])}
+        if changeset.truncated or any(
+            c.new_type and c.new_type.casefold() not in known for c in changeset.changes
+        ):
+            self.refresh_statistics()
+
     def on_types_loaded(self, types):
         self.activity_types = types if types else []
         # Tablo başlıklarını yenilemek gerekebilir ama 
@@ -2,7 +2,8 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QLineEdit, QComboBox, QPushButton, QTableWidget, 
                              QTableWidgetItem, QHeaderView, QMessageBox, QFrame,
-                             QMenu, QDialog, QGridLayout, QGraphicsDropShadowEffect, QAbstractItemView)
+                             QMenu, QDialog, QGridLayout, QGraphicsDropShadowEffect, QAbstractItemView,
+                             QFileDialog)
 from PyQt5.QtCore import Qt, QTimer, QSize
 from PyQt5.QtGui import QColor, QFont, QIcon, QBrush
 import math
@@ -10,6 +11,9 @@ import math
 from views.widgets import MonthYearWidget
 from views.widgets.styled_combo import StyledComboBox
 from views.dialogs.edit_dialog import EditDialog
+from services.icon_service import IconService
+from models import ActivityFilter
+from utils import activity_matches_filter
 # ═══════════════════════════════════════════════════════════════════════════════
 # STYLE CONSTANTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -35,6 +39,9 @@ class ListPage(QWidget):
         self.current_page = 1
         self.items_per_page = 15
         self.total_pages = 1
+        self.page_cursors = {}  # sayfa -> önceki sayfanın son (date, id) değeri (keyset sayfalama)
+        self.page_activities = []  # tabloda gösterilen kayıtlar (date DESC, id DESC)
+        self.total_count = 0
         
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
@@ -74,6 +81,15 @@ class ListPage(QWidget):
         header_layout.addSpacing(15)
         header_layout.addWidget(self.badge_total)
         header_layout.addStretch()
+
+        # Mevcut filtreyle (tür, dönem, arama) eşleşen tüm kayıtları dışa aktarır
+        self.btn_export = QPushButton("Dışa Aktar")
+        self.btn_export.setIcon(IconService.get("export"))
+        self.btn_export.setIconSize(QSize(16, 16))
+        self.btn_export.setObjectName("btn_primary")
+        self.btn_export.setCursor(Qt.PointingHandCursor)
+        self.btn_export.clicked.connect(self.export_filtered)
+        header_layout.addWidget(self.btn_export)
         layout.addLayout(header_layout)
 
     def _build_filter(self, layout):
@@ -270,13 +286,42 @@ class ListPage(QWidget):
         if index >= 0: self.combo_filter_type.setCurrentIndex(index)
         self.combo_filter_type.blockSignals(False)
 
+    def export_filtered(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Dışa Aktar", "faaliyetler.csv", "CSV (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not file_path:
+            return
+        self.btn_export.setEnabled(False)
+        self.controller.export_activities(
+            file_path, self.on_export_finished, self.on_export_progress,
+            type_filter=self.combo_filter_type.currentText(),
+            search_term=self.input_search.text(),
+            date_filter=self.date_widget.get_date_str(),
+        )
+
+    def on_export_progress(self, done, total):
+        if self.window().statusBar():
+            self.window().statusBar().showMessage(f"Dışa aktarılıyor... {done}/{total}", 1000)
+
+    def on_export_finished(self, result):
+        self.btn_export.setEnabled(True)
+        success, msg = result if result else (False, "Dışa aktarma başarısız oldu.")
+        if success:
+            if self.window().statusBar():
+                self.window().statusBar().showMessage(msg, 3000)
+        else:
+            QMessageBox.warning(self, "Hata", msg)
+
     def on_filter_changed(self):
         self.current_page = 1
+        self.page_cursors.clear()
         self.refresh_data()
 
     def on_per_page_changed(self, text):
         self.items_per_page = int(text)
         self.current_page = 1
+        self.page_cursors.clear()
         self.refresh_data()
 
     def prev_page(self):
@@ -301,24 +346,89 @@ class ListPage(QWidget):
             self.on_data_loaded,
             type_filter, search_term, date_filter, 
             page=self.current_page, 
-            items_per_page=self.items_per_page
+            items_per_page=self.items_per_page,
+            cursor=self.page_cursors.get(self.current_page)
         )
 
     def on_data_loaded(self, result):
         if not result: return
 
         activities, total_count = result
-        self.badge_total.setText(f"{total_count} Kayıt")
-        
-        self.total_pages = math.ceil(total_count / self.items_per_page)
+        self.page_activities = list(activities)
+        self.total_count = total_count
+        self._update_pagination()
+
+        if activities:
+            last = activities[-1]
+            self.page_cursors[self.current_page + 1] = (last.date, last.id)
+
+        self._render_rows()
+
+    def apply_changes(self, changeset):
+        """Değişiklik günlüğü deltalarını uygular: yalnızca etkilenen satırlar
+        değişir, toplam sayı yeniden sayılmaz."""
+        search_term = self.input_search.text().strip()
+        if changeset.truncated or search_term:
+            # Arama sonuçları FTS (bm25) sırasında; eşleşme Python'da tekrarlanmaz
+            self.refresh_data()
+            return
+
+        filter_obj = ActivityFilter(
+            type_filter=self.combo_filter_type.currentText(),
+            date_filter=self.date_widget.get_date_str(),
+        )
+        # Sayfanın üst sınırı: önceki sayfanın son kaydı; OFFSET ile açılmışsa sayfanın ilk kaydı
+        upper = self.page_cursors.get(self.current_page)
+        if upper is None and self.current_page > 1 and self.page_activities:
+            first = self.page_activities[0]
+            upper = (first.date, first.id + 1)
+        # Dolu sayfanın altında sonraki sayfanın kayıtları var: sayfanın son kaydından eski
+        # bir kayıt ancak aradakiler bilinirse eklenebilir; bilinmiyorsa sayfa yeniden yüklenir
+        bounded = len(self.page_activities) >= self.items_per_page
+        for change in changeset.changes:
+            was = change.op != "I" and activity_matches_filter(
+                filter_obj, change.old_type, change.old_date, change.old_end_date)
+            now = change.op != "D" and change.activity is not None and activity_matches_filter(
+                filter_obj, change.new_type, change.new_date, change.new_end_date)
+            self.total_count += int(now) - int(was)
+
+            self.page_activities = [a for a in self.page_activities if a.id != change.activity_id]
+            if now:
+                key = (change.activity.date, change.activity.id)
+                last = self.page_activities[-1] if self.page_activities else None
+                # Kayıt bu sayfanın (date DESC, id DESC) aralığına düşüyorsa eklenir
+                if (upper is None or key < tuple(upper)) and (not bounded or (last and key > (last.date, last.id))):
+                    self.page_activities.append(change.activity)
+                    self.page_activities.sort(key=lambda a: (a.date, a.id), reverse=True)
+                    del self.page_activities[self.items_per_page:]
+
+        # Sonraki sayfaların sınırları kaymış olabilir; gerekirse OFFSET ile yeniden bulunur
+        for page in [p for p in self.page_cursors if p > self.current_page]:
+            del self.page_cursors[page]
+
+        # Silinen / filtreden çıkan satırların yerini sonraki sayfanın kayıtları alır
+        shown_before = (self.current_page - 1) * self.items_per_page
+        if (len(self.page_activities) < self.items_per_page
+                and self.total_count > shown_before + len(self.page_activities)):
+            self.refresh_data()
+            return
+        self._update_pagination()
+        self._render_rows()
+
+    def _update_pagination(self):
+        self.badge_total.setText(f"{self.total_count} Kayıt")
+
+        self.total_pages = math.ceil(self.total_count / self.items_per_page)
         if self.total_pages == 0: self.total_pages = 1
-        
+
         self.lbl_page_info.setText(f"Sayfa {self.current_page} / {self.total_pages}")
         self.btn_prev.setEnabled(self.current_page > 1)
         self.btn_next.setEnabled(self.current_page < self.total_pages)
 
+    def _render_rows(self):
+        self.table.setSortingEnabled(False)
         self.table.setRowCount(0)
-        for row_idx, activity in enumerate(activities):
+        for row_idx, activity in enumerate(self.page_activities):
             self.table.insertRow(row_idx)
             self.table.setRowHeight(row_idx, 60) # Satır yüksekliği arttırıldı
             
@@ -377,6 +487,7 @@ class ListPage(QWidget):
         self.input_search.clear()
         self.date_widget.clear_filters()
         self.current_page = 1
+        self.page_cursors.clear()
     
     def open_edit_dialog(self):
         selected_rows = self.table.selectionModel().selectedRows()
@@ -387,9 +498,8 @@ class ListPage(QWidget):
 
     def on_activity_loaded_for_edit(self, activity):
         if activity:
-            dialog = EditDialog(self.controller, activity, self)
-            if dialog.exec_() == QDialog.Accepted:
-                self.refresh_data()
+            # Kaydedilen değişiklik activities_delta ile tabloya yansır
+            EditDialog(self.controller, activity, self).exec_()
 
     def open_context_menu(self, position):
         menu = QMenu()
@@ -430,8 +540,7 @@ class ListPage(QWidget):
             self.controller.delete_activity(activity_id, self.on_delete_finished)
 
     def on_delete_finished(self, result):
+        # Başarıda silinen satır activities_delta ile tablodan kalkar
         success, msg = result
-        if success:
-            self.refresh_data()
-        else:
+        if not success:
             QMessageBox.warning(self, "Hata", msg)
\ No newline at end of file
@@ -2,10 +2,14 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QListWidget, QLineEdit, QMessageBox,
                              QInputDialog, QFrame, QGraphicsDropShadowEffect,
-                             QListWidgetItem, QGridLayout)
+                             QListWidgetItem, QGridLayout, QFileDialog, QProgressBar,
+                             QCheckBox)
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QColor
 from services.icon_service import IconService
+from services.import_service import ImportService
+from views.widgets.styled_combo import StyledComboBox
+from views.dialogs.query_trace_dialog import QueryTraceDialog
 
 class SettingsPage(QWidget):
     # Sayfalama sabitleri
@@ -18,6 +22,7 @@ class SettingsPage(QWidget):
         super().__init__()
         self.controller = controller
         self.all_types = []  # Tüm türleri saklar
+        self.type_usage = {}  # Tür -> kayıt sayısı
         self.filtered_types = []  # Filtrelenmiş türler
         self.current_page = 0
         self.init_ui()
@@ -54,7 +59,9 @@ class SettingsPage(QWidget):
         self.card = self._create_activity_types_card()
         cards_layout.addWidget(self.card, 0, 1)
         
-        # (0,2) şu an boş kalacak
+        # --- Veritabanı Kartı (0,2) ---
+        self.db_card = self._create_database_card()
+        cards_layout.addWidget(self.db_card, 0, 2)
         
         main_layout.addLayout(cards_layout)
         main_layout.addStretch()
@@ -62,6 +69,7 @@ class SettingsPage(QWidget):
         # İlk veri yükleme
         self.refresh_types()
         self.load_api_keys()
+        self.load_db_profiles()
 
     def _create_activity_types_card(self):
         """Faaliyet türleri yönetimi için kart oluşturur."""
@@ -127,6 +135,18 @@ class SettingsPage(QWidget):
         self.type_list.setMaximumHeight(self.MAX_LIST_HEIGHT)
         list_container.addWidget(self.type_list)
 
+        # Tür yeniden adlandırma/birleştirme ilerlemesi (kayıtlar parça parça güncellenir)
+        self.type_progress = QProgressBar()
+        self.type_progress.setRange(0, 100)
+        self.type_progress.setFixedHeight(8)
+        self.type_progress.setTextVisible(False)
+        self.type_progress.setStyleSheet("""
+            QProgressBar { background-color: #F0F3F4; border-radius: 4px; border: none; }
+            QProgressBar::chunk { background: #3B82F6; border-radius: 4px; }
+        """)
+        self.type_progress.hide()
+        list_container.addWidget(self.type_progress)
+
         self.pagination_frame = QFrame()
         pagination_layout = QHBoxLayout(self.pagination_frame)
         pagination_layout.setContentsMargins(0, 0, 0, 0)
@@ -241,6 +261,332 @@ class SettingsPage(QWidget):
         
         return card
 
+    def _create_database_card(self):
+        """SQLite performans profili seçimi için kart oluşturur."""
+        card = QFrame()
+        card.setObjectName("card")
+
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(15)
+        shadow.setXOffset(0)
+        shadow.setYOffset(3)
+        shadow.setColor(QColor(0, 0, 0, 30))
+        card.setGraphicsEffect(shadow)
+
+        layout = QVBoxLayout(card)
+        layout.setContentsMargins(18, 15, 18, 15)
+        layout.setSpacing(10)
+
+        header = IconService.title_widget(
+            "database", "Veritabanı",
+            style="font-size: 18px; font-weight: bold; color: #34495E; border: none; background: transparent;",
+            icon_size=20
+        )
+        layout.addWidget(header)
+
+        desc = QLabel("SQLite performans profilini seçin. Yeni bağlantılar seçilen profille açılır.")
+        desc.setStyleSheet("color: #95A5A6; font-size: 13px; border: none;")
+        desc.setWordWrap(True)
+        layout.addWidget(desc)
+
+        profile_lbl = QLabel("Performans Profili:")
+        profile_lbl.setStyleSheet("font-weight: bold; color: #555;")
+        layout.addWidget(profile_lbl)
+
+        self.combo_db_profile = StyledComboBox()
+        self.combo_db_profile.currentIndexChanged.connect(self.on_db_profile_selected)
+        layout.addWidget(self.combo_db_profile)
+
+        self.lbl_db_profile_desc = QLabel("")
+        self.lbl_db_profile_desc.setStyleSheet("color: #7F8C8D; font-size: 12px; border: none;")
+        self.lbl_db_profile_desc.setWordWrap(True)
+        layout.addWidget(self.lbl_db_profile_desc)
+
+        self.btn_save_profile = QPushButton("Uygula")
+        self.btn_save_profile.setIcon(IconService.get("save"))
+        self.btn_save_profile.setIconSize(QSize(16, 16))
+        self.btn_save_profile.setObjectName("btn_primary")
+        self.btn_save_profile.setCursor(Qt.PointingHandCursor)
+        self.btn_save_profile.setFixedWidth(120)
+        self.btn_save_profile.clicked.connect(self.save_db_profile)
+        layout.addWidget(self.btn_save_profile, 0, Qt.AlignRight)
+
+        # --- Bellek İçi Analiz Kopyası ---
+        self.chk_analytics_replica = QCheckBox("İstatistik ve raporları bellek içi kopyadan oku")
+        self.chk_analytics_replica.setToolTip(
+            "İstatistik, karşılaştırma, trend ve PDF sorguları veritabanının bellekteki\n"
+            "salt okunur kopyasında çalışır. Kopya her faaliyet değişikliğinde yenilenir;\n"
+            "veritabanı boyutu kadar ek bellek kullanır."
+        )
+        self.chk_analytics_replica.setStyleSheet("color: #555; border: none;")
+        self.chk_analytics_replica.setChecked(self.controller.is_analytics_replica_enabled())
+        self.chk_analytics_replica.toggled.connect(self.save_analytics_replica)
+        layout.addWidget(self.chk_analytics_replica)
+
+        # --- Sorgu İzleme ---
+        trace_row = QHBoxLayout()
+        self.chk_query_tracing = QCheckBox("Sorgu izleme (süre, satır ve yavaş sorgu günlüğü)")
+        self.chk_query_tracing.setToolTip(
+            "Her SQL sorgusunun süresini, dönen satır sayısını ve çağıran metodu kaydeder.\n"
+            "Eşiği aşan sorgular EXPLAIN QUERY PLAN çıktısıyla slow_queries.log dosyasına yazılır.\n"
+            "Tanılama içindir; açıkken sorgular bir miktar yavaşlar."
+        )
+        self.chk_query_tracing.setStyleSheet("color: #555; border: none;")
+        self.chk_query_tracing.setChecked(self.controller.is_query_tracing_enabled())
+        self.chk_query_tracing.toggled.connect(self.save_query_tracing)
+        trace_row.addWidget(self.chk_query_tracing)
+        trace_row.addStretch()
+        btn_trace_summary = QPushButton("Özeti Göster")
+        btn_trace_summary.setCursor(Qt.PointingHandCursor)
+        btn_trace_summary.clicked.connect(self.show_query_trace_summary)
+        trace_row.addWidget(btn_trace_summary)
+        layout.addLayout(trace_row)
+
+        # --- Yedekleme ---
+        backup_row = QHBoxLayout()
+        backup_lbl = QLabel("Otomatik yedek: veri değiştiyse düzenli aralıklarla alınır, en yeni anlık görüntüler saklanır.")
+        backup_lbl.setToolTip(
+            "Yedekler veri klasöründeki backups/ dizinindedir.\n"
+            "Geri yüklemek için uygulamayı kapatıp çalıştırın: python -m database restore"
+        )
+        backup_lbl.setStyleSheet("color: #7F8C8D; font-size: 12px; border: none;")
+        backup_lbl.setWordWrap(True)
+        backup_row.addWidget(backup_lbl, 1)
+        self.btn_backup_now = QPushButton("Şimdi Yedekle")
+        self.btn_backup_now.setIcon(IconService.get("save"))
+        self.btn_backup_now.setIconSize(QSize(16, 16))
+        self.btn_backup_now.setCursor(Qt.PointingHandCursor)
+        self.btn_backup_now.clicked.connect(self.backup_now)
+        backup_row.addWidget(self.btn_backup_now)
+        layout.addLayout(backup_row)
+
+        # --- Veri Aktarımı (CSV / JSONL) ---
+        transfer_lbl = QLabel("Veri Aktarımı (CSV / JSONL):")
+        transfer_lbl.setStyleSheet("font-weight: bold; color: #555;")
+        layout.addWidget(transfer_lbl)
+
+        self.transfer_progress = QProgressBar()
+        self.transfer_progress.setRange(0, 100)
+        self.transfer_progress.setFixedHeight(8)
+        self.transfer_progress.setTextVisible(False)
+        self.transfer_progress.setStyleSheet("""
+            QProgressBar { background-color: #F0F3F4; border-radius: 4px; border: none; }
+            QProgressBar::chunk { background: #3B82F6; border-radius: 4px; }
+        """)
+        self.transfer_progress.hide()
+        layout.addWidget(self.transfer_progress)
+
+        transfer_row = QHBoxLayout()
+        transfer_row.addStretch()
+        self.btn_stop_transfer = QPushButton("Durdur")
+        self.btn_stop_transfer.setCursor(Qt.PointingHandCursor)
+        self.btn_stop_transfer.clicked.connect(self.stop_transfer)
+        self.btn_stop_transfer.hide()
+        transfer_row.addWidget(self.btn_stop_transfer)
+
+        self.transfer_buttons = []
+        for text, icon, handler, tooltip in (
+            ("İçe Aktar", "import", self.import_activities, "CSV / JSONL dosyasından faaliyet ekler"),
+            ("Tümünü Dışa Aktar", "export", self.export_database, "Klasör, plan ve faaliyetleri bir klasöre yazar"),
+            ("Tümünü Geri Yükle", "import", self.import_database, "Dışa aktarılmış klasörü içe aktarır"),
+        ):
+            btn = QPushButton(text)
+            btn.setIcon(IconService.get(icon))
+            btn.setIconSize(QSize(16, 16))
+            btn.setObjectName("btn_primary")
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setToolTip(tooltip)
+            btn.clicked.connect(handler)
+            transfer_row.addWidget(btn)
+            self.transfer_buttons.append(btn)
+        layout.addLayout(transfer_row)
+
+        self.transfer_worker = None
+
+        return card
+
+    def load_db_profiles(self):
+        """Profil listesini ve aktif profili yükler."""
+        profiles, active = self.controller.get_db_profiles()
+        self.combo_db_profile.blockSignals(True)
+        self.combo_db_profile.clear()
+        for key, name, description in profiles:
+            self.combo_db_profile.addItem(name, (key, description))
+            if key == active:
+                self.combo_db_profile.setCurrentIndex(self.combo_db_profile.count() - 1)
+        self.combo_db_profile.blockSignals(False)
+        self.on_db_profile_selected(self.combo_db_profile.currentIndex())
+
+    def on_db_profile_selected(self, index):
+        data = self.combo_db_profile.itemData(index)
+        self.lbl_db_profile_desc.setText(data[1] if data else "")
+
+    def save_db_profile(self):
+        data = self.combo_db_profile.currentData()
+        if not data:
+            return
+        self.btn_save_profile.setEnabled(False)
+        self.controller.save_db_profile(data[0], self.on_save_db_profile_finished)
+
+    def on_save_db_profile_finished(self, result):
+        self.btn_save_profile.setEnabled(True)
+        success, msg = result if result else (False, "Profil kaydedilemedi.")
+        if success:
+            if self.window().statusBar():
+                self.window().statusBar().showMessage(msg, 3000)
+        else:
+            QMessageBox.warning(self, "Hata", msg)
+
+    def save_analytics_replica(self, enabled):
+        self.chk_analytics_replica.setEnabled(False)
+        self.controller.save_analytics_replica(enabled, self.on_save_analytics_replica_finished)
+
+    def on_save_analytics_replica_finished(self, result):
+        self.chk_analytics_replica.setEnabled(True)
+        success, msg = result if result else (False, "Ayar kaydedilemedi.")
+        if success:
+            if self.window().statusBar():
+                self.window().statusBar().showMessage(msg, 3000)
+        else:
+            self.chk_analytics_replica.blockSignals(True)
+            self.chk_analytics_replica.setChecked(self.controller.is_analytics_replica_enabled())
+            self.chk_analytics_replica.blockSignals(False)
+            QMessageBox.warning(self, "Hata", msg)
+
+    def save_query_tracing(self, enabled):
+        self.chk_query_tracing.setEnabled(False)
+        self.controller.save_query_tracing(enabled, self.on_save_query_tracing_finished)
+
+    def on_save_query_tracing_finished(self, result):
+        self.chk_query_tracing.setEnabled(True)
+        success, msg = result if result else (False, "Ayar kaydedilemedi.")
+        if success:
+            if self.window().statusBar():
+                self.window().statusBar().showMessage(msg, 3000)
+        else:
+            self.chk_query_tracing.blockSignals(True)
+            self.chk_query_tracing.setChecked(self.controller.is_query_tracing_enabled())
+            self.chk_query_tracing.blockSignals(False)
+            QMessageBox.warning(self, "Hata", msg)
+
+    def backup_now(self):
+        self.btn_backup_now.setEnabled(False)
+        self.controller.backup_now(self.on_backup_finished)
+
+    def on_backup_finished(self, result):
+        self.btn_backup_now.setEnabled(True)
+        success, msg = result if result else (False, "Yedek alınamadı.")
+        if success:
+            if self.window().statusBar():
+                self.window().statusBar().showMessage(msg, 3000)
+        else:
+            QMessageBox.warning(self, "Hata", msg)
+
+    def show_query_trace_summary(self):
+        QueryTraceDialog(self.controller, self).exec_()
+
+    def _start_transfer(self, start):
+        """Aktarım butonlarını kilitler ve işi başlatır (start -> ProgressWorker)."""
+        for btn in self.transfer_buttons:
+            btn.setEnabled(False)
+        self.btn_stop_transfer.show()
+        self.transfer_progress.setValue(0)
+        self.transfer_progress.show()
+        self.transfer_worker = start()
+        if self.transfer_worker is None:
+            self._end_transfer()
+
+    def _end_transfer(self):
+        self.transfer_worker = None
+        for btn in self.transfer_buttons:
+            btn.setEnabled(True)
+        self.btn_stop_transfer.hide()
+        self.transfer_progress.hide()
+
+    def stop_transfer(self):
+        if self.transfer_worker:
+            self.transfer_worker.stop()
+
+    def on_transfer_progress(self, processed, total):
+        self.transfer_progress.setValue(min(100, processed * 100 // max(total, 1)))
+        if self.window().statusBar():
+            self.window().statusBar().showMessage(f"Aktarılıyor... {processed} satır", 1000)
+
+    def import_activities(self):
+        """CSV / JSONL dosyasından faaliyetleri arka planda içe aktarır."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "İçe Aktarılacak Dosya", "", "Veri Dosyaları (*.csv *.jsonl *.ndjson)"
+        )
+        if file_path:
+            self._start_transfer(lambda: self.controller.import_activities(
+                file_path, self.on_import_finished, self.on_transfer_progress
+            ))
+
+    def export_database(self):
+        directory = QFileDialog.getExistingDirectory(self, "Dışa Aktarma Klasörü")
+        if directory:
+            self._start_transfer(lambda: self.controller.export_database(
+                directory, self.on_export_finished, self.on_transfer_progress
+            ))
+
+    def import_database(self):
+        directory = QFileDialog.getExistingDirectory(self, "Dışa Aktarılmış Klasör")
+        if not directory:
+            return
+        reply = QMessageBox.question(
+            self, "Geri Yükle",
+            "Klasördeki klasör, plan ve faaliyetler mevcut verilere EKLENECEK.\nDevam edilsin mi?",
+            QMessageBox.Yes | QMessageBox.No,
+        )
+        if reply == QMessageBox.Yes:
+            self._start_transfer(lambda: self.controller.import_database(
+                directory, self.on_import_database_finished, self.on_transfer_progress
+            ))
+
+    def on_export_finished(self, result):
+        self._end_transfer()
+        success, msg = result if result else (False, "Dışa aktarma başarısız oldu.")
+        if success:
+            QMessageBox.information(self, "Dışa Aktarma", f"Dışa aktarıldı — {msg}")
+        else:
+            QMessageBox.warning(self, "Hata", msg)
+
+    def on_import_database_finished(self, result):
+        self._end_transfer()
+        if not result:
+            QMessageBox.warning(self, "Hata", "Geri yükleme başarısız oldu.")
+            return
+        success, msg, _ = result
+        if success:
+            QMessageBox.information(self, "Geri Yükleme", msg)
+        else:
+            QMessageBox.warning(self, "Geri Yükleme", msg)
+
+    def on_import_finished(self, result):
+        self._end_transfer()
+        if not result:
+            QMessageBox.warning(self, "Hata", "İçe aktarma başarısız oldu.")
+            return
+
+        _, msg, report = result
+        if not report or not report.rejected:
+            QMessageBox.information(self, "İçe Aktarma", msg)
+            return
+
+        # Reddedilen satırların ilk birkaçı gösterilir; tamamı CSV olarak kaydedilebilir
+        details = "\n".join(f"Satır {line_no}: {reason}" for line_no, reason, _ in report.rejected[:10])
+        if len(report.rejected) > 10:
+            details += f"\n... ve {len(report.rejected) - 10} satır daha"
+        answer = QMessageBox.question(
+            self, "İçe Aktarma",
+            f"{msg}\n\n{details}\n\nReddedilen satırları dosyaya kaydetmek ister misiniz?",
+            QMessageBox.Yes | QMessageBox.No,
+        )
+        if answer == QMessageBox.Yes:
+            path, _ = QFileDialog.getSaveFileName(self, "Reddedilen Satırlar", "reddedilenler.csv", "CSV (*.csv)")
+            if path and not ImportService.write_rejected(report, path):
+                QMessageBox.warning(self, "Hata", "Dosya kaydedilemedi.")
+
     def load_api_keys(self):
         """API anahtarlarını yükler."""
         self.controller.get_api_keys(self.on_keys_loaded)
@@ -311,8 +657,11 @@ class SettingsPage(QWidget):
         end_idx = min(start_idx + self.ITEMS_PER_PAGE, total_items)
         
         page_items = self.filtered_types[start_idx:end_idx]
-        for item_text in page_items:
-            self.type_list.addItem(item_text)
+        for name in page_items:
+            # Görünen metin sayıyı da içerir; düzenle/sil için asıl ad UserRole'de
+            item = QListWidgetItem(f"{name}  ({self.type_usage.get(name, 0)} kayıt)")
+            item.setData(Qt.UserRole, name)
+            self.type_list.addItem(item)
         
         # Sayfalama kontrollerini güncelle
         self.page_label.setText(f"{self.current_page + 1}/{total_pages}")
@@ -354,10 +703,11 @@ class SettingsPage(QWidget):
 
     def refresh_types(self):
         """Türleri veritabanından çeker ve listeyi yeniler."""
-        self.controller.get_all_activity_types(self.on_types_loaded)
+        self.controller.get_activity_type_usage(self.on_types_loaded)
 
-    def on_types_loaded(self, types):
-        self.all_types = types if types else []
+    def on_types_loaded(self, usage):
+        self.type_usage = usage if usage else {}
+        self.all_types = list(self.type_usage)
         self.filtered_types = self.all_types.copy()
         self.search_input.clear()
         self.current_page = 0
@@ -385,7 +735,7 @@ class SettingsPage(QWidget):
             QMessageBox.warning(self, "Uyarı", "Lütfen düzenlemek için bir tür seçin.")
             return
             
-        old_name = current_item.text()
+        old_name = current_item.data(Qt.UserRole)
         new_name, ok = QInputDialog.getText(self, "Türü Düzenle", "Yeni Ad:", text=old_name)
         
         if ok and new_name:
@@ -398,10 +748,18 @@ class SettingsPage(QWidget):
                 
             if confirm == QMessageBox.Yes:
                 self.btn_edit.setEnabled(False)
-                self.controller.update_activity_type(old_name, new_name, self.on_edit_finished)
+                self.type_progress.setValue(0)
+                self.type_progress.show()
+                self.controller.update_activity_type(
+                    old_name, new_name, self.on_edit_finished, self.on_type_rename_progress
+                )
+
+    def on_type_rename_progress(self, processed, total):
+        self.type_progress.setValue(min(100, processed * 100 // max(total, 1)))
 
     def on_edit_finished(self, result):
         self.btn_edit.setEnabled(True)
+        self.type_progress.hide()
         success, msg = result
         if success:
             self.refresh_types()
@@ -416,7 +774,7 @@ class SettingsPage(QWidget):
             QMessageBox.warning(self, "Uyarı", "Lütfen silmek için bir tür seçin.")
             return
 
-        name = current_item.text()
+        name = current_item.data(Qt.UserRole)
         confirm = QMessageBox.question(self, "Onay", 
             f"'{name}' türünü listeden silmek istediğinize emin misiniz?\n"
             "Not: Bu türe ait geçmiş kayıtlar silinmez, sadece yeni ekleme listesinden kalkar.",
@@ -8,6 +8,7 @@ from matplotlib.figure import Figure
 
 from views.widgets import MonthYearWidget
 from views.widgets.detail_dialog import DetailDialog
+from utils import apply_stats_change
 
 
 class StatsPage(QWidget):
@@ -17,6 +18,8 @@ class StatsPage(QWidget):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
+        self._stats = None          # {tür: [adet, puan toplamı, puanlı adet]} — deltalar buraya uygulanır
+        self._stats_period = ("", False, True)  # (date_prefix, year_only, ignore_dates)
         self.init_ui()
 
     def init_ui(self):
@@ -232,6 +235,7 @@ class StatsPage(QWidget):
         if window and hasattr(window, 'statusBar') and window.statusBar():
             window.statusBar().showMessage("İstatistikler hesaplanıyor...", 1000)
 
+        self._stats_period = (date_str, year_only, ignore_dates)
         self.controller.get_dashboard_stats(
             self.on_stats_loaded,
             date_str, year_only, ignore_dates
@@ -240,11 +244,27 @@ class StatsPage(QWidget):
     def on_stats_loaded(self, raw_data):
         if raw_data is None:
             return
+        self._stats = {
+            category: [count, (avg_rating or 0) * (rated_count or 0), rated_count or 0]
+            for category, count, avg_rating, rated_count in raw_data
+        }
+        self._render_stats()
+
+    def apply_changes(self, changeset):
+        """Değişiklik günlüğü deltalarını sayaçlara uygular; veritabanına gidilmez."""
+        if changeset.truncated or self._stats is None:
+            self.refresh_statistics()
+            return
+        date_prefix, _, ignore_dates = self._stats_period
+        for change in changeset.changes:
+            apply_stats_change(self._stats, change, date_prefix, ignore_dates)
+        self._render_stats()
 
+    def _render_stats(self):
         processed_dict = {}
-        for category, count, avg_rating in raw_data:
+        for category, (count, rating_sum, rated_count) in self._stats.items():
             clean_cat = category.title() if category else "Diğer"
-            current_avg = avg_rating if avg_rating else 0
+            current_avg = rating_sum / rated_count if rated_count else 0
 
             if clean_cat not in processed_dict:
                 processed_dict[clean_cat] = {"count": 0, "total_score": 0, "scored_items": 0}
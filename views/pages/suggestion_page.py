@@ -394,12 +394,15 @@ class SuggestionPage(QWidget):
         self.btn_show_cached.setEnabled(False)
         self.btn_show_cached.setText("Yükleniyor...")
         
+        # Tüm sayfalar tek sorguyla okunur; kartlar parçalar geldikçe eklenir
+        self._cached_stream_started = False
         self.controller.get_previous_data(
             self.on_cached_data_loaded,
             self.current_category,
             self.current_period,
             self.current_genre,
-            self.is_turkish
+            self.is_turkish,
+            chunk_callback=self.on_cached_chunk_loaded
         )
 
     # =========================================================================
@@ -461,11 +464,7 @@ class SuggestionPage(QWidget):
         # Pratik yöntem: hepsini siliyoruz ve yeniden oluşturuyoruz (performans sorunu olursa optimize edilir)
         self._clear_grid()
         
-        # Ekran genişliğine göre kolon sayısını hesapla
-        available_width = self.scroll.width() - 40 # Scrollbar ve margin payı
-        card_width = 240 # Kart genişliği (220) + boşluk (20)
-        cols = max(1, available_width // card_width)
-        
+        cols = self._grid_columns()
         row, col = 0, 0
         
         for item in data_to_render:
@@ -476,6 +475,21 @@ class SuggestionPage(QWidget):
                 col = 0
                 row += 1
 
+    def _grid_columns(self):
+        """Ekran genişliğine göre kolon sayısını hesaplar."""
+        available_width = self.scroll.width() - 40 # Scrollbar ve margin payı
+        card_width = 240 # Kart genişliği (220) + boşluk (20)
+        return max(1, available_width // card_width)
+
+    def _append_cards(self, items):
+        """Mevcut kartları yeniden oluşturmadan yeni kartları grid'in sonuna ekler."""
+        cols = self._grid_columns()
+        start = len(self.all_results)
+        self.all_results.extend(items)
+        for index, item in enumerate(items, start):
+            row, col = divmod(index, cols)
+            self.grid.addWidget(SuggestionCard(item), row, col)
+
     def resizeEvent(self, event):
         """Pencere boyutu değişince grid'i yeniden düzenle."""
         super().resizeEvent(event)
@@ -507,13 +521,20 @@ class SuggestionPage(QWidget):
         self.btn_load_more.setEnabled(True)
         self.btn_load_more.setText("Daha Fazla Göster")
 
-    def on_cached_data_loaded(self, results):
-        """Cache'den veri yüklenince çağrılır."""
-        if results:
-            self.all_results = results
-            self._render_results(self.all_results)
+    def on_cached_chunk_loaded(self, items):
+        """Cache'den bir parça geldikçe çağrılır; ilk parça mevcut listenin yerini alır."""
+        if not self._cached_stream_started:
+            self._cached_stream_started = True
+            self._clear_grid()
+            self.all_results = []
+        self._append_cards(items)
+        self.update_page_label()
+
+    def on_cached_data_loaded(self, total):
+        """Cache okuması bitince çağrılır (toplam öğe sayısı, hata durumunda None)."""
+        if total:
             # Sayfa sayısını güncelle (yaklaşık)
-            self.current_page = len(results) // 10 or 1
+            self.current_page = total // 10 or 1
         
         self.update_page_label()
         self.btn_show_cached.setEnabled(True)